@@ -0,0 +1,280 @@
+"""
+    Benchmark suite of the search engines.
+
+    Every engine (See bot/engines.py) is run on a fixed set of positions for every turn number, with the bot starting
+    first and with the human starting first. For every engine, first player and turn number, the suite records:
+    - Wall time, the total of the best time out of a few runs of every position
+    - Nodes, the total number of nodes visited
+    - Peak memory, the highest memory allocated while searching any of the positions (tracemalloc)
+    - Search statistics, the nodes per depth, evaluations, cutoffs and table hits (See bot/stats.py)
+
+    Statistics and memory are measured in separate runs, so collecting and tracing do not slow down the timed runs.
+
+    The results are written as JSON, and two result files can be compared to flag every measurement that got worse by
+    more than a threshold, so changes to the engines can be judged objectively.
+
+    Usage:
+    python benchmark.py run --output before.json
+    python benchmark.py run --output after.json --stats
+    python benchmark.py compare before.json after.json --threshold 0.1
+"""
+
+import sys
+import json
+import platform
+import argparse
+import tracemalloc
+import numpy as np
+from time import perf_counter, strftime
+from bot.engines import ENGINES, get_engine
+from bot.stats import SearchStats
+from game.board import HUMAN_STATE, BOT_STATE
+from game.positions import iter_positions
+
+# Default number of positions per turn number
+DEFAULT_POSITIONS = 5
+
+# Default number of timed runs of every position, the best time is kept
+DEFAULT_REPEAT = 3
+
+# Default relative increase of a measurement flagged as a regression
+DEFAULT_THRESHOLD = 0.1
+
+# Measurements compared between result files
+METRICS = ("time", "nodes", "peak_memory")
+
+FIRST_PLAYERS = {"bot": BOT_STATE, "human": HUMAN_STATE}
+
+
+def get_positions(turn_num, first_state, count=DEFAULT_POSITIONS):
+    """
+    Picks a fixed set of positions of a turn number, spread evenly over all the unique positions of the turn.
+
+    :param turn_num: type: int
+    The number of moves on the board
+
+    :param first_state: type: int
+    The state of the player that had the first move, HUMAN_STATE or BOT_STATE
+
+    :param count: type: int
+    Maximum number of positions
+
+    :return: type: list
+    List of boards
+    """
+    # The board is updated in place by the generator, so every position is copied
+    boards = [board.copy() for board in iter_positions(turn_num, first_state, unique=True, include_draws=True)]
+
+    step = max(1, len(boards) // count)
+    return boards[::step][:count]
+
+
+def benchmark_engine(engine, boards, is_maximizing_player, repeat=DEFAULT_REPEAT):
+    """
+    Measures an engine on a set of positions.
+
+    :param engine: type: str
+    Name of the engine
+
+    :param boards: type: list
+    List of boards
+
+    :param is_maximizing_player: type: bool
+    True if it is the bot's turn on the boards
+
+    :param repeat: type: int
+    Number of timed runs of every position, the best time is kept
+
+    :return: type: dict
+    Dictionary containing the total time in seconds, the total nodes, the peak memory in bytes and the search
+    statistics of all the positions
+    """
+    solve = get_engine(engine)
+    total_time = 0
+
+    for board in boards:
+        times = []
+        for _ in range(repeat):
+            start_time = perf_counter()
+            solve(board, is_maximizing_player)
+            times.append(perf_counter() - start_time)
+        total_time += min(times)
+
+    stats = SearchStats()
+    for board in boards:
+        solve(board, is_maximizing_player, stats=stats)
+
+    peak_memory = 0
+    for board in boards:
+        tracemalloc.start()
+        try:
+            solve(board, is_maximizing_player)
+            peak_memory = max(peak_memory, tracemalloc.get_traced_memory()[1])
+        finally:
+            tracemalloc.stop()
+
+    return {'time': total_time, 'nodes': stats.nodes, 'peak_memory': peak_memory, 'stats': stats.to_dict()}
+
+
+def run_benchmarks(engines=tuple(ENGINES), turns=range(9), positions=DEFAULT_POSITIONS, repeat=DEFAULT_REPEAT,
+                   log=None, log_stats=False):
+    """
+    Runs the benchmark suite.
+
+    :param engines: type: tuple
+    Names of the engines to benchmark
+
+    :param turns: type: range
+    Turn numbers of the positions
+
+    :param positions: type: int
+    Maximum number of positions per turn number & first player
+
+    :param repeat: type: int
+    Number of timed runs of every position, the best time is kept
+
+    :param log: type: function
+    Called with a line of progress after every measurement, None to stay quiet
+
+    :param log_stats: type: bool
+    True to also log the search statistics of every measurement
+
+    :return: type: dict
+    The results, with the environment under 'meta' and a list of measurements under 'results'
+    """
+    results = []
+
+    for engine in engines:
+        for first_player, first_state in FIRST_PLAYERS.items():
+            for turn_num in turns:
+                boards = get_positions(turn_num, first_state, positions)
+                if not boards:
+                    continue
+
+                is_maximizing_player = (turn_num % 2 == 0) == (first_state == BOT_STATE)
+                measurement = benchmark_engine(engine, boards, is_maximizing_player, repeat)
+                results.append(dict(engine=engine, first_player=first_player, turn=turn_num, positions=len(boards),
+                                    **measurement))
+
+                if log is not None:
+                    log("{:<28} {:<6} turn {}: {:9.4f}s {:>9} nodes {:>10} bytes".format(
+                        engine, first_player, turn_num, measurement['time'], measurement['nodes'],
+                        measurement['peak_memory']))
+
+                    if log_stats:
+                        for line in SearchStats.from_dict(measurement['stats']).summary().splitlines():
+                            log("    " + line)
+
+    return {
+        'meta': {
+            'created': strftime("%Y-%m-%dT%H:%M:%S"),
+            'python': platform.python_version(),
+            'numpy': np.__version__,
+            'platform': platform.platform(),
+            'positions': positions,
+            'repeat': repeat
+        },
+        'results': results
+    }
+
+
+def get_result_key(result):
+    """
+    Identifies a measurement across result files.
+    """
+    return result['engine'], result['first_player'], result['turn']
+
+
+def compare_results(old, new, threshold=DEFAULT_THRESHOLD):
+    """
+    Compares two benchmark results, measurement by measurement.
+
+    :param old: type: dict
+    The results to compare against
+
+    :param new: type: dict
+    The results being judged
+
+    :param threshold: type: float
+    Relative increase flagged as a regression, 0.1 flags anything more than 10% worse
+
+    :return: type: list
+    List of comparisons of the measurements found in both results, each a dictionary with the engine, first player,
+    turn, metric, old & new value, relative change and whether the change is a regression
+    """
+    old_results = {get_result_key(result): result for result in old['results']}
+    comparisons = []
+
+    for result in new['results']:
+        old_result = old_results.get(get_result_key(result))
+        if old_result is None:
+            continue
+
+        for metric in METRICS:
+            old_value, new_value = old_result[metric], result[metric]
+            if old_value:
+                change = (new_value - old_value) / old_value
+            else:
+                # Any increase from 0 counts as infinitely worse
+                change = float("inf") if new_value else 0.0
+
+            comparisons.append({
+                'engine': result['engine'],
+                'first_player': result['first_player'],
+                'turn': result['turn'],
+                'metric': metric,
+                'old': old_value,
+                'new': new_value,
+                'change': change,
+                'regression': change > threshold
+            })
+
+    return comparisons
+
+
+def main():
+    """
+    The main function of the benchmark suite, parses the command line arguments and runs or compares the benchmarks.
+    Exits with status 1 when a comparison finds a regression.
+    """
+    parser = argparse.ArgumentParser(description="Benchmark suite of the search engines")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = commands.add_parser("run", help="Run the benchmarks and write the results as JSON")
+    run_parser.add_argument("--output", default="benchmark.json", help="Path of the results file")
+    run_parser.add_argument("--engines", nargs="+", default=list(ENGINES), choices=list(ENGINES),
+                            help="Engines to benchmark")
+    run_parser.add_argument("--turns", nargs="+", type=int, default=list(range(9)), help="Turn numbers")
+    run_parser.add_argument("--positions", type=int, default=DEFAULT_POSITIONS, help="Positions per turn number")
+    run_parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT, help="Timed runs of every position")
+    run_parser.add_argument("--stats", action="store_true", help="Print the search statistics of every measurement")
+
+    compare_parser = commands.add_parser("compare", help="Compare two results files and flag regressions")
+    compare_parser.add_argument("old", help="Path of the results to compare against")
+    compare_parser.add_argument("new", help="Path of the results being judged")
+    compare_parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                                help="Relative increase flagged as a regression")
+
+    args = parser.parse_args()
+
+    if args.command == "run":
+        results = run_benchmarks(args.engines, args.turns, args.positions, args.repeat, log=print,
+                                 log_stats=args.stats)
+        with open(args.output, "w") as file:
+            json.dump(results, file, indent=2)
+        print("Results written to {}".format(args.output))
+    else:
+        with open(args.old) as old_file, open(args.new) as new_file:
+            comparisons = compare_results(json.load(old_file), json.load(new_file), args.threshold)
+
+        regressions = [comparison for comparison in comparisons if comparison['regression']]
+        for comparison in regressions:
+            print("REGRESSION {engine} {first_player} turn {turn} {metric}: {old} -> {new} ({change:+.1%})".format(
+                **comparison))
+        print("{} measurements compared, {} regressions".format(len(comparisons), len(regressions)))
+
+        sys.exit(1 if regressions else 0)
+
+
+if __name__ == '__main__':
+    main()
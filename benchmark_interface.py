@@ -0,0 +1,307 @@
+"""
+    Headless rendering benchmark of the pygame app.
+
+    The scenes of run_game.py are run on SDL's dummy video driver, so no window is opened and no person has to click.
+    A scripted player feeds the game with mouse & keyboard events: it hovers over the choices of the selection screen,
+    selects a mark, plays random moves on the free boxes of the board for a number of full games, then presses ESC.
+    The script and the game are seeded, so every run plays the same games.
+
+    The benchmark records:
+    - Frame time, the duration of every frame as percentiles
+    - Step time, the duration of every template, of the renderer and of the input handlers (See profiler.py)
+    - Memory per frame, the bytes allocated (high-water mark) and the bytes still held at the end of every frame
+    - Renderer, the average area of the window updated per frame, and the resource cache hits & misses
+
+    Memory is measured in a separate run with tracemalloc, so tracing does not slow down the timed run. The bot searches
+    on a background thread, so its allocations are traced along with the frame's.
+
+    The results are written as JSON, so runs before & after a change to the interface can be compared.
+
+    Usage:
+    python benchmark_interface.py --games 5 --output interface.json
+    python benchmark_interface.py --games 5 --fps 0 --delay 0 --memory
+"""
+
+import os
+# Headless, must be set before pygame opens the display
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import json
+import random
+import platform
+import argparse
+import tracemalloc
+import pygame
+from time import perf_counter, strftime
+from game.board import BLANK_STATE
+from game_interface.layout import get_screen_layout, get_board_layout
+from game_interface.profiler import FrameProfiler, summarize_values
+from game_interface.resource_cache import RESOURCE_CACHE
+from run_game import Game, width, height, rows, columns
+
+# Default number of full games played
+DEFAULT_GAMES = 5
+
+# Default seed of the script & the game
+DEFAULT_SEED = 0
+
+# Default tick rate, 0 to run the frames as fast as possible
+DEFAULT_FPS = 30
+
+# Default number of milliseconds a finished game is shown
+DEFAULT_DELAY = 500
+
+# Default number of frames the scripted player waits before each action
+DEFAULT_MOVE_FRAMES = 5
+
+# Maximum number of frames of a run, in case the script gets stuck
+MAX_FRAMES = 100000
+
+
+def get_mouse_motion(position):
+    """
+    Creates the event of the mouse moving to a position
+    """
+    return pygame.event.Event(pygame.MOUSEMOTION, pos=position, rel=(0, 0), buttons=(0, 0, 0))
+
+
+def get_mouse_click(position):
+    """
+    Creates the event of the left mouse button being pressed at a position
+    """
+    return pygame.event.Event(pygame.MOUSEBUTTONDOWN, pos=position, button=1)
+
+
+def iter_scripted_events(game, games=DEFAULT_GAMES, move_frames=DEFAULT_MOVE_FRAMES, rng=None):
+    """
+    Streams the events of the scripted player, one list of events per frame. The script reads the state of the game to
+    find whose turn it is and which boxes are free.
+
+    :param game: type: run_game.Game
+    The game being played
+
+    :param games: type: int
+    Number of full games played before pressing ESC
+
+    :param move_frames: type: int
+    Number of frames waited before each action
+
+    :param rng: type: random.Random
+    Random number generator picking the moves, None for an unseeded generator
+
+    :return: type: generator
+    Yields the list of events of every frame
+    """
+    rng = rng if rng is not None else random.Random()
+    screen_width, screen_height = game.screen.get_size()
+    layout = get_screen_layout(screen_width, screen_height)
+
+    # Hover over the choices of the selection screen, then select the X mark
+    for position in ((0, 0), layout.o_sign_center, layout.o_label_center, layout.x_label_center,
+                     layout.x_sign_center):
+        yield [get_mouse_motion(tuple(map(int, position)))]
+        for _ in range(move_frames):
+            yield []
+    yield [get_mouse_click(tuple(map(int, layout.x_sign_center)))]
+
+    waited_frames = 0
+    while sum(game.records[key] for key in ('bot_win', 'human_win', 'draw')) < games:
+        player = game.player
+        if player is not None and not player.bot and game.game_over_time is None:
+            # Human turn
+            waited_frames += 1
+            if waited_frames > move_frames:
+                waited_frames = 0
+                board = game.board
+                box_centers = get_board_layout(screen_width, screen_height, *board.shape).box_centers
+                row, box = rng.choice([(row, box) for row in range(board.shape[0]) for box in range(board.shape[1])
+                                       if board[row][box] == BLANK_STATE])
+
+                yield [get_mouse_click(tuple(map(int, box_centers[row][box])))]
+                continue
+
+        # Bot thinking, finished game being shown or waiting before the next move
+        yield []
+
+    yield [pygame.event.Event(pygame.KEYDOWN, key=pygame.K_ESCAPE)]
+
+
+def play_scripted_games(games=DEFAULT_GAMES, seed=DEFAULT_SEED, fps=DEFAULT_FPS, delay=DEFAULT_DELAY,
+                        move_frames=DEFAULT_MOVE_FRAMES, size=(width, height), trace_memory=False):
+    """
+    Plays the scripted games on a new headless window, with empty caches.
+
+    :param games: type: int
+    Number of full games played
+
+    :param seed: type: int
+    Seed of the script & the game
+
+    :param fps: type: int
+    Tick rate of the frames, 0 to run the frames as fast as possible
+
+    :param delay: type: int
+    Number of milliseconds a finished game is shown
+
+    :param move_frames: type: int
+    Number of frames the scripted player waits before each action
+
+    :param size: type: tuple
+    Width & height of the window
+
+    :param trace_memory: type: bool
+    True to trace the memory allocated during every frame, False to time the frames
+
+    :return: type: dict
+    Dictionary containing the game, the profiler, the memory allocated & held by every frame (empty unless traced),
+    the frame count and the resource cache statistics
+    """
+    # The game picks the first player & the moves of the bot with the random module
+    random.seed(seed)
+    rng = random.Random(seed)
+
+    pygame.init()
+    RESOURCE_CACHE.clear()
+    get_screen_layout.cache_clear()
+    get_board_layout.cache_clear()
+
+    screen = pygame.display.set_mode(size)
+    clock = pygame.time.Clock()
+    profiler = FrameProfiler()
+    game = Game(screen, board_rows=rows, board_columns=columns, delay=delay,
+                profiler=None if trace_memory else profiler)
+
+    allocated, held = [], []
+    frames = 0
+    if trace_memory:
+        tracemalloc.start()
+
+    try:
+        for events in iter_scripted_events(game, games, move_frames, rng):
+            if fps:
+                clock.tick(fps)
+
+            if trace_memory:
+                start_memory = tracemalloc.get_traced_memory()[0]
+                tracemalloc.reset_peak()
+                is_running = game.run_frame(events)
+                current_memory, peak_memory = tracemalloc.get_traced_memory()
+                allocated.append(peak_memory - start_memory)
+                held.append(current_memory - start_memory)
+            else:
+                start_time = perf_counter()
+                is_running = game.run_frame(events)
+                profiler.record("frame", perf_counter() - start_time)
+
+            frames += 1
+            if not is_running or frames >= MAX_FRAMES:
+                break
+    finally:
+        if trace_memory:
+            tracemalloc.stop()
+        cache_stats = RESOURCE_CACHE.get_stats()
+        pygame.quit()
+        RESOURCE_CACHE.clear()
+
+    return {'game': game, 'profiler': profiler, 'allocated': allocated, 'held': held, 'frames': frames,
+            'cache_stats': cache_stats}
+
+
+def run_interface_benchmark(games=DEFAULT_GAMES, seed=DEFAULT_SEED, fps=DEFAULT_FPS, delay=DEFAULT_DELAY,
+                            move_frames=DEFAULT_MOVE_FRAMES, size=(width, height), memory=False, log=None):
+    """
+    Runs the headless rendering benchmark. See play_scripted_games() for the parameters.
+
+    :param memory: type: bool
+    True to also measure the memory per frame in a second, traced run
+
+    :param log: type: function
+    Called with every line of the report, None to stay quiet
+
+    :return: type: dict
+    The results, with the environment under 'meta', the frame & step times in milliseconds, the memory per frame in
+    bytes, the renderer & resource cache statistics and the records of the games
+    """
+    run = play_scripted_games(games, seed, fps, delay, move_frames, size)
+    game, summary = run['game'], run['profiler'].summary()
+
+    results = {
+        'meta': {
+            'created': strftime("%Y-%m-%dT%H:%M:%S"),
+            'python': platform.python_version(),
+            'pygame': pygame.version.ver,
+            'platform': platform.platform(),
+            'games': games,
+            'seed': seed,
+            'fps': fps,
+            'delay': delay,
+            'move_frames': move_frames,
+            'size': list(size)
+        },
+        'frames': summary.pop('frame'),
+        'steps': summary,
+        'renderer': {
+            'frames': game.renderer.frames,
+            'updated_area_per_frame': game.renderer.updated_area / max(1, game.renderer.frames),
+            'window_area': size[0] * size[1]
+        },
+        'resource_cache': run['cache_stats'],
+        'records': dict(game.records)
+    }
+
+    if memory:
+        traced_run = play_scripted_games(games, seed, fps, delay, move_frames, size, trace_memory=True)
+        results['memory'] = {
+            'allocated_bytes': summarize_values(traced_run['allocated']),
+            'held_bytes': summarize_values(traced_run['held'])
+        }
+
+    if log is not None:
+        log("{} frames, {} games: {}".format(results['frames']['count'], games, results['records']))
+        log("{:<28} {:>7} {:>9} {:>9} {:>9} {:>9} {:>9}".format("step (ms)", "count", "mean", "p50", "p95", "p99",
+                                                               "max"))
+        for name, step in [("frame", results['frames'])] + list(results['steps'].items()):
+            log("{:<28} {count:>7} {mean:9.4f} {p50:9.4f} {p95:9.4f} {p99:9.4f} {max:9.4f}".format(name, **step))
+
+        log("Renderer: {:.0f} of {} pixels updated per frame".format(results['renderer']['updated_area_per_frame'],
+                                                                     results['renderer']['window_area']))
+        log("Resource cache: {hits} hits, {misses} misses, {evictions} evictions".format(**results['resource_cache']))
+
+        if memory:
+            for name, values in results['memory'].items():
+                log("{:<28} mean {mean:10.0f} p50 {p50:10.0f} p95 {p95:10.0f} max {max:10.0f}".format(name,
+                                                                                                     **values))
+
+    return results
+
+
+def main():
+    """
+    The main function of the rendering benchmark, parses the command line arguments and runs the benchmark.
+    """
+    parser = argparse.ArgumentParser(description="Headless rendering benchmark of the pygame app")
+    parser.add_argument("--games", type=int, default=DEFAULT_GAMES, help="Number of full games played")
+    parser.add_argument("--seed", type=int, default=DEFAULT_SEED, help="Seed of the script & the game")
+    parser.add_argument("--fps", type=int, default=DEFAULT_FPS, help="Tick rate, 0 to run as fast as possible")
+    parser.add_argument("--delay", type=int, default=DEFAULT_DELAY,
+                        help="Milliseconds a finished game is shown")
+    parser.add_argument("--move-frames", type=int, default=DEFAULT_MOVE_FRAMES,
+                        help="Frames the scripted player waits before each action")
+    parser.add_argument("--width", type=int, default=width, help="Width of the window")
+    parser.add_argument("--height", type=int, default=height, help="Height of the window")
+    parser.add_argument("--memory", action="store_true", help="Also measure the memory per frame in a traced run")
+    parser.add_argument("--output", help="Path of the JSON results file")
+
+    args = parser.parse_args()
+
+    results = run_interface_benchmark(args.games, args.seed, args.fps, args.delay, args.move_frames,
+                                      (args.width, args.height), args.memory, log=print)
+    if args.output:
+        with open(args.output, "w") as file:
+            json.dump(results, file, indent=2)
+        print("Results written to {}".format(args.output))
+
+
+if __name__ == '__main__':
+    main()
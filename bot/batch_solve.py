@@ -0,0 +1,178 @@
+"""
+    Batch solver, finds the best moves of many positions at once on a process pool.
+
+    The positions are split into chunks and every chunk is solved by a worker process. To keep the traffic between the
+    processes small, boards are sent as compact bytes (one byte per box) and moves are sent back as flat box indexes,
+    instead of pickling numpy arrays and lists of tuples.
+
+    Results are returned in the same order as the positions given, or streamed as soon as each chunk is solved.
+"""
+
+import os
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from game.board import COMPACT_DTYPE
+from bot.engines import DEFAULT_ENGINE, get_engine
+
+# Number of chunks given to every worker, more chunks balance the load better but cost more messages
+CHUNKS_PER_WORKER = 4
+
+
+def encode_positions(boards, is_maximizing_player):
+    """
+    Encodes the positions into compact chunks of bytes.
+
+    :param boards: type: list
+    List of boards (numpy.ndarray), all of the same shape
+
+    :param is_maximizing_player: type: bool or list
+    True if it is the bot's turn for every board, False if it is the human's turn for every board, or a list with the
+    turn of every board
+
+    :return: type: tuple
+    Contains the shape of the boards and a list of (board bytes, is_maximizing_player) pairs
+    """
+    if isinstance(is_maximizing_player, (bool, np.bool_)):
+        is_maximizing_player = [bool(is_maximizing_player)] * len(boards)
+    elif len(is_maximizing_player) != len(boards):
+        raise ValueError("Number of turns must be the same as the number of boards")
+
+    shape = boards[0].shape if len(boards) else (3, 3)
+    positions = []
+
+    for board, turn in zip(boards, is_maximizing_player):
+        if board.shape != shape:
+            raise ValueError("All boards must be of the same shape")
+        positions.append((board.astype(COMPACT_DTYPE).tobytes(), bool(turn)))
+
+    return tuple(shape), positions
+
+
+def solve_chunk(positions, shape, engine, win_length):
+    """
+    Solves a chunk of positions, runs inside the worker processes.
+
+    :param positions: type: list
+    List of (board bytes, is_maximizing_player) pairs
+
+    :param shape: type: tuple
+    The number of rows & columns of the boards
+
+    :param engine: type: str or function
+    Name of the engine or a module level engine function (See bot/engines.py)
+
+    :param win_length: type: int
+    Number of marks in a row required to win, defaults to the length of the shorter side of the board
+
+    :return: type: list
+    List of (score, move indexes) pairs, move indexes are flat box indexes or None for a finished board
+    """
+    engine = get_engine(engine)
+    columns = shape[1]
+    results = []
+
+    for board_bytes, is_maximizing_player in positions:
+        # Searches make moves on the board itself, so the board must be writable
+        board = np.frombuffer(board_bytes, dtype=COMPACT_DTYPE).reshape(shape).astype(int)
+        score, moves = engine(board, is_maximizing_player, win_length)
+
+        results.append((score, tuple(row * columns + box for row, box in moves) if moves is not None else None))
+
+    return results
+
+
+def decode_result(result, columns):
+    """
+    Decodes a result sent back by a worker.
+
+    :param result: type: tuple
+    Pair of score & flat move indexes
+
+    :param columns: type: int
+    Number of columns of the boards
+
+    :return: type: tuple
+    Contains the best minimax score and a list of moves that is derived from that score (None for a finished board)
+    """
+    score, indexes = result
+
+    return score, [divmod(index, columns) for index in indexes] if indexes is not None else None
+
+
+def iter_solve_many(boards, is_maximizing_player, engine=DEFAULT_ENGINE, workers=None, chunk_size=None,
+                    win_length=None):
+    """
+    Solves many positions on a process pool, streaming the results as soon as each chunk is solved.
+    Results arrive in the order they are solved, not in the order of the boards.
+
+    :param boards: type: list
+    List of boards (numpy.ndarray), all of the same shape
+
+    :param is_maximizing_player: type: bool or list
+    True if it is the bot's turn for every board, False if it is the human's turn for every board, or a list with the
+    turn of every board
+
+    :param engine: type: str or function
+    Name of the engine or a module level engine function (See bot/engines.py)
+
+    :param workers: type: int
+    Number of worker processes, defaults to the number of processors
+    0 or 1 solves the positions in the current process
+
+    :param chunk_size: type: int
+    Number of positions sent to a worker at once, defaults to spreading the boards over CHUNKS_PER_WORKER chunks per
+    worker
+
+    :param win_length: type: int
+    Number of marks in a row required to win, defaults to the length of the shorter side of the board
+
+    :return: type: generator
+    Yields the index of the board with its result, the best minimax score and a list of moves that is derived from
+    that score
+    """
+    # Check for valid engine before starting any process
+    get_engine(engine)
+
+    shape, positions = encode_positions(boards, is_maximizing_player)
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if chunk_size is None:
+        chunk_size = max(1, -(-len(positions) // (max(workers, 1) * CHUNKS_PER_WORKER)))
+
+    chunk_starts = range(0, len(positions), chunk_size)
+
+    if workers <= 1:
+        for start in chunk_starts:
+            for index, result in enumerate(solve_chunk(positions[start:start + chunk_size], shape, engine, win_length),
+                                           start=start):
+                yield index, decode_result(result, shape[1])
+        return
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = {executor.submit(solve_chunk, positions[start:start + chunk_size], shape, engine, win_length): start
+                   for start in chunk_starts}
+
+        try:
+            for future in as_completed(futures):
+                for index, result in enumerate(future.result(), start=futures[future]):
+                    yield index, decode_result(result, shape[1])
+        finally:
+            # Drop the chunks not started yet when the caller stops early
+            for future in futures:
+                future.cancel()
+
+
+def solve_many(boards, is_maximizing_player, engine=DEFAULT_ENGINE, workers=None, chunk_size=None, win_length=None):
+    """
+    Solves many positions on a process pool. See iter_solve_many() for the parameters.
+
+    :return: type: list
+    List of results in the same order as the boards, each result contains the best minimax score and a list of moves
+    that is derived from that score
+    """
+    results = [None] * len(boards)
+
+    for index, result in iter_solve_many(boards, is_maximizing_player, engine, workers, chunk_size, win_length):
+        results[index] = result
+
+    return results
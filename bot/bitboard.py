@@ -0,0 +1,515 @@
+"""
+    Bitboard version of the minimax algorithm.
+
+    Instead of walking a numpy array box by box, a position is represented by two integers, one for each player.
+    Bit n of an integer is set when the player occupies box n of the board, where
+    n = <row_index> * <number of columns> + <column_index>.
+    A 3 by 3 board only needs 9 bits per player, but Python integers have no size limit, so any board size works.
+
+    The winning combinations are precomputed as bit masks, so checking for a win is a matter of testing the masks
+    against a player's integer. A move is made by setting a single bit, meaning no copies of the board are ever created
+    while searching the decision tree.
+
+    Boards that are too large to be solved can be searched with a depth limit, positions at the depth limit are scored
+    by estimate() instead. A node or time budget can be given as well, to bound how long a single move takes.
+
+    The numpy array board is only used at the edge of the API, the search itself works purely on integers.
+"""
+
+from math import inf
+from time import perf_counter
+from functools import lru_cache
+from collections import namedtuple
+from game.board import BOT_STATE, HUMAN_STATE, get_winning_lines, get_win_length
+
+Geometry = namedtuple("Geometry", ["rows", "columns", "win_length", "size", "box_bits", "win_masks", "box_win_masks"])
+
+
+@lru_cache(maxsize=None)
+def get_geometry(rows=3, columns=3, win_length=3):
+    """
+    Precomputes the bit of every box and the bit mask of every winning combination of a board.
+
+    :param rows: type: int
+    Number of rows of the board
+
+    :param columns: type: int
+    Number of columns of the board
+
+    :param win_length: type: int
+    Number of marks in a row required to win
+
+    :return: type: Geometry
+    Contains the board dimensions, the bit of every box indexed by <row_index> * columns + <column_index>, the bit
+    masks of all the winning combinations and the bit masks of the winning combinations through every box
+    """
+    box_bits = tuple(1 << index for index in range(rows * columns))
+    win_masks = tuple(sum(box_bits[row * columns + box] for row, box in line)
+                      for line in get_winning_lines(rows, columns, win_length))
+    box_win_masks = tuple(tuple(mask for mask in win_masks if mask & bit) for bit in box_bits)
+
+    return Geometry(rows, columns, win_length, rows * columns, box_bits, win_masks, box_win_masks)
+
+
+def get_board_geometry(board, win_length=None):
+    """
+    Finds the geometry of the numpy array board.
+
+    :param board: type: numpy.ndarray
+    The current state of the Tic Tac Toe board game
+
+    :param win_length: type: int
+    Number of marks in a row required to win, defaults to the length of the shorter side of the board
+
+    :return: type: Geometry
+    The geometry of the board
+    """
+    return get_geometry(*board.shape, get_win_length(board, win_length))
+
+
+# Geometry of the standard 3 by 3 board
+GEOMETRY = get_geometry(3, 3, 3)
+
+# Bit of every box on the 3 by 3 board, indexed by <row_index> * 3 + <column_index>
+BOX_BITS = GEOMETRY.box_bits
+
+# Bit mask of all the winning combinations on the 3 by 3 board (rows, columns & diagonals)
+WIN_MASKS = GEOMETRY.win_masks
+
+
+class SearchBudgetExceeded(Exception):
+    """
+    Raised inside the search when the node or time budget runs out
+    """
+
+
+def encode_board(board):
+    """
+    Converts the numpy array board into a pair of bitboards, one for each player.
+
+    :param board: type: numpy.ndarray
+    The current state of the Tic Tac Toe board game
+
+    :return: type: tuple
+    Contains the bitboard of the bot followed by the bitboard of the human
+    """
+    bot_bits, human_bits = 0, 0
+
+    # Loop board
+    for index, box in enumerate(board.flat):
+        if box == BOT_STATE:
+            bot_bits |= 1 << index
+        elif box == HUMAN_STATE:
+            human_bits |= 1 << index
+
+    return bot_bits, human_bits
+
+
+def is_win(bits, win_masks=WIN_MASKS):
+    """
+    Checks the bitboard of a single player for any winning combinations.
+
+    :param bits: type: int
+    The bitboard of the player
+
+    :param win_masks: type: tuple
+    The bit masks of the winning combinations, defaults to the 3 by 3 board
+
+    :return: type: bool
+    True if winning combination is found, else False
+    """
+    for mask in win_masks:
+        if bits & mask == mask:
+            return True
+
+    return False
+
+
+def evaluate(bot_bits, human_bits, depth, geometry=GEOMETRY):
+    """
+    Gives a minimax score for the state of the bitboards. Scoring rules are the same as heuristic_evaluation() in
+    minimax.py
+
+    :param bot_bits: type: int
+    The bitboard of the bot
+
+    :param human_bits: type: int
+    The bitboard of the human
+
+    :param depth: type: int
+    The depth of the node in the decision tree
+
+    :param geometry: type: Geometry
+    The geometry of the board, defaults to the 3 by 3 board
+
+    :return: type: int
+    The minimax score of the bitboards
+    """
+    if is_win(human_bits, geometry.win_masks):
+        return -(geometry.size + 1) + depth
+    elif is_win(bot_bits, geometry.win_masks):
+        return +(geometry.size + 1) - depth
+
+    # No winner/draw
+    return 0
+
+
+def estimate(bot_bits, human_bits, geometry=GEOMETRY):
+    """
+    Gives a score for a position that is not finished, used when the search stops at the depth limit.
+
+    Every winning combination that is still open to only one of the players counts in the favour of that player,
+    weighted by the square of the number of marks the player already has in it.
+    The score is always between -1 and 1, so any win or loss found by the search outweighs it.
+
+    :param bot_bits: type: int
+    The bitboard of the bot
+
+    :param human_bits: type: int
+    The bitboard of the human
+
+    :param geometry: type: Geometry
+    The geometry of the board, defaults to the 3 by 3 board
+
+    :return: type: float
+    The estimated score of the bitboards
+    """
+    score = 0
+
+    for mask in geometry.win_masks:
+        bot_count = bin(bot_bits & mask).count("1")
+        human_count = bin(human_bits & mask).count("1")
+
+        if not human_count:
+            score += bot_count * bot_count
+        elif not bot_count:
+            score -= human_count * human_count
+
+    return score / (len(geometry.win_masks) * geometry.win_length ** 2 + 1)
+
+
+class BitboardSearch:
+    """
+    Bitboard search class
+
+    Holds the board geometry and the limits of a single search, and counts the nodes searched.
+    """
+    def __init__(self, geometry=GEOMETRY, max_depth=None, node_budget=None, time_budget=None, stats=None):
+        """
+        Constructor for BitboardSearch class.
+
+        :param geometry: type: Geometry
+        The geometry of the board, defaults to the 3 by 3 board
+
+        :param max_depth: type: int
+        Maximum number of moves to search ahead, None to search until the end of the game
+
+        :param node_budget: type: int
+        Maximum number of nodes to search, None for no limit
+
+        :param time_budget: type: float
+        Maximum number of seconds to search, None for no limit
+
+        :param stats: type: bot.stats.SearchStats
+        Optional collector of the search statistics, None to not collect any
+        """
+        self._geometry = geometry
+        self._max_depth = None
+        self.max_depth = max_depth
+        self._node_budget = node_budget
+        # The clock of the time budget starts when the search is created
+        self._deadline = perf_counter() + time_budget if time_budget is not None else None
+        self._horizon = None
+        self._horizon_reached = False
+        self._budget_exceeded = False
+        self._nodes = 0
+        self._stats = stats
+
+    # Getter & setter methods
+    @property
+    def geometry(self):
+        return self._geometry
+
+    @property
+    def max_depth(self):
+        return self._max_depth
+
+    @max_depth.setter
+    def max_depth(self, val):
+        if val is not None and val < 1:
+            raise ValueError("Maximum depth must be at least 1")
+
+        self._max_depth = val
+
+    @property
+    def nodes(self):
+        return self._nodes
+
+    @property
+    def stats(self):
+        return self._stats
+
+    @property
+    def horizon_reached(self):
+        return self._horizon_reached
+
+    @property
+    def budget_exceeded(self):
+        return self._budget_exceeded
+
+    def search(self, bot_bits, human_bits, depth, is_maximizing_player, alpha, beta, last_index=None):
+        """
+        Alpha beta search on the bitboards. Returns only the score of the node, the moves are tracked by the caller.
+
+        The returned score is exact when it lies strictly between alpha and beta, otherwise it is only a bound.
+        Raises SearchBudgetExceeded when the node or time budget runs out.
+
+        Only the player who made the last move can have won, with a winning combination through the last move, so only
+        those masks are tested.
+
+        :param bot_bits: type: int
+        The bitboard of the bot
+
+        :param human_bits: type: int
+        The bitboard of the human
+
+        :param depth: type: int
+        How deep the decision tree to search
+        The depth at the top of the tree is 0, as you go deeper, depth increases
+        Maximum depth is the number of boxes on the board, 9 on a 3 by 3 board
+
+        :param is_maximizing_player: type: bool
+        True if maximizing player's turn (Bot)
+        False if minimizing player's turn (Human)
+
+        :param alpha: type: float
+        The best score the maximizing player is assured of
+
+        :param beta: type: float
+        The best score the minimizing player is assured of
+
+        :param last_index: type: int
+        The box index of the last move made, None to test both players against every mask
+
+        :return: type: float
+        The minimax score of the node
+        """
+        geometry = self._geometry
+
+        # Check budget, the clock is only read every 1024 nodes
+        self._nodes += 1
+        if (self._node_budget is not None and self._nodes > self._node_budget) or \
+                (self._deadline is not None and not self._nodes & 1023 and perf_counter() > self._deadline):
+            self._budget_exceeded = True
+            raise SearchBudgetExceeded()
+
+        stats = self._stats
+        if stats is not None:
+            stats.record_node(depth)
+
+        # Check if leaf node
+        score = None
+        if last_index is None:
+            if is_win(human_bits, geometry.win_masks):
+                score = -(geometry.size + 1) + depth
+            elif is_win(bot_bits, geometry.win_masks):
+                score = +(geometry.size + 1) - depth
+        elif is_maximizing_player:
+            # Human made the last move
+            if is_win(human_bits, geometry.box_win_masks[last_index]):
+                score = -(geometry.size + 1) + depth
+        elif is_win(bot_bits, geometry.box_win_masks[last_index]):
+            score = +(geometry.size + 1) - depth
+
+        if score is None:
+            if depth == geometry.size:
+                score = 0
+            elif depth == self._horizon:
+                self._horizon_reached = True
+                score = estimate(bot_bits, human_bits, geometry)
+
+        if score is not None:
+            if stats is not None:
+                stats.record_evaluation()
+            return score
+
+        occupied = bot_bits | human_bits
+
+        if is_maximizing_player:
+            max_score = -inf
+
+            # Loop possible moves in a single turn
+            for index, bit in enumerate(geometry.box_bits):
+                if not occupied & bit:
+                    score = self.search(bot_bits | bit, human_bits, depth + 1, False, alpha, beta, index)
+
+                    if score > max_score:
+                        max_score = score
+
+                    # Alpha beta pruning
+                    alpha = max(alpha, score)
+                    if beta <= alpha:
+                        if stats is not None:
+                            # Boxes before this box are the moves searched before it
+                            stats.record_cutoff(depth, bin(~occupied & (bit - 1)).count("1"))
+                        break
+
+            return max_score
+        else:
+            min_score = +inf
+
+            # Loop possible moves in a single turn
+            for index, bit in enumerate(geometry.box_bits):
+                if not occupied & bit:
+                    score = self.search(bot_bits, human_bits | bit, depth + 1, True, alpha, beta, index)
+
+                    if score < min_score:
+                        min_score = score
+
+                    # Alpha beta pruning
+                    beta = min(beta, score)
+                    if beta <= alpha:
+                        if stats is not None:
+                            # Boxes before this box are the moves searched before it
+                            stats.record_cutoff(depth, bin(~occupied & (bit - 1)).count("1"))
+                        break
+
+            return min_score
+
+    def search_subtree(self, bot_bits, human_bits, depth, is_maximizing_player, alpha, beta, last_index=None):
+        """
+        Searches a node below the top of the tree, for callers that search the top of the tree themselves such as the
+        parallel search. The depth limit (max_depth) counts from this node. See search() for the parameters.
+
+        :return: type: float
+        The minimax score of the node
+        """
+        self._horizon = depth + self._max_depth if self._max_depth is not None else None
+
+        return self.search(bot_bits, human_bits, depth, is_maximizing_player, alpha, beta, last_index)
+
+    def search_root(self, board, depth, is_maximizing_player, first_moves=None, allow_partial=True):
+        """
+        Finds the optimal moves for the current state of the game.
+
+        Every move at the top of the tree is searched with a window just wide enough to tell whether it ties or beats
+        the best score found so far. This way all of the optimal moves are returned, the same as minimax() in
+        minimax.py
+
+        When the budget runs out, the best moves out of the moves that were fully searched are returned. If not even
+        one move was fully searched, every possible move is returned with the estimated score of the board.
+
+        :param board: type: numpy.ndarray
+        The current state of the Tic Tac Toe board game
+
+        :param depth: type: int
+        How deep the decision tree to search
+        The depth at the top of the tree is 0, as you go deeper, depth increases
+        Maximum depth is the number of boxes on the board, 9 on a 3 by 3 board
+
+        :param is_maximizing_player: type: bool
+        True if maximizing player's turn (Bot)
+        False if minimizing player's turn (Human)
+
+        :param first_moves: type: list
+        Moves to search before the other moves, such as the best moves of a previous search
+
+        :param allow_partial: type: bool
+        True to return the partial result when the budget runs out, False to raise SearchBudgetExceeded instead
+        Defaults to True
+
+        :return: type: tuple
+        Contains the best minimax score and a list of moves that is derived from that score
+        """
+        geometry = self._geometry
+        bot_bits, human_bits = encode_board(board)
+
+        if self._stats is not None:
+            self._stats.record_node(depth)
+
+        # Check if last node
+        if is_win(bot_bits, geometry.win_masks) or is_win(human_bits, geometry.win_masks) or depth == geometry.size:
+            if self._stats is not None:
+                self._stats.record_evaluation()
+            return evaluate(bot_bits, human_bits, depth, geometry), None
+
+        # Set depth limit relative to the top of the tree
+        self._horizon = depth + self._max_depth if self._max_depth is not None else None
+        self._horizon_reached = False
+
+        occupied = bot_bits | human_bits
+        possible_moves = [index for index, bit in enumerate(geometry.box_bits) if not occupied & bit]
+        if first_moves:
+            # Search given moves first
+            first_indexes = [row * geometry.columns + box for row, box in first_moves]
+            possible_moves = first_indexes + [index for index in possible_moves if index not in first_indexes]
+
+        best_score = -inf if is_maximizing_player else +inf
+        best_moves = []
+
+        try:
+            # Loop possible moves in a single turn
+            for index in possible_moves:
+                bit = geometry.box_bits[index]
+                if is_maximizing_player:
+                    # Only scores greater than best_score - 1 are exact, which is enough to detect a tie
+                    score = self.search(bot_bits | bit, human_bits, depth + 1, False, best_score - 1, +inf, index)
+                else:
+                    # Only scores smaller than best_score + 1 are exact, which is enough to detect a tie
+                    score = self.search(bot_bits, human_bits | bit, depth + 1, True, -inf, best_score + 1, index)
+
+                if score == best_score:
+                    best_moves.append(divmod(index, geometry.columns))
+                elif (score > best_score) == is_maximizing_player:
+                    best_score = score
+                    best_moves = [divmod(index, geometry.columns)]
+        except SearchBudgetExceeded:
+            if not allow_partial:
+                raise
+            elif not best_moves:
+                # Nothing was fully searched, any move will do
+                return estimate(bot_bits, human_bits, geometry), \
+                    sorted(divmod(index, geometry.columns) for index in possible_moves)
+
+        return best_score, sorted(best_moves)
+
+
+def bitboard_minimax(board, depth, is_maximizing_player, win_length=None, max_depth=None, node_budget=None,
+                     time_budget=None, stats=None):
+    """
+    Using the bitboard search to find the optimal moves for the current state of the game.
+
+    :param board: type: numpy.ndarray
+    The current state of the Tic Tac Toe board game
+
+    :param depth: type: int
+    How deep the decision tree to search
+    The depth at the top of the tree is 0, as you go deeper, depth increases
+    Maximum depth is the number of boxes on the board, 9 on a 3 by 3 board
+
+    :param is_maximizing_player: type: bool
+    True if maximizing player's turn (Bot)
+    False if minimizing player's turn (Human)
+
+    :param win_length: type: int
+    Number of marks in a row required to win, defaults to the length of the shorter side of the board
+
+    :param max_depth: type: int
+    Maximum number of moves to search ahead, None to search until the end of the game
+
+    :param node_budget: type: int
+    Maximum number of nodes to search, None for no limit
+
+    :param time_budget: type: float
+    Maximum number of seconds to search, None for no limit
+
+    :param stats: type: bot.stats.SearchStats
+    Optional collector of the search statistics, None to not collect any
+
+    :return: type: tuple
+    Contains the best minimax score and a list of moves that is derived from that score
+    """
+    bitboard_search = BitboardSearch(get_board_geometry(board, win_length), max_depth, node_budget, time_budget,
+                                     stats)
+
+    return bitboard_search.search_root(board, depth, is_maximizing_player)
@@ -0,0 +1,139 @@
+"""
+    Registry of the search engines of the bot.
+
+    Every engine takes the same arguments and returns the same result, so engines can be swapped by name wherever the
+    bot needs a move, such as the batch solver or the benchmarks. The engines are module level functions, which keeps
+    them picklable for process pools.
+
+    An engine is called as engine(board, is_maximizing_player, win_length=None, stats=None) and returns a tuple
+    containing the best minimax score and a list of moves that is derived from that score (None for a finished board).
+    The optional stats collector (See bot/stats.py) is filled with the statistics of the search, engines that do not
+    search leave it untouched.
+"""
+
+from math import inf
+from bot.minimax import minimax, minimax_soft_alpha_beta, minimax_alpha_beta, principal_variation_search, get_depth
+from bot.bitboard import bitboard_minimax
+from bot.move_table import lookup_move_table
+from bot.move_ordering import MoveOrderer
+from bot.mcts import MonteCarloTreeSearch
+from game.board import get_possible_moves, win_check, is_board_full
+
+# Default engine, the fastest engine that returns all of the best moves of any board
+DEFAULT_ENGINE = "bitboard"
+
+
+def solve_minimax(board, is_maximizing_player, win_length=None, stats=None):
+    """
+    Pure minimax, returns all of the best moves
+    """
+    return minimax(board, get_depth(board), is_maximizing_player, win_length, stats)
+
+
+def solve_soft_alpha_beta(board, is_maximizing_player, win_length=None, stats=None):
+    """
+    Minimax with soft alpha beta pruning, returns all of the best moves
+    """
+    return minimax_soft_alpha_beta(board, get_depth(board), is_maximizing_player, -inf, +inf, None, win_length,
+                                   stats=stats)
+
+
+def solve_alpha_beta(board, is_maximizing_player, win_length=None, stats=None):
+    """
+    Minimax with alpha beta pruning, returns a single best move
+    """
+    return minimax_alpha_beta(board, get_depth(board), is_maximizing_player, -inf, +inf, None, win_length,
+                              MoveOrderer(board.shape, win_length), stats)
+
+
+def solve_principal_variation_search(board, is_maximizing_player, win_length=None, stats=None):
+    """
+    Negamax with principal variation search, returns a single best move
+    """
+    return principal_variation_search(board, get_depth(board), is_maximizing_player, -inf, +inf, None, win_length,
+                                      MoveOrderer(board.shape, win_length), stats)
+
+
+def solve_bitboard(board, is_maximizing_player, win_length=None, stats=None):
+    """
+    Bitboard minimax, returns all of the best moves
+    """
+    return bitboard_minimax(board, get_depth(board), is_maximizing_player, win_length, stats=stats)
+
+
+def solve_move_table(board, is_maximizing_player, win_length=None, stats=None):
+    """
+    Move table lookup, returns all of the best moves
+    Falls back on the bitboard minimax for positions that are not in the table
+    """
+    result = None
+    if win_length is None or win_length == 3:
+        result = lookup_move_table(board, is_maximizing_player)
+
+    if result is None:
+        return solve_bitboard(board, is_maximizing_player, win_length, stats)
+
+    return result
+
+
+# Engines by name
+ENGINES = {
+    "minimax": solve_minimax,
+    "soft_alpha_beta": solve_soft_alpha_beta,
+    "alpha_beta": solve_alpha_beta,
+    "principal_variation_search": solve_principal_variation_search,
+    "bitboard": solve_bitboard,
+    "move_table": solve_move_table
+}
+
+
+def solve_random(board, is_maximizing_player, win_length=None, stats=None):
+    """
+    Random player, returns every possible move as a best move and no score
+    Used as a weak opponent by the self play simulator, so it is not one of the search ENGINES
+    """
+    if win_check(board, win_length) or is_board_full(board):
+        return None, None
+
+    return None, get_possible_moves(board)
+
+
+def solve_mcts(board, is_maximizing_player, win_length=None, stats=None):
+    """
+    Monte Carlo tree search with the default number of playouts, returns a single move that is likely a best move
+    Does not search the whole tree, so it is not one of the search ENGINES, but works on boards of any size
+    A Player given this engine by name keeps the tree between its moves instead (See game/player.py)
+    """
+    return MonteCarloTreeSearch()(board, is_maximizing_player, win_length, stats)
+
+
+# Engines that can play a game, including the engines that do not search the whole tree
+PLAYER_ENGINES = dict(ENGINES, random=solve_random, mcts=solve_mcts)
+
+# Engines that return all of the best moves, instead of a single best move
+ALL_MOVES_ENGINES = ("minimax", "soft_alpha_beta", "bitboard", "move_table")
+
+# Engines that stay within the time budget of a player, the other engines always search the whole tree
+TIME_BUDGET_ENGINES = ("random", "mcts")
+
+# Engines that stay within the depth limit of a player
+MAX_DEPTH_ENGINES = ("random",)
+
+
+def get_engine(engine=DEFAULT_ENGINE):
+    """
+    Finds the engine function.
+
+    :param engine: type: str or function
+    Name of the engine in PLAYER_ENGINES, or an engine function which is returned as is
+
+    :return: type: function
+    The engine function
+    """
+    if callable(engine):
+        return engine
+
+    try:
+        return PLAYER_ENGINES[engine]
+    except KeyError:
+        raise ValueError("Unknown engine {}, must be one of {}".format(engine, ", ".join(PLAYER_ENGINES))) from None
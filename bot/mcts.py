@@ -0,0 +1,447 @@
+"""
+    Monte Carlo tree search (MCTS) with the UCT selection rule.
+
+    Instead of searching every move to the end of the game, the search plays many random games (playouts) and grows a
+    tree of the positions it visits most. Every playout:
+    - Selects a path down the tree, picking at every node the move with the best upper confidence bound (UCT), which
+      balances the moves that scored well so far against the moves that were rarely tried
+    - Expands the node at the end of the path with a child for every possible move
+    - Plays a random game from a new child until the game is finished
+    - Backs the result up the path, every node counting its visits and the total result for the player who moved into it
+
+    The move visited most at the top of the tree is played. The cost of a move only depends on the number of playouts,
+    not on the size of the decision tree, so the search works on boards far too large to be solved.
+
+    The tree is kept in flat arrays, one entry per node in every array, rather than one Python object per node. The
+    children of a node are stored next to each other, so a node only needs the index of its first child and the number
+    of children. Positions are bitboards (See bot/bitboard.py) and are never stored in the tree, they are rebuilt by
+    playing the moves along the path.
+
+    The tree survives between searches: when the next search starts from a position a move or two below the top of the
+    tree, such as after the opponent's reply, that part of the tree is kept and the search carries on from it. The kept
+    part is copied into new arrays and the rest of the tree is thrown away, so the tree only holds positions that can
+    still be reached and is kept for the whole game.
+"""
+
+import random
+from array import array
+from math import log, sqrt
+from time import perf_counter
+from bot.bitboard import encode_board, get_board_geometry, is_win
+
+# Default number of playouts per search, when no time budget is given
+DEFAULT_PLAYOUTS = 10000
+
+# Default maximum number of nodes kept in the tree, the tree stops growing once full
+DEFAULT_MAX_NODES = 1000000
+
+# Exploration constant of the UCT rule, higher values try rarely visited moves more often
+EXPLORATION = sqrt(2)
+
+# Result of a node that is not a finished game
+NOT_FINISHED = 2
+
+
+class MonteCarloTreeSearch:
+    """
+    Monte Carlo tree search class
+
+    Holds the tree between searches. An instance is an engine (See bot/engines.py), so it can be given to a Player
+    as its engine to keep the tree between the moves of a game.
+    """
+    def __init__(self, playouts=None, time_budget=None, max_nodes=DEFAULT_MAX_NODES, exploration=EXPLORATION,
+                 seed=None):
+        """
+        Constructor for MonteCarloTreeSearch class.
+
+        :param playouts: type: int
+        Number of playouts per search, defaults to DEFAULT_PLAYOUTS when there is no time budget either
+
+        :param time_budget: type: float
+        Maximum number of seconds per search, None for no limit
+        With both a playout & time budget, the search stops at whichever runs out first
+
+        :param max_nodes: type: int
+        Maximum number of nodes kept in the tree
+
+        :param exploration: type: float
+        Exploration constant of the UCT rule
+
+        :param seed: type: int
+        Seed of the random playouts, None for different playouts every time
+        """
+        if playouts is None and time_budget is None:
+            playouts = DEFAULT_PLAYOUTS
+        if playouts is not None and playouts < 1:
+            raise ValueError("Number of playouts must be at least 1")
+        if max_nodes < 1:
+            raise ValueError("Maximum number of nodes must be at least 1")
+
+        self._playouts = playouts
+        self._time_budget = time_budget
+        self._max_nodes = max_nodes
+        self._exploration = exploration
+        self._random = random.Random(seed)
+
+        self._geometry = None
+        self._root = None
+        self._root_bits = None
+        self._root_is_maximizing_player = None
+        self.clear()
+
+        self._last_playouts = 0
+        self._last_elapsed = 0.0
+
+    # Getter & setter methods
+    @property
+    def nodes(self):
+        return len(self._visits)
+
+    @property
+    def root_visits(self):
+        return self._visits[self._root] if self._root is not None else 0
+
+    @property
+    def last_playouts(self):
+        return self._last_playouts
+
+    @property
+    def last_elapsed(self):
+        return self._last_elapsed
+
+    @property
+    def playouts_per_second(self):
+        return self._last_playouts / self._last_elapsed if self._last_elapsed else 0.0
+
+    def clear(self):
+        """
+        Throws the whole tree away.
+        """
+        # Box index of the move into the node, -1 for the top of the tree
+        self._moves = array("h")
+        # Index of the first child of the node, -1 while the node is not expanded
+        self._first_children = array("l")
+        # Number of children of the node
+        self._child_counts = array("h")
+        # Number of playouts through the node
+        self._visits = array("l")
+        # Total result of the playouts through the node, for the player who moved into the node
+        self._rewards = array("d")
+        # Result of the game if the node is a finished game (+1 bot wins, -1 human wins, 0 draw), else NOT_FINISHED
+        self._results = array("b")
+
+        self._root = None
+
+    def add_node(self, move, result):
+        """
+        Appends a node to the arrays.
+
+        :param move: type: int
+        Box index of the move into the node
+
+        :param result: type: int
+        Result of the game if the node is a finished game, else NOT_FINISHED
+
+        :return: type: int
+        Index of the new node
+        """
+        self._moves.append(move)
+        self._first_children.append(-1)
+        self._child_counts.append(0)
+        self._visits.append(0)
+        self._rewards.append(0.0)
+        self._results.append(result)
+
+        return len(self._moves) - 1
+
+    def expand(self, node, bot_bits, human_bits, is_maximizing_player):
+        """
+        Adds a child for every possible move of a node, in random order so ties between unvisited moves are broken at
+        random.
+
+        :return: type: bool
+        True if the node was expanded, False if the tree is full
+        """
+        geometry = self._geometry
+        occupied = bot_bits | human_bits
+        moves = [index for index in range(geometry.size) if not occupied >> index & 1]
+
+        if len(self._moves) + len(moves) > self._max_nodes:
+            return False
+
+        self._random.shuffle(moves)
+        is_full = len(moves) == 1
+        self._first_children[node] = len(self._moves)
+        self._child_counts[node] = len(moves)
+
+        for index in moves:
+            if is_maximizing_player:
+                is_winning_move = is_win(bot_bits | 1 << index, geometry.box_win_masks[index])
+            else:
+                is_winning_move = is_win(human_bits | 1 << index, geometry.box_win_masks[index])
+
+            if is_winning_move:
+                result = 1 if is_maximizing_player else -1
+            else:
+                result = 0 if is_full else NOT_FINISHED
+
+            self.add_node(index, result)
+
+        return True
+
+    def select_child(self, node):
+        """
+        Picks the child with the best upper confidence bound, an unvisited child first.
+
+        :return: type: int
+        Index of the child
+        """
+        first_child = self._first_children[node]
+        visits = self._visits
+        rewards = self._rewards
+        log_visits = log(visits[node] or 1)
+        exploration = self._exploration
+
+        best_child, best_bound = first_child, None
+        for child in range(first_child, first_child + self._child_counts[node]):
+            child_visits = visits[child]
+            if not child_visits:
+                return child
+
+            bound = rewards[child] / child_visits + exploration * sqrt(log_visits / child_visits)
+            if best_bound is None or bound > best_bound:
+                best_child, best_bound = child, bound
+
+        return best_child
+
+    def playout(self, bot_bits, human_bits, is_maximizing_player):
+        """
+        Plays random moves until the game is finished.
+
+        :return: type: int
+        +1 if the bot wins, -1 if the human wins, 0 for a draw
+        """
+        box_win_masks = self._geometry.box_win_masks
+        occupied = bot_bits | human_bits
+        moves = [index for index in range(self._geometry.size) if not occupied >> index & 1]
+        self._random.shuffle(moves)
+
+        for index in moves:
+            if is_maximizing_player:
+                bot_bits |= 1 << index
+                if is_win(bot_bits, box_win_masks[index]):
+                    return 1
+            else:
+                human_bits |= 1 << index
+                if is_win(human_bits, box_win_masks[index]):
+                    return -1
+
+            is_maximizing_player = not is_maximizing_player
+
+        return 0
+
+    def run_playout(self, depth, stats=None):
+        """
+        Selects a path down the tree, expands its last node, plays a random game and backs the result up the path.
+
+        :param depth: type: int
+        The number of moves on the board at the top of the tree
+
+        :param stats: type: bot.stats.SearchStats
+        Optional collector of the search statistics, None to not collect any
+        """
+        node = self._root
+        bot_bits, human_bits = self._root_bits
+        is_maximizing_player = self._root_is_maximizing_player
+        path = [node]
+
+        while True:
+            result = self._results[node]
+            if result != NOT_FINISHED:
+                break
+
+            if self._visits[node] and self._first_children[node] < 0:
+                if not self.expand(node, bot_bits, human_bits, is_maximizing_player):
+                    # Tree is full, play the rest of the game at random
+                    result = self.playout(bot_bits, human_bits, is_maximizing_player)
+                    break
+                elif stats is not None:
+                    for _ in range(self._child_counts[node]):
+                        stats.record_node(depth + len(path))
+
+            if self._first_children[node] < 0:
+                # Unvisited leaf, play the rest of the game at random
+                result = self.playout(bot_bits, human_bits, is_maximizing_player)
+                break
+
+            node = self.select_child(node)
+            if is_maximizing_player:
+                bot_bits |= 1 << self._moves[node]
+            else:
+                human_bits |= 1 << self._moves[node]
+            is_maximizing_player = not is_maximizing_player
+            path.append(node)
+
+        if stats is not None:
+            stats.record_evaluation()
+
+        # Every node keeps the result from the point of view of the player who moved into it
+        for node in path:
+            self._visits[node] += 1
+        for index, node in enumerate(path[1:]):
+            # The player to move at the top of the tree makes the moves into the nodes at even indexes
+            is_bot_move = self._root_is_maximizing_player == (index % 2 == 0)
+            self._rewards[node] += result if is_bot_move else -result
+
+    def keep_subtree(self, root):
+        """
+        Copies the part of the tree below a node into new arrays, in breadth first order so the children of every node
+        stay next to each other, and throws the rest of the tree away.
+
+        :param root: type: int
+        Index of the node at the top of the part of the tree kept
+
+        :return: type: int
+        Index of the node in the new arrays, always 0
+        """
+        moves, first_children, child_counts = self._moves, self._first_children, self._child_counts
+        visits, rewards, results = self._visits, self._rewards, self._results
+        self.clear()
+
+        # The node at every index of the new arrays, the list grows while it is walked through
+        kept_nodes = [root]
+        for node, kept_node in enumerate(kept_nodes):
+            self.add_node(moves[kept_node], results[kept_node])
+            self._visits[node] = visits[kept_node]
+            self._rewards[node] = rewards[kept_node]
+
+            first_child = first_children[kept_node]
+            if first_child >= 0:
+                self._first_children[node] = len(kept_nodes)
+                self._child_counts[node] = child_counts[kept_node]
+                kept_nodes.extend(range(first_child, first_child + child_counts[kept_node]))
+
+        return 0
+
+    def find_root(self, bot_bits, human_bits, is_maximizing_player):
+        """
+        Finds the position in the top 2 levels of the tree, to keep the part of the tree below it.
+
+        :return: type: int
+        Index of the node of the position, None if the position is not in the tree
+        """
+        if self._root is None:
+            return None
+
+        nodes = [(self._root, self._root_bits, self._root_is_maximizing_player)]
+        for level in range(3):
+            for node, node_bits, node_is_maximizing_player in nodes:
+                if node_bits == (bot_bits, human_bits) and node_is_maximizing_player == is_maximizing_player:
+                    return node
+
+            if level == 2:
+                break
+
+            children = []
+            for node, (node_bot_bits, node_human_bits), node_is_maximizing_player in nodes:
+                first_child = self._first_children[node]
+                if first_child < 0:
+                    continue
+
+                for child in range(first_child, first_child + self._child_counts[node]):
+                    bit = 1 << self._moves[child]
+                    child_bits = (node_bot_bits | bit, node_human_bits) if node_is_maximizing_player else \
+                        (node_bot_bits, node_human_bits | bit)
+                    # Only positions that could be the new position are followed
+                    if child_bits[0] & ~bot_bits or child_bits[1] & ~human_bits:
+                        continue
+                    children.append((child, child_bits, not node_is_maximizing_player))
+            nodes = children
+
+        return None
+
+    def search(self, board, is_maximizing_player, win_length=None, stats=None):
+        """
+        Finds the move with the most playouts for the current state of the game.
+
+        :param board: type: numpy.ndarray
+        The current state of the Tic Tac Toe board game
+
+        :param is_maximizing_player: type: bool
+        True if maximizing player's turn (Bot)
+        False if minimizing player's turn (Human)
+
+        :param win_length: type: int
+        Number of marks in a row required to win, defaults to the length of the shorter side of the board
+
+        :param stats: type: bot.stats.SearchStats
+        Optional collector of the search statistics, the tree nodes added per depth and the playouts as evaluations
+
+        :return: type: tuple
+        Contains the average playout result of the chosen move from the point of view of the bot, between -1 (human
+        wins) and +1 (bot wins), and a list holding the chosen move (None for a finished board)
+        """
+        geometry = get_board_geometry(board, win_length)
+        bot_bits, human_bits = encode_board(board)
+
+        if is_win(bot_bits, geometry.win_masks) or is_win(human_bits, geometry.win_masks) or \
+                bot_bits | human_bits == (1 << geometry.size) - 1:
+            return 0, None
+
+        root = self.find_root(bot_bits, human_bits, is_maximizing_player) if geometry == self._geometry else None
+        if root:
+            # Free the nodes above the new position
+            root = self.keep_subtree(root)
+
+        if root is None or len(self._moves) >= self._max_nodes:
+            # Start a new tree
+            self.clear()
+            self._geometry = geometry
+            root = self.add_node(-1, NOT_FINISHED)
+
+        self._root = root
+        self._root_bits = (bot_bits, human_bits)
+        self._root_is_maximizing_player = is_maximizing_player
+
+        depth = bin(bot_bits | human_bits).count("1")
+        if stats is not None:
+            stats.record_node(depth)
+
+        if self._first_children[root] < 0:
+            if not self.expand(root, bot_bits, human_bits, is_maximizing_player):
+                raise ValueError("Maximum number of nodes is too small to hold the moves of the board")
+            elif stats is not None:
+                for _ in range(self._child_counts[root]):
+                    stats.record_node(depth + 1)
+
+        start_time = perf_counter()
+        deadline = start_time + self._time_budget if self._time_budget is not None else None
+        playouts = 0
+
+        while True:
+            self.run_playout(depth, stats)
+            playouts += 1
+
+            if (self._playouts is not None and playouts >= self._playouts) or \
+                    (deadline is not None and perf_counter() >= deadline):
+                break
+
+        self._last_playouts = playouts
+        self._last_elapsed = perf_counter() - start_time
+
+        # Most visited move, the most robust choice
+        first_child = self._first_children[root]
+        best_child = max(range(first_child, first_child + self._child_counts[root]),
+                         key=lambda child: self._visits[child])
+
+        score = self._rewards[best_child] / self._visits[best_child] if self._visits[best_child] else 0.0
+        if not is_maximizing_player:
+            score = -score
+
+        return score, [divmod(self._moves[best_child], geometry.columns)]
+
+    def __call__(self, board, is_maximizing_player, win_length=None, stats=None):
+        """
+        Searches as an engine (See bot/engines.py), see search() for the parameters.
+        """
+        return self.search(board, is_maximizing_player, win_length, stats)
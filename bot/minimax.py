@@ -14,12 +14,18 @@
     do not affect the outcome of the results.
 """
 
+import numpy as np
 from math import inf
+from contextlib import closing
 from copy import deepcopy
-from game.board import BOT_STATE, HUMAN_STATE, BLANK_STATE, win_check
+from time import perf_counter
+from game.board import BOT_STATE, HUMAN_STATE, BLANK_STATE, get_winner, get_move_winner
+from game.batch import flatten_boards, batch_get_winner, batch_get_turn_number
+from bot.transposition import EXACT, LOWER_BOUND, UPPER_BOUND
+from bot.bitboard import BitboardSearch, SearchBudgetExceeded, get_board_geometry
 
 
-def heuristic_evaluation(board, depth):
+def heuristic_evaluation(board, depth, win_length=None):
     """
     Gives a minimax score for the state of the board.
 
@@ -28,47 +34,106 @@ def heuristic_evaluation(board, depth):
     Less than 0 means minimizing player (Human) wins, the smaller the winning score the shorter move is required
     Exactly 0 means a draw
 
+    A win scores the number of boxes on the board + 1 - depth, which is 10 - depth on a 3 by 3 board
+
     :param board: type: numpy.ndarray
     The current state of the Tic Tac Toe board game
 
     :param depth: type: int
     How deep the decision tree to search
     The depth at the top of the tree is 0, as you go deeper, depth increases
-    Maximum depth is 9, as Tic Tact Toe only have 9 moves available
+    Maximum depth is the number of boxes on the board, 9 on a 3 by 3 board
+
+    :param win_length: type: int
+    Number of marks in a row required to win, defaults to the length of the shorter side of the board
 
     :return: type: int
     The minimax score of the board
     """
-    # Straight row win
-    for row in board:
-        if all(box == HUMAN_STATE for box in row):
-            return -10 + depth
-        elif all(box == BOT_STATE for box in row):
-            return +10 - depth
-
-    # Vertical column win
-    for col in zip(*board):
-        if all(box == HUMAN_STATE for box in col):
-            return -10 + depth
-        elif all(box == BOT_STATE for box in col):
-            return +10 - depth
-
-    # Diagonal win \ type
-    if all([board[index][index] == HUMAN_STATE for index in range(len(board))]):
-        return -10 + depth
-    elif all([board[index][index] == BOT_STATE for index in range(len(board))]):
-        return +10 - depth
-
-    # Diagonal win / type
-    if all([board[index][-(index + 1)] == HUMAN_STATE for index in range(len(board))]):
-        return -10 + depth
-    elif all([board[index][-(index + 1)] == BOT_STATE for index in range(len(board))]):
-        return +10 - depth
+    return get_winner_score(get_winner(board, win_length), depth, board.size)
+
+
+def batch_heuristic_evaluation(boards, depths=None, win_length=None, shape=(3, 3)):
+    """
+    Vectorized version of heuristic_evaluation(), gives a minimax score for every board of a stack in one pass.
+    See game/batch.py for the accepted stacks of boards
+
+    :param boards: type: numpy.ndarray
+    Stack of boards of shape (N, rows, columns) or (N, rows * columns)
+
+    :param depths: type: numpy.ndarray or int
+    The depth of every board in the decision tree, defaults to the number of moves on every board
+
+    :param win_length: type: int
+    Number of marks in a row required to win, defaults to the length of the shorter side of the board
+
+    :param shape: type: tuple
+    The number of rows & columns of the boards, only used for a stack of flattened boards
+    Defaults to a 3 by 3 board
+
+    :return: type: numpy.ndarray
+    Array of shape (N,) with the minimax score of every board
+    """
+    flat_boards, (rows, columns) = flatten_boards(boards, shape)
+    size = rows * columns
+
+    if depths is None:
+        depths = batch_get_turn_number(flat_boards, (rows, columns))
+    depths = np.asarray(depths, dtype=int)
+
+    winners = batch_get_winner(flat_boards, win_length, (rows, columns))
+
+    return np.select([winners == HUMAN_STATE, winners == BOT_STATE], [-(size + 1) + depths, +(size + 1) - depths], 0)
+
+
+def get_winner_score(winner, depth, size):
+    """
+    Gives a minimax score for the winner of the board, the same as heuristic_evaluation()
+
+    :param winner: type: int
+    The state of the winning player, HUMAN_STATE or BOT_STATE, None if there is no winner
+
+    :param depth: type: int
+    The depth of the node in the decision tree
+
+    :param size: type: int
+    Number of boxes on the board
+
+    :return: type: int
+    The minimax score of the board
+    """
+    if winner == HUMAN_STATE:
+        return -(size + 1) + depth
+    elif winner == BOT_STATE:
+        return +(size + 1) - depth
 
     # No winner/draw
     return 0
 
 
+def get_last_winner(board, last_move=None, win_length=None):
+    """
+    Finds the winner of the board during a search. Since the search stops at the first win, the board before the last
+    move never has a winner, so only the winning combinations through the last move have to be checked.
+
+    :param board: type: numpy.ndarray
+    The current state of the Tic Tac Toe board game
+
+    :param last_move: type: tuple
+    The last move made on the board, None to check the whole board
+
+    :param win_length: type: int
+    Number of marks in a row required to win, defaults to the length of the shorter side of the board
+
+    :return: type: int if winning combination is found, else None
+    The state of the winning player, HUMAN_STATE or BOT_STATE
+    """
+    if last_move is None:
+        return get_winner(board, win_length)
+
+    return get_move_winner(board, last_move, win_length)
+
+
 def get_possible_branches(board, is_maximizing_player):
     """
     Loops through the board to find possible moves. This function is different from get_possible_moves() in board.py
@@ -88,8 +153,8 @@ def get_possible_branches(board, is_maximizing_player):
     branches = []
     moves = []
 
-    for row in range(0, 3):
-        for box in range(0, 3):
+    for row in range(board.shape[0]):
+        for box in range(board.shape[1]):
             if board[row][box] == BLANK_STATE:
                 # Record move
                 moves.append((row, box))
@@ -101,6 +166,51 @@ def get_possible_branches(board, is_maximizing_player):
     return branches, moves
 
 
+def generate_branches(board, is_maximizing_player, depth=None, ordering=None, first_move=None):
+    """
+    Lazy, in place version of get_possible_branches(). Instead of creating a copy of the board for every possible move,
+    each move is made on the board itself, the board is yielded, and the move is undone once the branch was searched.
+    Branches after an alpha beta cutoff are never created at all.
+
+    The same board is yielded for every move, so a branch must be fully searched before asking for the next one, and
+    the generator must be closed (See contextlib.closing()) when the loop breaks early, which undoes the last move.
+
+    :param board: type: numpy.ndarray
+    The current state of the Tic Tac Toe board game
+
+    :param is_maximizing_player: type: bool
+    True if maximizing player's turn (Bot)
+    False if minimizing player's turn (Human)
+
+    :param depth: type: int
+    The depth of the node in the decision tree, only used by the move orderer
+
+    :param ordering: type: bot.move_ordering.MoveOrderer
+    Optional move orderer to yield the most promising moves first, None to keep the row by row order
+
+    :param first_move: type: tuple
+    Move to yield before every other move when ordering moves, such as the best move from the transposition table
+
+    :return: type: generator
+    Yields the board with the move made and the move index in numpy array format (<row_index>, <column_index>)
+    """
+    state = BOT_STATE if is_maximizing_player else HUMAN_STATE
+    moves = [(row_index, box_index) for row_index, row in enumerate(board.tolist())
+             for box_index, box in enumerate(row) if box == BLANK_STATE]
+
+    if ordering is not None:
+        moves = ordering.order(moves, depth, first_move)
+
+    for move in moves:
+        # Make move
+        board[move] = state
+        try:
+            yield board, move
+        finally:
+            # Undo move
+            board[move] = BLANK_STATE
+
+
 def get_depth(board):
     """
     Loops the Tic Tac Toe board and counts the number of PLAYER_STATES (HUMAN_STATE or BOT_STATE)
@@ -141,7 +251,42 @@ def get_winner_from_score(score):
         return None
 
 
-def minimax(board, depth, is_maximizing_player):
+def get_score_bound(score, alpha, beta, is_soft_pruning):
+    """
+    Determines whether the score returned by an alpha beta search is exact or only a bound of the real score.
+    Used to label the entries of the transposition table.
+
+    :param score: type: int
+    The score returned by the search
+
+    :param alpha: type: float
+    The alpha value the search was called with
+
+    :param beta: type: float
+    The beta value the search was called with
+
+    :param is_soft_pruning: type: bool
+    True if the search only prunes values strictly outside of the alpha beta window (Soft alpha beta pruning)
+
+    :return: type: int
+    EXACT, LOWER_BOUND or UPPER_BOUND
+    """
+    if is_soft_pruning:
+        # Scores on the edges of the window are still exact
+        if score > beta:
+            return LOWER_BOUND
+        elif score < alpha:
+            return UPPER_BOUND
+    else:
+        if score >= beta:
+            return LOWER_BOUND
+        elif score <= alpha:
+            return UPPER_BOUND
+
+    return EXACT
+
+
+def minimax(board, depth, is_maximizing_player, win_length=None, stats=None, last_move=None):
     """
     Using minimax algorithm to find the optimal move for the current state of the game.
 
@@ -151,18 +296,34 @@ def minimax(board, depth, is_maximizing_player):
     :param depth: type: int
     How deep the decision tree to search
     The depth at the top of the tree is 0, as you go deeper, depth increases
-    Maximum depth is 9, as Tic Tact Toe only have 9 moves available
+    Maximum depth is the number of boxes on the board, 9 on a 3 by 3 board
 
     :param is_maximizing_player: type: bool
     True if maximizing player's turn (Bot)
     False if minimizing player's turn (Human)
 
+    :param win_length: type: int
+    Number of marks in a row required to win, defaults to the length of the shorter side of the board
+
+    :param stats: type: bot.stats.SearchStats
+    Optional collector of the search statistics, None to not collect any
+
+    :param last_move: type: tuple
+    The last move made on the board, to only check the winning combinations through it
+    None to check the whole board
+
     :return: type: tuple
     Contains the best minimax score and a list of moves that is derived from that score
     """
+    if stats is not None:
+        stats.record_node(depth)
+
     # Check if last node
-    if win_check(board) or depth == 9:
-        return heuristic_evaluation(board, depth), None
+    winner = get_last_winner(board, last_move, win_length)
+    if winner is not None or depth == board.size:
+        if stats is not None:
+            stats.record_evaluation()
+        return get_winner_score(winner, depth, board.size), None
 
     best_moves = []
 
@@ -170,33 +331,36 @@ def minimax(board, depth, is_maximizing_player):
         max_score = -inf
 
         # Loop possible moves in a single turn
-        for branch, move in zip(*get_possible_branches(board, True)):
-            score, _ = minimax(branch, depth + 1, False)
+        with closing(generate_branches(board, True)) as branches:
+            for branch, move in branches:
+                score, _ = minimax(branch, depth + 1, False, win_length, stats, move)
 
-            if score > max_score:
-                max_score = score
-                best_moves = [move]
-            elif score == max_score:
-                best_moves.append(move)
+                if score > max_score:
+                    max_score = score
+                    best_moves = [move]
+                elif score == max_score:
+                    best_moves.append(move)
 
         return max_score, best_moves
     else:
         min_score = +inf
 
         # Loop possible moves in a single turn
-        for branch, move in zip(*get_possible_branches(board, False)):
-            score, _ = minimax(branch, depth + 1, True)
+        with closing(generate_branches(board, False)) as branches:
+            for branch, move in branches:
+                score, _ = minimax(branch, depth + 1, True, win_length, stats, move)
 
-            if score < min_score:
-                min_score = score
-                best_moves = [move]
-            elif score == min_score:
-                best_moves.append(move)
+                if score < min_score:
+                    min_score = score
+                    best_moves = [move]
+                elif score == min_score:
+                    best_moves.append(move)
 
         return min_score, best_moves
 
 
-def minimax_soft_alpha_beta(board, depth, is_maximizing_player, alpha, beta):
+def minimax_soft_alpha_beta(board, depth, is_maximizing_player, alpha, beta, table=None, win_length=None,
+                            ordering=None, stats=None, last_move=None):
     """
     Using minimax algorithm to find the optimal move for the current state of the game.
 
@@ -209,18 +373,59 @@ def minimax_soft_alpha_beta(board, depth, is_maximizing_player, alpha, beta):
     :param depth: type: int
     How deep the decision tree to search
     The depth at the top of the tree is 0, as you go deeper, depth increases
-    Maximum depth is 9, as Tic Tact Toe only have 9 moves available
+    Maximum depth is the number of boxes on the board, 9 on a 3 by 3 board
 
     :param is_maximizing_player: type: bool
     True if maximizing player's turn (Bot)
     False if minimizing player's turn (Human)
 
+    :param table: type: bot.transposition.TranspositionTable
+    Optional transposition table to look up and store the results of positions searched
+    A table should only be shared between calls of the same search function with the same win length
+
+    :param win_length: type: int
+    Number of marks in a row required to win, defaults to the length of the shorter side of the board
+
+    :param ordering: type: bot.move_ordering.MoveOrderer
+    Optional move orderer to search the most promising moves first, which prunes more branches
+
+    :param stats: type: bot.stats.SearchStats
+    Optional collector of the search statistics, None to not collect any
+
+    :param last_move: type: tuple
+    The last move made on the board, to only check the winning combinations through it
+    None to check the whole board
+
     :return: type: tuple
     Contains the best minimax score and a list of moves that is derived from that score
     """
+    if stats is not None:
+        stats.record_node(depth)
+
     # Check if last node
-    if win_check(board) or depth == 9:
-        return heuristic_evaluation(board, depth), None
+    winner = get_last_winner(board, last_move, win_length)
+    if winner is not None or depth == board.size:
+        if stats is not None:
+            stats.record_evaluation()
+        return get_winner_score(winner, depth, board.size), None
+
+    # Best move of a previous search, searched first when ordering moves
+    first_move = None
+
+    if table is not None:
+        # Check if position was searched before
+        entry = table.probe(board, depth, is_maximizing_player)
+        if stats is not None:
+            stats.record_probe(entry is not None)
+        if entry is not None:
+            if entry.bound == EXACT or (entry.bound == LOWER_BOUND and entry.score > beta) or \
+                    (entry.bound == UPPER_BOUND and entry.score < alpha):
+                return entry.score, list(entry.best_moves)
+            elif entry.best_moves:
+                first_move = entry.best_moves[0]
+
+        # Remember original window to determine the bound of the score
+        original_alpha, original_beta = alpha, beta
 
     best_moves = []
 
@@ -228,43 +433,72 @@ def minimax_soft_alpha_beta(board, depth, is_maximizing_player, alpha, beta):
         max_score = -inf
 
         # Loop possible moves in a single turn
-        for branch, move in zip(*get_possible_branches(board, True)):
-            score, _ = minimax_soft_alpha_beta(branch, depth + 1, False, alpha, beta)
-
-            if score > max_score:
-                max_score = score
-                best_moves = [move]
-            elif score == max_score:
-                best_moves.append(move)
-
-            # Alpha beta pruning
-            alpha = max(alpha, score)
-            if beta < alpha:
-                break
+        with closing(generate_branches(board, True, depth, ordering, first_move)) as branches:
+            for move_index, (branch, move) in enumerate(branches):
+                score, _ = minimax_soft_alpha_beta(branch, depth + 1, False, alpha, beta, table, win_length, ordering,
+                                                   stats, move)
+
+                if score > max_score:
+                    max_score = score
+                    best_moves = [move]
+                elif score == max_score:
+                    best_moves.append(move)
+
+                # Alpha beta pruning
+                alpha = max(alpha, score)
+                if beta < alpha:
+                    if ordering is not None:
+                        ordering.record_cutoff(move, depth)
+                    if stats is not None:
+                        stats.record_cutoff(depth, move_index)
+                    break
+
+        if ordering is not None:
+            # Keep the moves in row by row order regardless of the search order
+            best_moves.sort()
+
+        if table is not None:
+            bound = get_score_bound(max_score, original_alpha, original_beta, True)
+            table.store(board, depth, True, max_score, bound, best_moves)
 
         return max_score, best_moves
     else:
         min_score = +inf
 
         # Loop possible moves in a single turn
-        for branch, move in zip(*get_possible_branches(board, False)):
-            score, _ = minimax_soft_alpha_beta(branch, depth + 1, True, alpha, beta)
-
-            if score < min_score:
-                min_score = score
-                best_moves = [move]
-            elif score == min_score:
-                best_moves.append(move)
-
-            # Alpha beta pruning
-            beta = min(beta, score)
-            if beta < alpha:
-                break
+        with closing(generate_branches(board, False, depth, ordering, first_move)) as branches:
+            for move_index, (branch, move) in enumerate(branches):
+                score, _ = minimax_soft_alpha_beta(branch, depth + 1, True, alpha, beta, table, win_length, ordering,
+                                                   stats, move)
+
+                if score < min_score:
+                    min_score = score
+                    best_moves = [move]
+                elif score == min_score:
+                    best_moves.append(move)
+
+                # Alpha beta pruning
+                beta = min(beta, score)
+                if beta < alpha:
+                    if ordering is not None:
+                        ordering.record_cutoff(move, depth)
+                    if stats is not None:
+                        stats.record_cutoff(depth, move_index)
+                    break
+
+        if ordering is not None:
+            # Keep the moves in row by row order regardless of the search order
+            best_moves.sort()
+
+        if table is not None:
+            bound = get_score_bound(min_score, original_alpha, original_beta, True)
+            table.store(board, depth, False, min_score, bound, best_moves)
 
         return min_score, best_moves
 
 
-def minimax_alpha_beta(board, depth, is_maximizing_player, alpha, beta):
+def minimax_alpha_beta(board, depth, is_maximizing_player, alpha, beta, table=None, win_length=None,
+                       ordering=None, stats=None, last_move=None):
     """
     Using minimax algorithm to find the optimal move for the current state of the game.
 
@@ -278,18 +512,59 @@ def minimax_alpha_beta(board, depth, is_maximizing_player, alpha, beta):
     :param depth: type: int
     How deep the decision tree to search
     The depth at the top of the tree is 0, as you go deeper, depth increases
-    Maximum depth is 9, as Tic Tact Toe only have 9 moves available
+    Maximum depth is the number of boxes on the board, 9 on a 3 by 3 board
 
     :param is_maximizing_player: type: bool
     True if maximizing player's turn (Bot)
     False if minimizing player's turn (Human)
 
+    :param table: type: bot.transposition.TranspositionTable
+    Optional transposition table to look up and store the results of positions searched
+    A table should only be shared between calls of the same search function with the same win length
+
+    :param win_length: type: int
+    Number of marks in a row required to win, defaults to the length of the shorter side of the board
+
+    :param ordering: type: bot.move_ordering.MoveOrderer
+    Optional move orderer to search the most promising moves first, which prunes more branches
+
+    :param stats: type: bot.stats.SearchStats
+    Optional collector of the search statistics, None to not collect any
+
+    :param last_move: type: tuple
+    The last move made on the board, to only check the winning combinations through it
+    None to check the whole board
+
     :return: type: tuple
     Contains the best minimax score and a single move that is derived from that score
     """
+    if stats is not None:
+        stats.record_node(depth)
+
     # Check if leaf node
-    if win_check(board) or depth == 9:
-        return heuristic_evaluation(board, depth), None
+    winner = get_last_winner(board, last_move, win_length)
+    if winner is not None or depth == board.size:
+        if stats is not None:
+            stats.record_evaluation()
+        return get_winner_score(winner, depth, board.size), None
+
+    # Best move of a previous search, searched first when ordering moves
+    first_move = None
+
+    if table is not None:
+        # Check if position was searched before
+        entry = table.probe(board, depth, is_maximizing_player)
+        if stats is not None:
+            stats.record_probe(entry is not None)
+        if entry is not None:
+            if entry.bound == EXACT or (entry.bound == LOWER_BOUND and entry.score >= beta) or \
+                    (entry.bound == UPPER_BOUND and entry.score <= alpha):
+                return entry.score, list(entry.best_moves)
+            elif entry.best_moves:
+                first_move = entry.best_moves[0]
+
+        # Remember original window to determine the bound of the score
+        original_alpha, original_beta = alpha, beta
 
     best_moves = None
 
@@ -297,35 +572,327 @@ def minimax_alpha_beta(board, depth, is_maximizing_player, alpha, beta):
         max_score = -inf
 
         # Loop possible moves in a single turn
-        for branch, move in zip(*get_possible_branches(board, True)):
-            score, _ = minimax_alpha_beta(branch, depth + 1, False, alpha, beta)
-
-            if score > max_score:
-                max_score = score
-                best_moves = [move]
-
-            # Alpha beta pruning
-            alpha = max(alpha, score)
-            if beta <= alpha:
-                break
+        with closing(generate_branches(board, True, depth, ordering, first_move)) as branches:
+            for move_index, (branch, move) in enumerate(branches):
+                score, _ = minimax_alpha_beta(branch, depth + 1, False, alpha, beta, table, win_length, ordering,
+                                              stats, move)
+
+                if score > max_score:
+                    max_score = score
+                    best_moves = [move]
+
+                # Alpha beta pruning
+                alpha = max(alpha, score)
+                if beta <= alpha:
+                    if ordering is not None:
+                        ordering.record_cutoff(move, depth)
+                    if stats is not None:
+                        stats.record_cutoff(depth, move_index)
+                    break
+
+        if table is not None:
+            bound = get_score_bound(max_score, original_alpha, original_beta, False)
+            table.store(board, depth, True, max_score, bound, best_moves)
 
         return max_score, best_moves
     else:
         min_score = +inf
 
         # Loop possible moves in a single turn
-        for branch, move in zip(*get_possible_branches(board, False)):
-            score, _ = minimax_alpha_beta(branch, depth + 1, True, alpha, beta)
+        with closing(generate_branches(board, False, depth, ordering, first_move)) as branches:
+            for move_index, (branch, move) in enumerate(branches):
+                score, _ = minimax_alpha_beta(branch, depth + 1, True, alpha, beta, table, win_length, ordering,
+                                              stats, move)
+
+                if score < min_score:
+                    min_score = score
+                    best_moves = [move]
+                elif score == min_score:
+                    best_moves.append(move)
+
+                # Alpha beta pruning
+                beta = min(beta, score)
+                if beta <= alpha:
+                    if ordering is not None:
+                        ordering.record_cutoff(move, depth)
+                    if stats is not None:
+                        stats.record_cutoff(depth, move_index)
+                    break
+
+        if table is not None:
+            bound = get_score_bound(min_score, original_alpha, original_beta, False)
+            table.store(board, depth, False, min_score, bound, best_moves)
 
-            if score < min_score:
-                min_score = score
+        return min_score, best_moves
+
+
+def negamax(board, depth, color, alpha, beta, table=None, win_length=None, ordering=None, stats=None,
+            last_move=None):
+    """
+    Negamax version of the minimax algorithm with principal variation search (NegaScout).
+
+    Negamax scores every position from the point of view of the player to move, so the score of a position is the
+    negated score of the best branch for the opponent, and a single branch of code serves both players.
+
+    The first branch is searched with the full alpha beta window. Assuming the first branch is the best one (the
+    principal variation), the other branches are only searched with a zero width window around alpha, which can only
+    prove that the branch is not better. When a branch turns out to be better (fail high), it is searched again with
+    the full window to find its exact score. Searching the most promising branch first, such as with move ordering,
+    results in fewer searches again.
+
+    :param board: type: numpy.ndarray
+    The current state of the Tic Tac Toe board game
+
+    :param depth: type: int
+    How deep the decision tree to search
+    The depth at the top of the tree is 0, as you go deeper, depth increases
+    Maximum depth is the number of boxes on the board, 9 on a 3 by 3 board
+
+    :param color: type: int
+    +1 if maximizing player's turn (Bot)
+    -1 if minimizing player's turn (Human)
+
+    :param alpha: type: float
+    The lower bound of the window, from the point of view of the player to move
+
+    :param beta: type: float
+    The upper bound of the window, from the point of view of the player to move
+
+    :param table: type: bot.transposition.TranspositionTable
+    Optional transposition table to look up and store the results of positions searched
+    A table should only be shared between calls of the same search function with the same win length
+
+    :param win_length: type: int
+    Number of marks in a row required to win, defaults to the length of the shorter side of the board
+
+    :param ordering: type: bot.move_ordering.MoveOrderer
+    Optional move orderer to search the most promising moves first, which prunes more branches
+
+    :param stats: type: bot.stats.SearchStats
+    Optional collector of the search statistics, None to not collect any
+
+    :param last_move: type: tuple
+    The last move made on the board, to only check the winning combinations through it
+    None to check the whole board
+
+    :return: type: tuple
+    Contains the best negamax score, from the point of view of the player to move, and a single move that is derived
+    from that score
+    """
+    if stats is not None:
+        stats.record_node(depth)
+
+    # Check if leaf node
+    winner = get_last_winner(board, last_move, win_length)
+    if winner is not None or depth == board.size:
+        if stats is not None:
+            stats.record_evaluation()
+        return color * get_winner_score(winner, depth, board.size), None
+
+    is_maximizing_player = color == 1
+
+    # Best move of a previous search, searched first when ordering moves
+    first_move = None
+
+    if table is not None:
+        # Check if position was searched before
+        entry = table.probe(board, depth, is_maximizing_player)
+        if stats is not None:
+            stats.record_probe(entry is not None)
+        if entry is not None:
+            if entry.bound == EXACT or (entry.bound == LOWER_BOUND and entry.score >= beta) or \
+                    (entry.bound == UPPER_BOUND and entry.score <= alpha):
+                return entry.score, list(entry.best_moves)
+            elif entry.best_moves:
+                first_move = entry.best_moves[0]
+
+        # Remember original window to determine the bound of the score
+        original_alpha, original_beta = alpha, beta
+
+    best_score = -inf
+    best_moves = None
+
+    # Loop possible moves in a single turn
+    with closing(generate_branches(board, is_maximizing_player, depth, ordering, first_move)) as branches:
+        for move_index, (branch, move) in enumerate(branches):
+            if not move_index:
+                # Principal variation, full window search
+                score = -negamax(branch, depth + 1, -color, -beta, -alpha, table, win_length, ordering, stats,
+                                 move)[0]
+            else:
+                # Zero window search, only proves whether the branch is better than alpha
+                score = -negamax(branch, depth + 1, -color, -alpha - 1, -alpha, table, win_length, ordering,
+                                 stats, move)[0]
+
+                if alpha < score < beta:
+                    # Fail high, search again with the full window for the exact score
+                    score = -negamax(branch, depth + 1, -color, -beta, -alpha, table, win_length, ordering,
+                                     stats, move)[0]
+
+            if score > best_score:
+                best_score = score
                 best_moves = [move]
-            elif score == min_score:
-                best_moves.append(move)
 
             # Alpha beta pruning
-            beta = min(beta, score)
+            alpha = max(alpha, score)
             if beta <= alpha:
+                if ordering is not None:
+                    ordering.record_cutoff(move, depth)
+                if stats is not None:
+                    stats.record_cutoff(depth, move_index)
                 break
 
-        return min_score, best_moves
+    if table is not None:
+        bound = get_score_bound(best_score, original_alpha, original_beta, False)
+        table.store(board, depth, is_maximizing_player, best_score, bound, best_moves)
+
+    return best_score, best_moves
+
+
+def principal_variation_search(board, depth, is_maximizing_player, alpha, beta, table=None, win_length=None,
+                               ordering=None, stats=None, last_move=None):
+    """
+    Using negamax with principal variation search to find the optimal move for the current state of the game.
+    See negamax() for the details of the search, this function takes and returns the same scores as the other minimax
+    functions, from the point of view of the bot.
+
+    This version of the minimax algorithm prunes the same as minimax_alpha_beta(), so it can only return 1 move, as the
+    other moves are pruned.
+
+    :param board: type: numpy.ndarray
+    The current state of the Tic Tac Toe board game
+
+    :param depth: type: int
+    How deep the decision tree to search
+    The depth at the top of the tree is 0, as you go deeper, depth increases
+    Maximum depth is the number of boxes on the board, 9 on a 3 by 3 board
+
+    :param is_maximizing_player: type: bool
+    True if maximizing player's turn (Bot)
+    False if minimizing player's turn (Human)
+
+    :param table: type: bot.transposition.TranspositionTable
+    Optional transposition table to look up and store the results of positions searched
+    A table should only be shared between calls of the same search function with the same win length
+
+    :param win_length: type: int
+    Number of marks in a row required to win, defaults to the length of the shorter side of the board
+
+    :param ordering: type: bot.move_ordering.MoveOrderer
+    Optional move orderer to search the most promising moves first, which prunes more branches
+
+    :param stats: type: bot.stats.SearchStats
+    Optional collector of the search statistics, None to not collect any
+
+    :param last_move: type: tuple
+    The last move made on the board, to only check the winning combinations through it
+    None to check the whole board
+
+    :return: type: tuple
+    Contains the best minimax score and a single move that is derived from that score
+    """
+    if is_maximizing_player:
+        return negamax(board, depth, +1, alpha, beta, table, win_length, ordering, stats, last_move)
+
+    # Window and score are negated for the point of view of the human
+    score, best_moves = negamax(board, depth, -1, -beta, -alpha, table, win_length, ordering, stats,
+                                 last_move)
+    return -score, best_moves
+
+
+def iterative_deepening(board, depth, is_maximizing_player, win_length=None, time_limit=None, node_budget=None,
+                        max_depth=None, stats=None):
+    """
+    Using iterative deepening to find the optimal moves for the current state of the game within a time limit.
+
+    The decision tree is searched 1 move ahead, then 2 moves ahead, then 3 moves ahead and so on, using the bitboard
+    search with a depth limit. Each search starts with the best moves of the previous search, which are likely to still
+    be the best moves. The deepening stops when the whole tree has been searched, a forced win or loss is found, or the
+    time limit or node budget runs out.
+
+    The result of the deepest search that was fully completed is returned. A search that is cut off by the limits is
+    thrown away, unless it is the very first search.
+
+    :param board: type: numpy.ndarray
+    The current state of the Tic Tac Toe board game
+
+    :param depth: type: int
+    How deep the decision tree to search
+    The depth at the top of the tree is 0, as you go deeper, depth increases
+    Maximum depth is the number of boxes on the board, 9 on a 3 by 3 board
+
+    :param is_maximizing_player: type: bool
+    True if maximizing player's turn (Bot)
+    False if minimizing player's turn (Human)
+
+    :param win_length: type: int
+    Number of marks in a row required to win, defaults to the length of the shorter side of the board
+
+    :param time_limit: type: float
+    Maximum number of seconds to search, None for no limit
+
+    :param node_budget: type: int
+    Maximum number of nodes to search, None for no limit
+
+    :param max_depth: type: int
+    Maximum number of moves to search ahead, None to deepen until the end of the game
+
+    :param stats: type: bot.stats.SearchStats
+    Optional collector of the search statistics of all the searches, including the ones thrown away, None to not
+    collect any
+
+    :return: type: tuple
+    Contains the best minimax score, a list of moves that is derived from that score and a dictionary with the
+    number of moves searched ahead ('depth'), the number of nodes searched ('nodes'), the number of seconds taken
+    ('elapsed') and whether the result is the same as searching the whole tree ('completed')
+    """
+    start_time = perf_counter()
+    bitboard_search = BitboardSearch(get_board_geometry(board, win_length), node_budget=node_budget,
+                                     time_budget=time_limit, stats=stats)
+
+    score, moves = None, None
+    depth_reached = 0
+    completed = False
+
+    remaining_depth = board.size - depth
+    if max_depth is not None:
+        remaining_depth = min(remaining_depth, max_depth)
+
+    for search_depth in range(1, max(remaining_depth, 1) + 1):
+        bitboard_search.max_depth = search_depth
+
+        try:
+            # Only the first search may return a partial result
+            score, moves = bitboard_search.search_root(board, depth, is_maximizing_player, first_moves=moves,
+                                                       allow_partial=moves is None)
+        except SearchBudgetExceeded:
+            # Throw away the unfinished search
+            break
+
+        if moves is None:
+            # Board is already finished
+            completed = True
+            break
+        elif bitboard_search.budget_exceeded:
+            # Partial result of the first search
+            break
+
+        depth_reached = search_depth
+
+        if not bitboard_search.horizon_reached:
+            # Whole tree was searched, deeper searches give the same result
+            completed = True
+            break
+        elif abs(score) >= 1:
+            # Forced win or loss, scores of unfinished positions are always between -1 and 1
+            completed = True
+            break
+
+    info = {
+        'depth': depth_reached,
+        'nodes': bitboard_search.nodes,
+        'elapsed': perf_counter() - start_time,
+        'completed': completed
+    }
+
+    return score, moves, info
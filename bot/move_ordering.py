@@ -0,0 +1,146 @@
+"""
+    Move ordering for the minimax algorithm.
+
+    Alpha beta pruning prunes the most branches when the best move is searched first, as every move after it can be cut
+    off early. Without ordering, moves are searched row by row, meaning the center of a 3 by 3 board is only searched
+    fifth.
+
+    The moves are ordered by these heuristics, from the strongest to the weakest:
+    1. The best move of the position from a previous search, such as an entry of the transposition table
+    2. Killer moves, moves that recently caused a cutoff at the same depth of the decision tree
+    3. History heuristic, moves that caused many cutoffs anywhere in the decision tree, across all searches
+    4. Static priors, moves on more winning combinations first (center > corners > edges on a 3 by 3 board)
+"""
+
+from functools import lru_cache
+from game.board import get_winning_lines
+
+
+@lru_cache(maxsize=None)
+def get_static_priors(rows, columns, win_length):
+    """
+    Counts the number of winning combinations that go through each box of the board.
+    On a 3 by 3 board, the center is on 4 combinations, the corners on 3 and the edges on 2
+
+    :param rows: type: int
+    Number of rows of the board
+
+    :param columns: type: int
+    Number of columns of the board
+
+    :param win_length: type: int
+    Number of marks in a row required to win
+
+    :return: type: dict
+    Dictionary of move indexes in numpy array format (<row_index>, <column_index>) mapped to their prior
+    """
+    priors = {(row, box): 0 for row in range(rows) for box in range(columns)}
+
+    for line in get_winning_lines(rows, columns, win_length):
+        for move in line:
+            priors[move] += 1
+
+    return priors
+
+
+class MoveOrderer:
+    """
+    Move orderer class
+
+    Orders the possible moves of a position so the moves most likely to be the best are searched first. The killer
+    moves and history table are kept between searches, so a single orderer keeps improving over a whole game.
+    """
+    def __init__(self, shape=(3, 3), win_length=None, use_priors=True, use_killers=True, use_history=True,
+                 killer_slots=2):
+        """
+        Constructor for MoveOrderer class.
+
+        :param shape: type: tuple
+        The number of rows & columns of the board
+        Defaults to a 3 by 3 board
+
+        :param win_length: type: int
+        Number of marks in a row required to win, defaults to the length of the shorter side of the board
+
+        :param use_priors: type: bool
+        True to order moves by their static prior
+
+        :param use_killers: type: bool
+        True to search killer moves first
+
+        :param use_history: type: bool
+        True to order moves by the history table
+
+        :param killer_slots: type: int
+        Number of killer moves remembered for every depth
+        """
+        self._size = shape[0] * shape[1]
+        self._priors = get_static_priors(*shape, win_length if win_length is not None else min(shape)) \
+            if use_priors else {}
+        self._use_killers = use_killers
+        self._use_history = use_history
+        self._killer_slots = killer_slots
+        self._killers = {}
+        self._history = {}
+
+    # Getter & setter methods
+    @property
+    def history(self):
+        return self._history
+
+    @property
+    def killers(self):
+        return self._killers
+
+    def order(self, moves, depth, first_move=None):
+        """
+        Orders the moves from the most to the least promising move.
+
+        :param moves: type: list
+        List of possible move indexes in numpy array format (<row_index>, <column_index>)
+
+        :param depth: type: int
+        The depth of the node in the decision tree
+
+        :param first_move: type: tuple
+        Move to search before every other move, such as the best move from the transposition table
+
+        :return: type: list
+        List of the same moves, in the order they should be searched
+        """
+        killers = self._killers.get(depth, ()) if self._use_killers else ()
+        history = self._history if self._use_history else {}
+        priors = self._priors
+
+        # The most recent killer move ranks the highest
+        killer_ranks = {move: len(killers) - index for index, move in enumerate(killers)}
+
+        return sorted(moves, key=lambda move: (move == first_move, killer_ranks.get(move, 0), history.get(move, 0),
+                                               priors.get(move, 0)), reverse=True)
+
+    def record_cutoff(self, move, depth):
+        """
+        Records a move that caused an alpha beta cutoff, promoting it as a killer move and in the history table.
+
+        :param move: type: tuple
+        Move index in numpy array format (<row_index>, <column_index>)
+
+        :param depth: type: int
+        The depth of the node in the decision tree
+        """
+        if self._use_killers:
+            killers = self._killers.setdefault(depth, [])
+            if move not in killers:
+                killers.insert(0, move)
+                del killers[self._killer_slots:]
+
+        if self._use_history:
+            # Cutoffs near the top of the tree prune more branches, so they weigh more
+            self._history[move] = self._history.get(move, 0) + (self._size - depth) ** 2
+
+    def clear(self):
+        """
+        Forgets all killer moves and the history table.
+        """
+        self._killers.clear()
+        self._history.clear()
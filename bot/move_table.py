@@ -0,0 +1,223 @@
+"""
+    Precomputed perfect play move table.
+
+    Tic Tac Toe only has a few thousand reachable positions, so instead of searching the decision tree every turn, every
+    reachable position is solved once and the results are written into a compact binary table.
+
+    The table is indexed by the base 3 rank of the board (See get_board_rank() in board.py), with one record for every
+    possible board. A record holds the minimax score and the optimal moves of the position for both players, the
+    optimal moves are stored as a bit mask of the box indexes.
+
+    The table file is memory mapped when loaded, so finding the best moves of any position is a single index lookup.
+"""
+
+import os
+import numpy as np
+from functools import lru_cache
+from math import inf
+from game.board import get_board_rank
+from bot.bitboard import BOX_BITS, is_win, evaluate
+
+# Identifies the file as a move table, followed by the table format version
+MAGIC = b"TTTMOVE1"
+
+# Number of possible boards, 9 boxes with 3 states each
+TABLE_SIZE = 3 ** 9
+
+# Layout of a single record, packed without padding (6 bytes)
+# A moves mask of 0 means the position is not reachable or already finished
+RECORD_DTYPE = np.dtype([
+    ('bot_score', 'i1'),
+    ('bot_moves', '<u2'),
+    ('human_score', 'i1'),
+    ('human_moves', '<u2')
+])
+
+# Default location of the table file
+MOVE_TABLE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "move_table.bin")
+
+
+def solve_position(bot_bits, human_bits, depth, is_maximizing_player, solutions):
+    """
+    Solves the position and every position reachable from it with plain minimax on bitboards.
+    Every position is only solved once, the results of all the non terminal positions are recorded in solutions
+
+    :param bot_bits: type: int
+    The bitboard of the bot
+
+    :param human_bits: type: int
+    The bitboard of the human
+
+    :param depth: type: int
+    How deep the decision tree to search
+    The depth at the top of the tree is 0, as you go deeper, depth increases
+
+    :param is_maximizing_player: type: bool
+    True if maximizing player's turn (Bot)
+    False if minimizing player's turn (Human)
+
+    :param solutions: type: dict
+    Dictionary of solved positions, (bot_bits, human_bits, is_maximizing_player) mapped to (score, moves_mask)
+
+    :return: type: int
+    The minimax score of the position
+    """
+    # Check if last node
+    if is_win(bot_bits) or is_win(human_bits) or depth == 9:
+        return evaluate(bot_bits, human_bits, depth)
+
+    key = (bot_bits, human_bits, is_maximizing_player)
+    if key in solutions:
+        return solutions[key][0]
+
+    occupied = bot_bits | human_bits
+    best_score = -inf if is_maximizing_player else +inf
+    moves_mask = 0
+
+    # Loop possible moves in a single turn
+    for bit in BOX_BITS:
+        if not occupied & bit:
+            if is_maximizing_player:
+                score = solve_position(bot_bits | bit, human_bits, depth + 1, False, solutions)
+            else:
+                score = solve_position(bot_bits, human_bits | bit, depth + 1, True, solutions)
+
+            if score == best_score:
+                moves_mask |= bit
+            elif (score > best_score) == is_maximizing_player:
+                best_score = score
+                moves_mask = bit
+
+    solutions[key] = (best_score, moves_mask)
+
+    return best_score
+
+
+def get_bits_rank(bot_bits, human_bits):
+    """
+    Bitboard version of get_board_rank() in board.py
+
+    :param bot_bits: type: int
+    The bitboard of the bot
+
+    :param human_bits: type: int
+    The bitboard of the human
+
+    :return: type: int
+    The base 3 rank of the board
+    """
+    rank = 0
+
+    for index in reversed(range(9)):
+        rank *= 3
+        if bot_bits & BOX_BITS[index]:
+            rank += 2
+        elif human_bits & BOX_BITS[index]:
+            rank += 1
+
+    return rank
+
+
+def generate_move_table(path=MOVE_TABLE_PATH):
+    """
+    Solves every reachable position, with either player starting first, and writes the move table file.
+    The file is written to a temporary file first and then moved into place, so a reader never sees a partial table
+
+    :param path: type: str
+    Location of the table file
+
+    :return: type: int
+    The number of positions written into the table
+    """
+    solutions = {}
+
+    # Bot starts first & human starts first
+    solve_position(0, 0, 0, True, solutions)
+    solve_position(0, 0, 0, False, solutions)
+
+    table = np.zeros(TABLE_SIZE, dtype=RECORD_DTYPE)
+    for (bot_bits, human_bits, is_maximizing_player), (score, moves_mask) in solutions.items():
+        rank = get_bits_rank(bot_bits, human_bits)
+        if is_maximizing_player:
+            table[rank]['bot_score'], table[rank]['bot_moves'] = score, moves_mask
+        else:
+            table[rank]['human_score'], table[rank]['human_moves'] = score, moves_mask
+
+    temp_path = "{}.{}.tmp".format(path, os.getpid())
+    with open(temp_path, "wb") as file:
+        file.write(MAGIC)
+        file.write(table.tobytes())
+    os.replace(temp_path, path)
+
+    return len(solutions)
+
+
+def load_move_table(path=MOVE_TABLE_PATH):
+    """
+    Memory maps the move table file, the table file is generated first if it does not exist yet.
+
+    :param path: type: str
+    Location of the table file
+
+    :return: type: numpy.memmap
+    The move table, indexed by the base 3 rank of the board
+    """
+    if not os.path.exists(path):
+        generate_move_table(path)
+
+    # Integrity check for valid table file
+    with open(path, "rb") as file:
+        if file.read(len(MAGIC)) != MAGIC:
+            raise ValueError("{} is not a move table file".format(path))
+
+    return np.memmap(path, dtype=RECORD_DTYPE, mode="r", offset=len(MAGIC), shape=(TABLE_SIZE,))
+
+
+@lru_cache(maxsize=None)
+def get_move_table(path=MOVE_TABLE_PATH):
+    """
+    Loads the move table once and keeps it for the whole run of the application.
+
+    :param path: type: str
+    Location of the table file
+
+    :return: type: numpy.memmap
+    The move table, indexed by the base 3 rank of the board
+    """
+    return load_move_table(path)
+
+
+def lookup_move_table(board, is_maximizing_player, table=None):
+    """
+    Finds the minimax score and the optimal moves of the board with a single index lookup in the move table.
+
+    :param board: type: numpy.ndarray
+    The current state of the Tic Tac Toe board game
+
+    :param is_maximizing_player: type: bool
+    True if maximizing player's turn (Bot)
+    False if minimizing player's turn (Human)
+
+    :param table: type: numpy.memmap
+    The move table, defaults to the table from get_move_table()
+
+    :return: type: tuple if the position is in the table, else None
+    Contains the best minimax score and a list of moves that is derived from that score
+    None for positions that are finished, not reachable or not on a 3 by 3 board
+    """
+    if board.shape != (3, 3):
+        return None
+
+    if table is None:
+        table = get_move_table()
+
+    record = table[get_board_rank(board)]
+    if is_maximizing_player:
+        score, moves_mask = int(record['bot_score']), int(record['bot_moves'])
+    else:
+        score, moves_mask = int(record['human_score']), int(record['human_moves'])
+
+    if not moves_mask:
+        return None
+
+    return score, [divmod(index, 3) for index, bit in enumerate(BOX_BITS) if moves_mask & bit]
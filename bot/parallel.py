@@ -0,0 +1,252 @@
+"""
+    Parallel version of the bitboard search, the top of the decision tree is split across worker processes.
+
+    The moves at the top of the tree (and optionally the replies to them, and so on) are expanded by the main process,
+    and every position at the split depth is searched by a worker with the bitboard search. The scores are then merged
+    back up the top of the tree with plain minimax, giving the same result as bitboard_minimax().
+
+    Searching the top moves independently would lose the pruning between them, so the best score found so far at the
+    top of the tree is shared by all the workers. A worker reads the shared score when it starts a position and uses it
+    as the alpha bound (beta bound for the human), so positions searched later are still pruned.
+
+    The search window is kept 1 wider than the shared score, the same as BitboardSearch.search_root(), so that moves
+    tying with the best move are still found and all of the best moves are returned.
+"""
+
+import os
+import multiprocessing
+from math import inf
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from bot.bitboard import BitboardSearch, encode_board, is_win, evaluate, estimate, get_board_geometry, get_geometry
+from bot.move_ordering import get_static_priors
+
+# Best score at the top of the tree found so far, shared with the worker processes
+_shared_bound = None
+
+
+def init_worker(shared_bound):
+    """
+    Initializer of the worker processes, keeps the shared score at the top of the tree.
+
+    :param shared_bound: type: multiprocessing.Value
+    The best score at the top of the tree found so far
+    """
+    global _shared_bound
+    _shared_bound = shared_bound
+
+
+def search_split_position(bot_bits, human_bits, depth, is_maximizing_player, last_index, geometry_args, max_depth,
+                          is_root_maximizing_player):
+    """
+    Searches a position at the split depth, runs inside the worker processes.
+
+    :param bot_bits: type: int
+    The bitboard of the bot
+
+    :param human_bits: type: int
+    The bitboard of the human
+
+    :param depth: type: int
+    The depth of the position in the decision tree
+
+    :param is_maximizing_player: type: bool
+    True if maximizing player's turn (Bot)
+    False if minimizing player's turn (Human)
+
+    :param last_index: type: int
+    The box index of the last move made
+
+    :param geometry_args: type: tuple
+    The rows, columns & win length of the board
+
+    :param max_depth: type: int
+    Maximum number of moves to search ahead of the position, None to search until the end of the game
+
+    :param is_root_maximizing_player: type: bool
+    The player at the top of the tree, which decides how the shared score bounds the search
+
+    :return: type: tuple
+    Contains the score of the position and the number of nodes searched
+    The score is exact if it can tie or beat the shared score, otherwise it is only a bound
+    """
+    geometry = get_geometry(*geometry_args)
+    if max_depth == 0:
+        return estimate(bot_bits, human_bits, geometry), 0
+
+    bound = _shared_bound.value
+    if is_root_maximizing_player:
+        alpha, beta = bound - 1, +inf
+    else:
+        alpha, beta = -inf, bound + 1
+
+    bitboard_search = BitboardSearch(geometry, max_depth)
+    score = bitboard_search.search_subtree(bot_bits, human_bits, depth, is_maximizing_player, alpha, beta, last_index)
+
+    return score, bitboard_search.nodes
+
+
+def is_terminal(bot_bits, human_bits, depth, geometry):
+    """
+    Checks if the bitboards are won or full.
+    """
+    return is_win(bot_bits, geometry.win_masks) or is_win(human_bits, geometry.win_masks) or depth == geometry.size
+
+
+def expand_top(bot_bits, human_bits, depth, is_maximizing_player, geometry, split_depth, path=()):
+    """
+    Lists the positions at the split depth, the moves on the most winning combinations are listed first so that a good
+    shared score is found early.
+
+    :return: type: list
+    List of (path, bot_bits, human_bits, depth, is_maximizing_player) of every position to search, where path is the
+    tuple of box indexes of the moves from the top of the tree
+    """
+    if len(path) == split_depth or (path and is_terminal(bot_bits, human_bits, depth, geometry)):
+        return [(path, bot_bits, human_bits, depth, is_maximizing_player)]
+
+    priors = get_static_priors(geometry.rows, geometry.columns, geometry.win_length)
+    occupied = bot_bits | human_bits
+    indexes = sorted((index for index, bit in enumerate(geometry.box_bits) if not occupied & bit),
+                     key=lambda index: -priors[divmod(index, geometry.columns)])
+
+    positions = []
+    for index in indexes:
+        bit = geometry.box_bits[index]
+        if is_maximizing_player:
+            positions += expand_top(bot_bits | bit, human_bits, depth + 1, False, geometry, split_depth, path + (index,))
+        else:
+            positions += expand_top(bot_bits, human_bits | bit, depth + 1, True, geometry, split_depth, path + (index,))
+
+    return positions
+
+
+def merge_top(path, is_maximizing_player, scores):
+    """
+    Merges the scores of the positions at the split depth back up to the node at the end of path, with minimax.
+
+    :param path: type: tuple
+    Box indexes of the moves from the top of the tree to the node
+
+    :param is_maximizing_player: type: bool
+    True if maximizing player's turn (Bot) at the node
+
+    :param scores: type: dict
+    Dictionary of the paths of the positions searched mapped to their score
+
+    :return: type: float
+    The score of the node
+    """
+    if path in scores:
+        return scores[path]
+
+    children = {child[:len(path) + 1] for child in scores if child[:len(path)] == path}
+    child_scores = [merge_top(child, not is_maximizing_player, scores) for child in children]
+
+    return max(child_scores) if is_maximizing_player else min(child_scores)
+
+
+def parallel_search(board, depth, is_maximizing_player, win_length=None, workers=None, split_depth=1, max_depth=None):
+    """
+    Using the parallel bitboard search to find the optimal moves for the current state of the game.
+
+    :param board: type: numpy.ndarray
+    The current state of the Tic Tac Toe board game
+
+    :param depth: type: int
+    How deep the decision tree to search
+    The depth at the top of the tree is 0, as you go deeper, depth increases
+    Maximum depth is the number of boxes on the board, 9 on a 3 by 3 board
+
+    :param is_maximizing_player: type: bool
+    True if maximizing player's turn (Bot)
+    False if minimizing player's turn (Human)
+
+    :param win_length: type: int
+    Number of marks in a row required to win, defaults to the length of the shorter side of the board
+
+    :param workers: type: int
+    Number of worker processes, defaults to the number of processors
+    0 or 1 searches the positions in the current process
+
+    :param split_depth: type: int
+    Number of moves from the top of the tree expanded by the main process, 1 splits only the moves at the top of the
+    tree across the workers
+    Defaults to 1
+
+    :param max_depth: type: int
+    Maximum number of moves to search ahead, None to search until the end of the game
+
+    :return: type: tuple
+    Contains the best minimax score and a list of moves that is derived from that score
+    """
+    if split_depth < 1:
+        raise ValueError("Split depth must be at least 1")
+
+    geometry = get_board_geometry(board, win_length)
+    bot_bits, human_bits = encode_board(board)
+
+    # Check if last node
+    if is_terminal(bot_bits, human_bits, depth, geometry):
+        return evaluate(bot_bits, human_bits, depth, geometry), None
+
+    if max_depth is not None:
+        split_depth = min(split_depth, max_depth)
+    if workers is None:
+        workers = os.cpu_count() or 1
+
+    positions = expand_top(bot_bits, human_bits, depth, is_maximizing_player, geometry, split_depth)
+    shared_bound = multiprocessing.Value('d', -inf if is_maximizing_player else +inf)
+    geometry_args = (geometry.rows, geometry.columns, geometry.win_length)
+
+    # Number of positions left to search under every move at the top of the tree
+    remaining = {}
+    for path, *_ in positions:
+        remaining[path[0]] = remaining.get(path[0], 0) + 1
+
+    scores = {}
+
+    def record_score(path, score):
+        # Share the score of a move at the top of the tree once all the positions under it are searched
+        scores[path] = score
+        remaining[path[0]] -= 1
+
+        if not remaining[path[0]]:
+            top_score = merge_top(path[:1], not is_maximizing_player, scores)
+            with shared_bound.get_lock():
+                if (top_score > shared_bound.value) == is_maximizing_player:
+                    shared_bound.value = top_score
+
+    def get_task(position):
+        path, position_bot_bits, position_human_bits, position_depth, position_is_maximizing_player = position
+        if is_terminal(position_bot_bits, position_human_bits, position_depth, geometry):
+            return None
+
+        return (search_split_position, position_bot_bits, position_human_bits, position_depth,
+                position_is_maximizing_player, path[-1], geometry_args,
+                max_depth - len(path) if max_depth is not None else None, is_maximizing_player)
+
+    if workers <= 1:
+        init_worker(shared_bound)
+        for position in positions:
+            task = get_task(position)
+            score = task[0](*task[1:])[0] if task else evaluate(*position[1:4], geometry)
+            record_score(position[0], score)
+    else:
+        with ProcessPoolExecutor(max_workers=workers, initializer=init_worker, initargs=(shared_bound,)) as executor:
+            futures = {}
+            for position in positions:
+                task = get_task(position)
+                if task:
+                    futures[executor.submit(*task)] = position[0]
+                else:
+                    record_score(position[0], evaluate(*position[1:4], geometry))
+
+            # Share scores as soon as they are found, so positions starting later are pruned more
+            for future in as_completed(futures):
+                record_score(futures[future], future.result()[0])
+
+    top_scores = {index: merge_top((index,), not is_maximizing_player, scores) for index in remaining}
+    best_score = max(top_scores.values()) if is_maximizing_player else min(top_scores.values())
+    best_moves = sorted(divmod(index, geometry.columns) for index, score in top_scores.items() if score == best_score)
+
+    return best_score, best_moves
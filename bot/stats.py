@@ -0,0 +1,180 @@
+"""
+    Search statistics collector.
+
+    The search functions take an optional collector and record what they do into it: the nodes searched at every
+    depth, the positions evaluated, the alpha beta cutoffs along with the number of moves searched before each cutoff,
+    and the lookups of the transposition table.
+
+    Without a collector, the searches only pay for a single "is None" check per event, so the statistics cost nothing
+    when they are not asked for.
+"""
+
+from collections import Counter
+
+
+class SearchStats:
+    """
+    Search statistics class
+
+    Counters of a single search, or of many searches when the same collector is passed to all of them.
+    """
+    def __init__(self):
+        """
+        Constructor for SearchStats class.
+        """
+        self._nodes_per_depth = Counter()
+        self._evaluations = 0
+        self._cutoffs_per_depth = Counter()
+        self._cutoff_move_indexes = Counter()
+        self._table_probes = 0
+        self._table_hits = 0
+
+    # Getter & setter methods
+    @property
+    def nodes_per_depth(self):
+        return self._nodes_per_depth
+
+    @property
+    def nodes(self):
+        return sum(self._nodes_per_depth.values())
+
+    @property
+    def evaluations(self):
+        return self._evaluations
+
+    @property
+    def cutoffs_per_depth(self):
+        return self._cutoffs_per_depth
+
+    @property
+    def cutoffs(self):
+        return sum(self._cutoffs_per_depth.values())
+
+    @property
+    def cutoff_move_indexes(self):
+        return self._cutoff_move_indexes
+
+    @property
+    def table_probes(self):
+        return self._table_probes
+
+    @property
+    def table_hits(self):
+        return self._table_hits
+
+    def record_node(self, depth):
+        """
+        Records a node searched.
+
+        :param depth: type: int
+        The depth of the node in the decision tree
+        """
+        self._nodes_per_depth[depth] += 1
+
+    def record_evaluation(self):
+        """
+        Records a position scored without searching any deeper, because it is finished or at the depth limit.
+        """
+        self._evaluations += 1
+
+    def record_cutoff(self, depth, move_index):
+        """
+        Records an alpha beta cutoff.
+
+        :param depth: type: int
+        The depth of the node in the decision tree
+
+        :param move_index: type: int
+        The index of the move that caused the cutoff in the order the moves were searched, 0 for the first move
+        The closer to 0, the better the move ordering
+        """
+        self._cutoffs_per_depth[depth] += 1
+        self._cutoff_move_indexes[move_index] += 1
+
+    def record_probe(self, is_hit):
+        """
+        Records a lookup of the transposition table.
+
+        :param is_hit: type: bool
+        True if the position was found in the table
+        """
+        self._table_probes += 1
+        if is_hit:
+            self._table_hits += 1
+
+    def merge(self, other):
+        """
+        Adds the counters of another collector to this collector.
+
+        :param other: type: SearchStats
+        The other collector
+        """
+        self._nodes_per_depth.update(other.nodes_per_depth)
+        self._evaluations += other.evaluations
+        self._cutoffs_per_depth.update(other.cutoffs_per_depth)
+        self._cutoff_move_indexes.update(other.cutoff_move_indexes)
+        self._table_probes += other.table_probes
+        self._table_hits += other.table_hits
+
+    def to_dict(self):
+        """
+        Collates the counters in a JSON friendly format.
+
+        :return: type: dict
+        Dictionary of the counters, counters by depth or move index are lists indexed by the depth or move index
+        """
+        def to_list(counter):
+            return [counter[index] for index in range(max(counter) + 1)] if counter else []
+
+        return {
+            'nodes': self.nodes,
+            'nodes_per_depth': to_list(self._nodes_per_depth),
+            'evaluations': self._evaluations,
+            'cutoffs': self.cutoffs,
+            'cutoffs_per_depth': to_list(self._cutoffs_per_depth),
+            'cutoff_move_indexes': to_list(self._cutoff_move_indexes),
+            'table_probes': self._table_probes,
+            'table_hits': self._table_hits
+        }
+
+    @classmethod
+    def from_dict(cls, counters):
+        """
+        Rebuilds a collector from the counters of to_dict(), such as counters loaded from JSON.
+
+        :param counters: type: dict
+        Dictionary of the counters returned by to_dict()
+
+        :return: type: SearchStats
+        The collector holding the counters
+        """
+        stats = cls()
+        stats._nodes_per_depth.update(dict(enumerate(counters['nodes_per_depth'])))
+        stats._evaluations = counters['evaluations']
+        stats._cutoffs_per_depth.update(dict(enumerate(counters['cutoffs_per_depth'])))
+        stats._cutoff_move_indexes.update(dict(enumerate(counters['cutoff_move_indexes'])))
+        stats._table_probes = counters['table_probes']
+        stats._table_hits = counters['table_hits']
+
+        return stats
+
+    def summary(self):
+        """
+        Describes the counters in a few lines of text.
+
+        :return: type: str
+        The description of the counters
+        """
+        stats = self.to_dict()
+        lines = [
+            "Nodes: {}, Evaluations: {}, Cutoffs: {}".format(stats['nodes'], stats['evaluations'], stats['cutoffs']),
+            "Nodes per depth: {}".format(stats['nodes_per_depth']),
+            "Cutoffs per depth: {}".format(stats['cutoffs_per_depth']),
+            "Cutoffs per move index: {}".format(stats['cutoff_move_indexes'])
+        ]
+
+        if self._table_probes:
+            lines.append("Table hits: {} out of {} probes ({:.1%})".format(self._table_hits, self._table_probes,
+                                                                          self._table_hits / self._table_probes))
+
+        return "\n".join(lines)
@@ -0,0 +1,204 @@
+"""
+    Transposition table for the minimax algorithm.
+
+    Different orders of moves can lead to the same board, which means the decision tree contains the same position many
+    times over. A transposition table remembers the result of every position searched, so that a position reached again
+    by a different order of moves does not have to be searched a second time.
+
+    With alpha beta pruning, the score of a position is not always exact. When a branch is pruned, the score is only a
+    bound of the real score, so every entry records whether its score is exact, a lower bound or an upper bound.
+
+    The score of a position only depends on the board itself, as the depth is the number of moves on the board. Entries
+    stay valid across searches and across games, so a single table can be kept for the whole run of the application.
+
+    Optionally, positions can be keyed on their canonical board (See game/symmetry.py), so that all rotations and
+    reflections of a board share a single entry.
+"""
+
+from collections import OrderedDict, namedtuple
+from game.symmetry import get_canonical_rank, transform_move, inverse_transform_move
+
+# Bound types of the score in an entry
+EXACT = 0
+LOWER_BOUND = 1
+UPPER_BOUND = 2
+
+# Default maximum number of entries kept in a table
+DEFAULT_MAX_ENTRIES = 100000
+
+TableEntry = namedtuple("TableEntry", ["score", "bound", "depth", "best_moves"])
+
+
+class TranspositionTable:
+    """
+    Transposition table class
+
+    Stores search results keyed by the board. Once the table is full, the least recently used entry is evicted to make
+    space for the new entry.
+    """
+    def __init__(self, max_entries=DEFAULT_MAX_ENTRIES, symmetry=False):
+        """
+        Constructor for TranspositionTable class.
+
+        :param max_entries: type: int
+        Maximum number of entries kept in the table before entries are evicted
+
+        :param symmetry: type: bool
+        True to key positions on their canonical board, so that symmetric boards share the same entry
+        Defaults to False
+        """
+        if max_entries < 1:
+            raise ValueError("Maximum number of entries must be at least 1")
+
+        self._max_entries = max_entries
+        self._symmetry = symmetry
+        self._entries = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    # Getter & setter methods
+    @property
+    def max_entries(self):
+        return self._max_entries
+
+    @property
+    def symmetry(self):
+        return self._symmetry
+
+    @property
+    def hits(self):
+        return self._hits
+
+    @property
+    def misses(self):
+        return self._misses
+
+    @property
+    def evictions(self):
+        return self._evictions
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get_key(self, board, depth, is_maximizing_player):
+        """
+        Hashes the position into a key for the table.
+
+        :param board: type: numpy.ndarray
+        The current state of the Tic Tac Toe board game
+
+        :param depth: type: int
+        The depth of the node in the decision tree
+
+        :param is_maximizing_player: type: bool
+        True if maximizing player's turn (Bot)
+        False if minimizing player's turn (Human)
+
+        :return: type: tuple
+        Contains the key of the position and the transform number that turns the board into the canonical board
+        The transform number is always 0 (identity) when symmetry is turned off
+        """
+        if self._symmetry:
+            rank, transform = get_canonical_rank(board)
+            return (board.shape, rank, depth, is_maximizing_player), transform
+
+        # Boards of different shapes with the same number of boxes have the same bytes
+        return (board.shape, board.tobytes(), depth, is_maximizing_player), 0
+
+    def probe(self, board, depth, is_maximizing_player):
+        """
+        Looks up the position in the table.
+
+        :param board: type: numpy.ndarray
+        The current state of the Tic Tac Toe board game
+
+        :param depth: type: int
+        The depth of the node in the decision tree
+
+        :param is_maximizing_player: type: bool
+        True if maximizing player's turn (Bot)
+        False if minimizing player's turn (Human)
+
+        :return: type: TableEntry if found, else None
+        The stored entry of the position
+        """
+        key, transform = self.get_key(board, depth, is_maximizing_player)
+        entry = self._entries.get(key)
+
+        if entry is None:
+            self._misses += 1
+            return None
+
+        # Mark entry as recently used
+        self._entries.move_to_end(key)
+        self._hits += 1
+
+        if transform and entry.best_moves:
+            # Map moves from the canonical board back to the board
+            best_moves = sorted(inverse_transform_move(move, transform, board.shape) for move in entry.best_moves)
+            return entry._replace(best_moves=tuple(best_moves))
+
+        return entry
+
+    def store(self, board, depth, is_maximizing_player, score, bound, best_moves):
+        """
+        Stores the search result of the position in the table, evicting the least recently used entry if the table is
+        full.
+
+        :param board: type: numpy.ndarray
+        The current state of the Tic Tac Toe board game
+
+        :param depth: type: int
+        The depth of the node in the decision tree
+
+        :param is_maximizing_player: type: bool
+        True if maximizing player's turn (Bot)
+        False if minimizing player's turn (Human)
+
+        :param score: type: int
+        The minimax score of the position
+
+        :param bound: type: int
+        Whether the score is EXACT, a LOWER_BOUND or an UPPER_BOUND of the real score
+
+        :param best_moves: type: list
+        List of moves that is derived from the score
+        """
+        key, transform = self.get_key(board, depth, is_maximizing_player)
+
+        if transform and best_moves:
+            # Map moves from the board to the canonical board
+            best_moves = sorted(transform_move(move, transform, board.shape) for move in best_moves)
+
+        if key in self._entries:
+            self._entries.move_to_end(key)
+        elif len(self._entries) >= self._max_entries:
+            # Evict least recently used entry
+            self._entries.popitem(last=False)
+            self._evictions += 1
+
+        self._entries[key] = TableEntry(score, bound, depth, tuple(best_moves) if best_moves else best_moves)
+
+    def clear(self):
+        """
+        Removes all entries and resets the counters of the table.
+        """
+        self._entries.clear()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def get_stats(self):
+        """
+        Collates the counters of the table.
+
+        :return: type: dict
+        Dictionary containing the number of entries, hits, misses and evictions of the table
+        """
+        return {
+            'entries': len(self._entries),
+            'hits': self._hits,
+            'misses': self._misses,
+            'evictions': self._evictions
+        }
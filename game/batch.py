@@ -0,0 +1,177 @@
+"""
+    Contain vectorized versions of the board functions in board.py, which work on a whole stack of boards at once.
+
+    A stack of boards is a numpy array of shape (N, rows, columns), or of shape (N, rows * columns) with the boards
+    flattened row by row. Compact boards (See COMPACT_DTYPE in board.py) keep a stack of a million 3 by 3 boards under
+    10 MB.
+
+    Every winning combination is precomputed as a row of box indexes in a line index matrix. Indexing the flattened
+    stack with the matrix gathers the boxes of every winning combination of every board in a single operation, so no
+    board is ever looped over in Python.
+"""
+
+import numpy as np
+from functools import lru_cache
+from game.board import BLANK_STATE, get_winning_lines
+
+
+@lru_cache(maxsize=None)
+def get_line_index_matrix(rows, columns, win_length):
+    """
+    Precomputes the line index matrix of a board, where every row holds the flat box indexes of a winning combination.
+    Rows are in the same order as get_winning_lines() in board.py
+
+    :param rows: type: int
+    Number of rows of the board
+
+    :param columns: type: int
+    Number of columns of the board
+
+    :param win_length: type: int
+    Number of marks in a row required to win
+
+    :return: type: numpy.ndarray
+    Read only array of shape (number of winning combinations, win_length)
+    """
+    matrix = np.array([[row * columns + box for row, box in line]
+                       for line in get_winning_lines(rows, columns, win_length)], dtype=np.intp)
+    matrix.flags.writeable = False
+
+    return matrix
+
+
+def flatten_boards(boards, shape=(3, 3)):
+    """
+    Converts a stack of boards into a stack of flattened boards.
+
+    :param boards: type: numpy.ndarray
+    Stack of boards of shape (N, rows, columns) or (N, rows * columns)
+
+    :param shape: type: tuple
+    The number of rows & columns of the boards, only used for a stack of flattened boards
+    Defaults to a 3 by 3 board
+
+    :return: type: tuple
+    Contains the stack of flattened boards of shape (N, rows * columns) and the shape of the boards
+    """
+    boards = np.asarray(boards)
+
+    if boards.ndim == 3:
+        return boards.reshape(len(boards), -1), boards.shape[1:]
+    elif boards.ndim == 2 and boards.shape[1] == shape[0] * shape[1]:
+        return boards, tuple(shape)
+
+    raise ValueError("Boards must be a stack of shape (N, rows, columns) or (N, rows * columns)")
+
+
+def batch_get_winner(boards, win_length=None, shape=(3, 3)):
+    """
+    Vectorized version of get_winner() in board.py
+
+    :param boards: type: numpy.ndarray
+    Stack of boards of shape (N, rows, columns) or (N, rows * columns)
+
+    :param win_length: type: int
+    Number of marks in a row required to win, defaults to the length of the shorter side of the board
+
+    :param shape: type: tuple
+    The number of rows & columns of the boards, only used for a stack of flattened boards
+    Defaults to a 3 by 3 board
+
+    :return: type: numpy.ndarray
+    Array of shape (N,) with the state of the winning player of every board, BLANK_STATE if there is no winner
+    """
+    flat_boards, (rows, columns) = flatten_boards(boards, shape)
+    matrix = get_line_index_matrix(rows, columns, win_length if win_length is not None else min(rows, columns))
+
+    # Boxes of every winning combination of every board, shape (N, number of winning combinations, win_length)
+    lines = flat_boards[:, matrix]
+    first_boxes = lines[:, :, 0]
+    is_won = (first_boxes != BLANK_STATE) & (lines == first_boxes[:, :, np.newaxis]).all(axis=2)
+
+    # State of the first winning combination, the same combination get_winner() finds
+    first_won = is_won.argmax(axis=1)
+    winners = first_boxes[np.arange(len(flat_boards)), first_won]
+
+    return np.where(is_won.any(axis=1), winners, BLANK_STATE).astype(flat_boards.dtype)
+
+
+def batch_win_check(boards, win_length=None, shape=(3, 3)):
+    """
+    Vectorized version of win_check() in board.py
+
+    :param boards: type: numpy.ndarray
+    Stack of boards of shape (N, rows, columns) or (N, rows * columns)
+
+    :param win_length: type: int
+    Number of marks in a row required to win, defaults to the length of the shorter side of the board
+
+    :param shape: type: tuple
+    The number of rows & columns of the boards, only used for a stack of flattened boards
+    Defaults to a 3 by 3 board
+
+    :return: type: numpy.ndarray
+    Boolean array of shape (N,), True where a winning combination is found
+    """
+    return batch_get_winner(boards, win_length, shape) != BLANK_STATE
+
+
+def batch_is_board_full(boards, shape=(3, 3)):
+    """
+    Vectorized version of is_board_full() in board.py
+
+    :param boards: type: numpy.ndarray
+    Stack of boards of shape (N, rows, columns) or (N, rows * columns)
+
+    :param shape: type: tuple
+    The number of rows & columns of the boards, only used for a stack of flattened boards
+    Defaults to a 3 by 3 board
+
+    :return: type: numpy.ndarray
+    Boolean array of shape (N,), True where no moves are available
+    """
+    flat_boards, _ = flatten_boards(boards, shape)
+
+    return (flat_boards != BLANK_STATE).all(axis=1)
+
+
+def batch_get_turn_number(boards, shape=(3, 3)):
+    """
+    Vectorized version of get_turn_number() in board.py
+
+    :param boards: type: numpy.ndarray
+    Stack of boards of shape (N, rows, columns) or (N, rows * columns)
+
+    :param shape: type: tuple
+    The number of rows & columns of the boards, only used for a stack of flattened boards
+    Defaults to a 3 by 3 board
+
+    :return: type: numpy.ndarray
+    Array of shape (N,) with the number of moves on every board
+    """
+    flat_boards, _ = flatten_boards(boards, shape)
+
+    return np.count_nonzero(flat_boards != BLANK_STATE, axis=1)
+
+
+def batch_evaluate(boards, win_length=None, shape=(3, 3)):
+    """
+    Finds the winner and whether the game is over for every board of the stack in one pass.
+
+    :param boards: type: numpy.ndarray
+    Stack of boards of shape (N, rows, columns) or (N, rows * columns)
+
+    :param win_length: type: int
+    Number of marks in a row required to win, defaults to the length of the shorter side of the board
+
+    :param shape: type: tuple
+    The number of rows & columns of the boards, only used for a stack of flattened boards
+    Defaults to a 3 by 3 board
+
+    :return: type: tuple
+    Contains the array of winners (BLANK_STATE if there is no winner) and the boolean array of terminal boards, where
+    the board is won or full
+    """
+    winners = batch_get_winner(boards, win_length, shape)
+
+    return winners, (winners != BLANK_STATE) | batch_is_board_full(boards, shape)
@@ -5,20 +5,125 @@
 
 import numpy as np
 from copy import deepcopy
+from functools import lru_cache
 
 BLANK_STATE = 0
 HUMAN_STATE = 1
 BOT_STATE = 2
 
+# Smallest data type that holds every state, used for compact boards
+COMPACT_DTYPE = np.int8
 
-def create_board():
+
+def create_board(rows=3, columns=3, compact=False):
     """
-    Creates a 3 by 3 numpy array containing BLANK_STATE.
+    Creates a rows by columns numpy array containing BLANK_STATE.
+
+    :param rows: type: int
+    Number of rows of the board
+    Defaults to 3
+
+    :param columns: type: int
+    Number of columns of the board
+    Defaults to 3
+
+    :param compact: type: bool
+    True to store the board as COMPACT_DTYPE (1 byte per box) instead of int (8 bytes per box)
+    Defaults to False
 
     :return: type: numpy.ndarray
     A blank Tic Tac Toe board represented using numpy array
     """
-    return np.full((3, 3), BLANK_STATE, dtype=int)
+    return np.full((rows, columns), BLANK_STATE, dtype=COMPACT_DTYPE if compact else int)
+
+
+def get_win_length(board, win_length=None):
+    """
+    Finds the number of marks in a row required to win the game on the board.
+
+    :param board: type: numpy.ndarray
+    The current state of the Tic Tac Toe board game
+
+    :param win_length: type: int
+    Number of marks in a row required to win, None to use the default
+
+    :return: type: int
+    The given win length, else the default which is the length of the shorter side of the board
+    """
+    return win_length if win_length is not None else min(board.shape)
+
+
+@lru_cache(maxsize=None)
+def get_winning_lines(rows, columns, win_length):
+    """
+    Precomputes every winning combination of a board, a winning combination is any straight line of win_length boxes.
+    Lines are ordered by straight rows, vertical columns, diagonals of \\ type and diagonals of / type.
+
+    :param rows: type: int
+    Number of rows of the board
+
+    :param columns: type: int
+    Number of columns of the board
+
+    :param win_length: type: int
+    Number of marks in a row required to win
+
+    :return: type: tuple
+    Tuple of winning combinations, each combination is a tuple of indexes in numpy array format
+    """
+    if not 1 <= win_length <= max(rows, columns):
+        raise ValueError("Win length must be between 1 and the length of the longer side of the board")
+
+    lines = []
+
+    # Straight rows
+    for row in range(rows):
+        for start in range(columns - win_length + 1):
+            lines.append(tuple((row, start + offset) for offset in range(win_length)))
+
+    # Vertical columns
+    for col in range(columns):
+        for start in range(rows - win_length + 1):
+            lines.append(tuple((start + offset, col) for offset in range(win_length)))
+
+    # Diagonal \ type
+    for row in range(rows - win_length + 1):
+        for col in range(columns - win_length + 1):
+            lines.append(tuple((row + offset, col + offset) for offset in range(win_length)))
+
+    # Diagonal / type
+    for row in range(rows - win_length + 1):
+        for col in range(win_length - 1, columns):
+            lines.append(tuple((row + offset, col - offset) for offset in range(win_length)))
+
+    return tuple(lines)
+
+
+@lru_cache(maxsize=None)
+def get_lines_through_boxes(rows, columns, win_length):
+    """
+    Groups the winning combinations of a board by the boxes they go through.
+
+    :param rows: type: int
+    Number of rows of the board
+
+    :param columns: type: int
+    Number of columns of the board
+
+    :param win_length: type: int
+    Number of marks in a row required to win
+
+    :return: type: dict
+    Dictionary of box indexes in numpy array format (<row_index>, <column_index>) mapped to a tuple of the winning
+    combinations that go through the box
+    """
+    lines_through_boxes = {(row, box): [] for row in range(rows) for box in range(columns)}
+
+    for line in get_winning_lines(rows, columns, win_length):
+        for move in line:
+            lines_through_boxes[move].append(line)
+
+    return {move: tuple(lines) for move, lines in lines_through_boxes.items()}
 
 
 def get_possible_moves(board):
@@ -44,68 +149,101 @@ def get_possible_moves(board):
     return moves
 
 
-def win_check(board):
+def get_winner(board, win_length=None):
     """
-    Checks the board for any winning combinations.
+    Checks the board for any winning combinations and return the state of the player that won.
 
     :param board: type: numpy.ndarray
     The current state of the Tic Tac Toe board game
 
-    :return: type: bool
-    True if winning combination is found, else False
+    :param win_length: type: int
+    Number of marks in a row required to win, defaults to the length of the shorter side of the board
+
+    :return: type: int if winning combination is found, else None
+    The state of the winning player, HUMAN_STATE or BOT_STATE
     """
-    # Straight row win
-    for row in board:
-        if all(box == HUMAN_STATE for box in row) or all(box == BOT_STATE for box in row):
-            return True
+    index = get_winning_combination_index(board, win_length)
 
-    # Vertical column win
-    for col in zip(*board):
-        if all(box == HUMAN_STATE for box in col) or all(box == BOT_STATE for box in col):
-            return True
+    if index is None:
+        return None
 
-    # Diagonal win \ type
-    if all([board[index][index] == HUMAN_STATE for index in range(len(board))]) or \
-            all([board[index][index] == BOT_STATE for index in range(len(board))]):
-        return True
+    return board[index[0]]
 
-    # Diagonal win / type
-    if all([board[index][-(index + 1)] == HUMAN_STATE for index in range(len(board))]) or \
-            all([board[index][-(index + 1)] == BOT_STATE for index in range(len(board))]):
-        return True
 
-    return False
+def get_move_winner(board, move, win_length=None, previous_winner=None):
+    """
+    Incremental version of get_winner(), only a winning combination through the last move can be new, so only the
+    row, column and diagonals through the last move are checked instead of the whole board.
+
+    :param board: type: numpy.ndarray
+    The current state of the Tic Tac Toe board game, after the last move
+
+    :param move: type: tuple or list
+    The last move made on the board
+    Move index is in numpy array format (<row_index>, <column_index>)
+
+    :param win_length: type: int
+    Number of marks in a row required to win, defaults to the length of the shorter side of the board
+
+    :param previous_winner: type: int
+    The state of the winning player of the board before the last move, None if there was no winner
+
+    :return: type: int if winning combination is found, else None
+    The state of the winning player, HUMAN_STATE or BOT_STATE
+    """
+    # A won board stays won
+    if previous_winner is not None:
+        return previous_winner
+
+    state = board.item(move[0], move[1])
+    if state == BLANK_STATE:
+        return None
+
+    for line in get_lines_through_boxes(*board.shape, get_win_length(board, win_length))[tuple(move)]:
+        if all(board.item(row, box) == state for row, box in line):
+            return state
+
+    return None
 
 
-def get_winning_combination_index(board):
+def win_check(board, win_length=None):
+    """
+    Checks the board for any winning combinations.
+
+    :param board: type: numpy.ndarray
+    The current state of the Tic Tac Toe board game
+
+    :param win_length: type: int
+    Number of marks in a row required to win, defaults to the length of the shorter side of the board
+
+    :return: type: bool
+    True if winning combination is found, else False
+    """
+    return get_winning_combination_index(board, win_length) is not None
+
+
+def get_winning_combination_index(board, win_length=None):
     """
     Checks the board for any winning combinations and return the index of the winning indexes.
 
     :param board: type: numpy.ndarray
     The current state of the Tic Tac Toe board game
 
+    :param win_length: type: int
+    Number of marks in a row required to win, defaults to the length of the shorter side of the board
+
     :return: type: list
     List of winning indexes
     """
-    # Straight row win
-    for row_index, row in enumerate(board, start=0):
-        if all(box == HUMAN_STATE for box in row) or all(box == BOT_STATE for box in row):
-            return [(row_index, box_index) for box_index in range(0, 3)]
-
-    # Vertical column win
-    for col_index, col in enumerate(zip(*board), start=0):
-        if all(box == HUMAN_STATE for box in col) or all(box == BOT_STATE for box in col):
-            return [(row_index, col_index) for row_index in range(0, 3)]
+    # Convert numpy array into python list, indexing a list is much faster
+    boxes = board.tolist()
 
-    # Diagonal win \ type
-    if all([board[index][index] == HUMAN_STATE for index in range(len(board))]) or \
-            all([board[index][index] == BOT_STATE for index in range(len(board))]):
-        return [(index, index) for index in range(0, 3)]
+    for line in get_winning_lines(*board.shape, get_win_length(board, win_length)):
+        first_row, first_box = line[0]
+        state = boxes[first_row][first_box]
 
-    # Diagonal win / type
-    if all([board[index][-(index + 1)] == HUMAN_STATE for index in range(len(board))]) or \
-            all([board[index][-(index + 1)] == BOT_STATE for index in range(len(board))]):
-        return [(row_index, box_index) for row_index, box_index in zip(range(0, 3), reversed(range(0, 3)))]
+        if state != BLANK_STATE and all(boxes[row][box] == state for row, box in line):
+            return list(line)
 
     return None
 
@@ -130,6 +268,27 @@ def get_turn_number(board):
     return num_moves
 
 
+def get_board_rank(board):
+    """
+    Ranks the board as a base 3 number, where each box is a digit holding its state (0 or 1 or 2).
+    The first box of the board is the least significant digit.
+
+    Every board has a unique rank, which makes the rank useful as a compact key or index of the board
+
+    :param board: type: numpy.ndarray
+    The current state of the Tic Tac Toe board game
+
+    :return: type: int
+    The base 3 rank of the board
+    """
+    rank = 0
+
+    for box in reversed(board.ravel().tolist()):
+        rank = rank * 3 + box
+
+    return rank
+
+
 def is_board_full(board):
     """
     Check if the board is full, where no moves are available. (Terminal state)
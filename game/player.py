@@ -4,9 +4,13 @@
     Handles everything related to move selection by the bot or the human player.
 """
 
-from bot.minimax import minimax_soft_alpha_beta, get_depth
+from bot.move_table import lookup_move_table
+from bot.minimax import get_depth, iterative_deepening
+from bot.engines import get_engine, TIME_BUDGET_ENGINES, MAX_DEPTH_ENGINES
+from bot.mcts import MonteCarloTreeSearch
+from bot.stats import SearchStats
+from game.board import get_win_length, BOT_STATE
 import random
-from math import inf
 
 
 class Player:
@@ -15,7 +19,8 @@ class Player:
 
     A player can be a human or bot.
     """
-    def __init__(self, bot, state, mark):
+    def __init__(self, bot, state, mark, win_length=None, max_depth=None, time_budget=None, engine=None,
+                 print_stats=False):
         """
         Constructor for Person class.
 
@@ -30,10 +35,50 @@ class Player:
 
         :param mark: type: str
         String representing the player's mark. (Noughts or crosses) (X or O)
+
+        :param win_length: type: int
+        Number of marks in a row required to win, defaults to the length of the shorter side of the board
+
+        :param max_depth: type: int
+        Maximum number of moves the bot searches ahead, None to search until the end of the game
+        Use on large boards where a full search is not possible
+
+        :param time_budget: type: float
+        Maximum number of seconds the bot searches for a single move, None for no limit
+        The best move of the deepest search completed within the time budget is played
+
+        :param engine: type: str or function
+        Name of the engine the bot uses to find its moves (See bot/engines.py), or an engine function
+        None to look up the move table and search with iterative deepening when the position is not in the table
+        "mcts" keeps the tree of the Monte Carlo tree search between moves and searches for the whole time budget
+        Only the engines in TIME_BUDGET_ENGINES & MAX_DEPTH_ENGINES can be given a time budget & a maximum depth
+
+        :param print_stats: type: bool
+        True to print the search statistics of every move of the bot (See bot/stats.py)
+        Defaults to False
         """
         self._bot = bot
         self._state = state
         self._mark = mark
+        self._win_length = win_length
+        self._max_depth = max_depth
+        self._time_budget = time_budget
+        if engine is not None:
+            # The engines are called without the limits, so the engines that search the whole tree cannot honour them
+            get_engine(engine)
+            if time_budget is not None and engine not in TIME_BUDGET_ENGINES:
+                raise ValueError("Engine {} cannot stay within a time budget, must be one of {} or None".format(
+                    engine, ", ".join(TIME_BUDGET_ENGINES)))
+            if max_depth is not None and engine not in MAX_DEPTH_ENGINES:
+                raise ValueError("Engine {} cannot stay within a maximum depth, must be one of {} or None".format(
+                    engine, ", ".join(MAX_DEPTH_ENGINES)))
+
+        if engine == "mcts":
+            # Own search, so the tree is kept between the moves of the bot
+            self._engine = MonteCarloTreeSearch(time_budget=time_budget)
+        else:
+            self._engine = get_engine(engine) if engine is not None else None
+        self._print_stats = print_stats
 
     @property
     def bot(self):
@@ -47,6 +92,10 @@ class Player:
     def mark(self):
         return self._mark
 
+    @property
+    def win_length(self):
+        return self._win_length
+
     @staticmethod
     def convert_index_to_move(index):
         """
@@ -72,21 +121,51 @@ class Player:
 
         return index_to_move_dict[index]
 
-    def make_move(self, board):
+    def make_move(self, board, stats=None):
         """
-        Calls the minimax algorithm if the player is a bot, else request user input for human player.
+        Looks up the move table if the player is a bot, else request user input for human player.
+        The minimax algorithm is only called for positions that are not in the move table.
 
         :param board: type: numpy.ndarray
         The current state of the Tic Tac Toe board game
         Input for the minimax algorithm to find the optimal move
 
+        :param stats: type: bot.stats.SearchStats
+        Optional collector of the search statistics of the bot's move, None to not collect any
+        Move table lookups do not search, so they leave the collector untouched
+
         :return: type: tuple
         Selected move index in numpy array format (<row_index>, <column_index>)
         """
         if self._bot:
-            # Minimax algorithm
-            _, moves = minimax_soft_alpha_beta(board, get_depth(board), True, -inf, +inf)
+            # A bot playing the human's state plays as the minimizing player
+            is_maximizing_player = self._state == BOT_STATE
+            moves = None
+
+            if stats is None and self._print_stats:
+                stats = SearchStats()
+
+            if self._engine is not None:
+                _, moves = self._engine(board, is_maximizing_player, self._win_length, stats)
+            elif get_win_length(board, self._win_length) == 3:
+                # Perfect play move table lookup, only covers the 3 by 3 board
+                result = lookup_move_table(board, is_maximizing_player)
+                if result is not None:
+                    _, moves = result
+
+            if moves is None:
+                # Position not in table, use minimax algorithm with iterative deepening to stay within time budget
+                _, moves, _ = iterative_deepening(board, get_depth(board), is_maximizing_player, self._win_length,
+                                                  time_limit=self._time_budget, max_depth=self._max_depth,
+                                                  stats=stats)
+
             move = random.choice(moves)
+
+            if self._print_stats:
+                print(stats.summary())
+                if isinstance(self._engine, MonteCarloTreeSearch):
+                    print("Playouts: {}, {:.0f} playouts per second".format(self._engine.last_playouts,
+                                                                            self._engine.playouts_per_second))
         else:
             # Prompt the user to select a move
             index = input("Enter move: ")
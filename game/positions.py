@@ -0,0 +1,145 @@
+"""
+    Streaming enumeration of the positions of a game.
+
+    A position after n moves holds ceil(n / 2) marks of the player that had the first move and floor(n / 2) marks of
+    the other player. Any such board without a winning combination can be reached by playing its marks in any order,
+    as no line can be completed along the way. A board with a winning combination is a finished game, so it is never
+    yielded, and all the boards that add marks to a won line are skipped without being looked at.
+
+    Positions are worked out on bitboards (See bot/bitboard.py) and streamed one at a time, so no list of boards is
+    ever built and no board is ever copied. The positions can be streamed in three forms:
+    - iter_position_bits() yields the pair of bitboards, the most compact form
+    - iter_positions() yields a numpy array board, which is the same array every time, updated in place
+    - iter_position_ranks() yields the base 3 rank of the board (See get_board_rank() in board.py)
+
+    Positions are always streamed in the same order, and symmetric duplicates (See symmetry.py) can be skipped, keeping
+    the first board of every group of symmetric boards.
+"""
+
+from itertools import combinations
+from bot.bitboard import get_geometry, is_win
+from game.board import BLANK_STATE, HUMAN_STATE, BOT_STATE, create_board
+from game.symmetry import canonicalize_bits
+
+
+def iter_position_bits(turn_num, first_state, rows=3, columns=3, win_length=None, unique=False, include_draws=False):
+    """
+    Streams the positions of a turn number as bitboards.
+
+    :param turn_num: type: int
+    The number of moves on the board
+
+    :param first_state: type: int
+    The state of the player that had the first move, HUMAN_STATE or BOT_STATE
+
+    :param rows: type: int
+    Number of rows of the board
+
+    :param columns: type: int
+    Number of columns of the board
+
+    :param win_length: type: int
+    Number of marks in a row required to win, defaults to the length of the shorter side of the board
+
+    :param unique: type: bool
+    True to only yield one board out of every group of symmetric boards (rotations & reflections)
+    Defaults to False
+
+    :param include_draws: type: bool
+    True to also yield the full boards without a winner, which are finished games
+    Defaults to False
+
+    :return: type: generator
+    Yields the bitboard of the bot and the bitboard of the human of every position
+    """
+    size = rows * columns
+    if turn_num < 0 or turn_num > size:
+        raise ValueError("Turn number must be between 0 and {}".format(size))
+    if first_state not in (HUMAN_STATE, BOT_STATE):
+        raise ValueError("First state must be {} or {}".format(HUMAN_STATE, BOT_STATE))
+
+    if turn_num == size and not include_draws:
+        return
+
+    geometry = get_geometry(rows, columns, win_length if win_length is not None else min(rows, columns))
+    box_bits = geometry.box_bits
+    win_masks = geometry.win_masks
+    canonical_ranks = set() if unique else None
+
+    # The marks of the player that made the last move are placed first, then the marks of the other player
+    last_state = first_state if turn_num % 2 else HUMAN_STATE + BOT_STATE - first_state
+    last_count = (turn_num + 1) // 2
+
+    for last_boxes in combinations(range(size), last_count):
+        last_bits = sum(box_bits[index] for index in last_boxes)
+        if is_win(last_bits, win_masks):
+            continue
+
+        free_boxes = [index for index in range(size) if not last_bits & box_bits[index]]
+        for other_boxes in combinations(free_boxes, turn_num - last_count):
+            other_bits = sum(box_bits[index] for index in other_boxes)
+            if is_win(other_bits, win_masks):
+                continue
+
+            bot_bits, human_bits = (last_bits, other_bits) if last_state == BOT_STATE else (other_bits, last_bits)
+
+            if canonical_ranks is not None:
+                # Skip boards symmetric to a board already yielded
+                rank = canonicalize_bits(bot_bits, human_bits, (rows, columns))[2]
+                if rank in canonical_ranks:
+                    continue
+                canonical_ranks.add(rank)
+
+            yield bot_bits, human_bits
+
+
+def iter_positions(turn_num, first_state, rows=3, columns=3, win_length=None, unique=False, include_draws=False,
+                   compact=False):
+    """
+    Streams the positions of a turn number as numpy array boards.
+
+    The same board is yielded every time, updated in place for every position. Copy the board to keep a position past
+    the next step of the generator. See iter_position_bits() for the parameters.
+
+    :param compact: type: bool
+    True to yield a board of the compact data type (See COMPACT_DTYPE in board.py)
+    Defaults to False
+
+    :return: type: generator
+    Yields the board of every position
+    """
+    board = create_board(rows, columns, compact)
+    boxes = board.reshape(-1)
+
+    for bot_bits, human_bits in iter_position_bits(turn_num, first_state, rows, columns, win_length, unique,
+                                                   include_draws):
+        boxes.fill(BLANK_STATE)
+        for index in range(boxes.size):
+            if bot_bits >> index & 1:
+                boxes[index] = BOT_STATE
+            elif human_bits >> index & 1:
+                boxes[index] = HUMAN_STATE
+
+        yield board
+
+
+def iter_position_ranks(turn_num, first_state, rows=3, columns=3, win_length=None, unique=False,
+                        include_draws=False):
+    """
+    Streams the positions of a turn number as base 3 ranks, the same ranks as get_board_rank() in board.py
+    See iter_position_bits() for the parameters.
+
+    :return: type: generator
+    Yields the base 3 rank of every position
+    """
+    for bot_bits, human_bits in iter_position_bits(turn_num, first_state, rows, columns, win_length, unique,
+                                                   include_draws):
+        rank = 0
+        for index in reversed(range(rows * columns)):
+            rank *= 3
+            if bot_bits >> index & 1:
+                rank += BOT_STATE
+            elif human_bits >> index & 1:
+                rank += HUMAN_STATE
+
+        yield rank
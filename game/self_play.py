@@ -0,0 +1,260 @@
+"""
+    Headless self play simulator, plays many games between two bots without any input or printing.
+
+    Each side is a bot Player with its own engine (See bot/engines.py), "default" being the bot of the game itself
+    (move table with iterative deepening), "random" playing any possible move and "mcts" the Monte Carlo tree search
+    (See bot/mcts.py). The sides take turns starting, so every side starts half of the games.
+
+    Games are split into chunks played by worker processes on all the processors. The outcomes are tallied by the
+    starting side and by the opening move, along with the number of games played per second.
+
+    Usage:
+    python -m game.self_play --games 100000 --engines default random
+"""
+
+import os
+import random
+import argparse
+from time import perf_counter
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from game.player import Player
+from game.board import create_board, update_board, win_check, is_board_full, HUMAN_STATE, BOT_STATE
+
+# Engine of the bot of the game itself
+DEFAULT_PLAYER_ENGINE = "default"
+
+# Marks of the two sides, the first side plays BOT_STATE & the second side plays HUMAN_STATE
+MARKS = ("X", "O")
+
+# Outcome of a drawn game
+DRAW = "draw"
+
+# Number of games played by a worker at once
+DEFAULT_CHUNK_SIZE = 1000
+
+
+def create_players(engines, win_length=None, time_budget=None):
+    """
+    Creates the bot players of both sides.
+
+    :param engines: type: tuple
+    Engine names of the first & second side, "default" for the bot of the game itself
+
+    :param win_length: type: int
+    Number of marks in a row required to win, defaults to the length of the shorter side of the board
+
+    :param time_budget: type: float
+    Maximum number of seconds a bot searches for a single move, None for no limit
+    Only the "default", "mcts" & "random" engines can be given a time budget (See game/player.py)
+
+    :return: type: list
+    List containing both bot player class instances
+    """
+    return [Player(bot=True, state=state, mark=mark, win_length=win_length, time_budget=time_budget,
+                   engine=engine if engine != DEFAULT_PLAYER_ENGINE else None)
+            for engine, state, mark in zip(engines, (BOT_STATE, HUMAN_STATE), MARKS)]
+
+
+def play_game(players, rows=3, columns=3, win_length=None):
+    """
+    Plays a single game until a winner is found or the board is full.
+
+    :param players: type: list
+    List containing both player class instances, in the order of their turns
+
+    :param rows: type: int
+    Number of rows of the board
+
+    :param columns: type: int
+    Number of columns of the board
+
+    :param win_length: type: int
+    Number of marks in a row required to win, defaults to the length of the shorter side of the board
+
+    :return: type: tuple
+    Contains the mark of the winning player (DRAW for a draw) and the first move of the game
+    """
+    board = create_board(rows, columns)
+    opening = None
+
+    # Loop turns
+    while True:
+        for player in players:
+            move = tuple(player.make_move(board))
+            update_board(board, move, player)
+
+            if opening is None:
+                opening = move
+
+            if win_check(board, win_length):
+                return player.mark, opening
+            elif is_board_full(board):
+                return DRAW, opening
+
+
+def play_games(games, engines, first_game=0, seed=None, rows=3, columns=3, win_length=None, time_budget=None):
+    """
+    Plays a chunk of games, runs inside the worker processes.
+
+    :param games: type: int
+    Number of games to play
+
+    :param engines: type: tuple
+    Engine names of the first & second side
+
+    :param first_game: type: int
+    Number of the first game of the chunk, even games are started by the first side
+
+    :param seed: type: int
+    Seed of the random choices of the players, None for different games every time
+
+    :return: type: tuple
+    Contains the Counter of outcomes by starting mark, keyed (starting mark, outcome), and the Counter of outcomes by
+    opening, keyed (starting mark, opening move, outcome)
+    """
+    if seed is not None:
+        # Different chunks must not replay the same games
+        random.seed(seed * 1000003 + first_game)
+
+    players = create_players(engines, win_length, time_budget)
+    by_starting_player = Counter()
+    by_opening = Counter()
+
+    for game in range(first_game, first_game + games):
+        order = players if game % 2 == 0 else players[::-1]
+        outcome, opening = play_game(order, rows, columns, win_length)
+
+        by_starting_player[order[0].mark, outcome] += 1
+        by_opening[order[0].mark, opening, outcome] += 1
+
+    return by_starting_player, by_opening
+
+
+def simulate(games, engines=(DEFAULT_PLAYER_ENGINE, "random"), workers=None, chunk_size=DEFAULT_CHUNK_SIZE, seed=None,
+             rows=3, columns=3, win_length=None, time_budget=None):
+    """
+    Plays the games across worker processes and tallies the outcomes.
+
+    :param games: type: int
+    Number of games to play
+
+    :param engines: type: tuple
+    Engine names of the first (X) & second (O) side, "default" for the bot of the game itself or any name in
+    bot/engines.py including "random"
+
+    :param workers: type: int
+    Number of worker processes, defaults to the number of processors
+    0 or 1 plays the games in the current process
+
+    :param chunk_size: type: int
+    Number of games played by a worker at once
+
+    :param seed: type: int
+    Seed of the random choices of the players, None for different games every time
+
+    :param rows: type: int
+    Number of rows of the board
+
+    :param columns: type: int
+    Number of columns of the board
+
+    :param win_length: type: int
+    Number of marks in a row required to win, defaults to the length of the shorter side of the board
+
+    :param time_budget: type: float
+    Maximum number of seconds a bot searches for a single move, None for no limit
+    Only the "default", "mcts" & "random" engines can be given a time budget (See game/player.py)
+
+    :return: type: dict
+    Dictionary containing the number of games, the seconds taken, the games played per second, the Counter of outcomes
+    by starting mark ('by_starting_player') and the Counter of outcomes by opening ('by_opening')
+    Outcomes are the mark of the winning side or DRAW
+    """
+    # Check for valid engines before starting any process
+    create_players(engines, win_length, time_budget)
+
+    if workers is None:
+        workers = os.cpu_count() or 1
+
+    chunks = [(min(chunk_size, games - first_game), first_game) for first_game in range(0, games, chunk_size)]
+    by_starting_player = Counter()
+    by_opening = Counter()
+
+    start_time = perf_counter()
+
+    if workers <= 1:
+        results = (play_games(chunk_games, engines, first_game, seed, rows, columns, win_length, time_budget)
+                   for chunk_games, first_game in chunks)
+        for chunk_by_starting_player, chunk_by_opening in results:
+            by_starting_player.update(chunk_by_starting_player)
+            by_opening.update(chunk_by_opening)
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = [executor.submit(play_games, chunk_games, engines, first_game, seed, rows, columns, win_length,
+                                       time_budget) for chunk_games, first_game in chunks]
+            for future in futures:
+                chunk_by_starting_player, chunk_by_opening = future.result()
+                by_starting_player.update(chunk_by_starting_player)
+                by_opening.update(chunk_by_opening)
+
+    elapsed = perf_counter() - start_time
+
+    return {
+        'games': games,
+        'elapsed': elapsed,
+        'games_per_second': games / elapsed if elapsed else 0,
+        'by_starting_player': by_starting_player,
+        'by_opening': by_opening
+    }
+
+
+def print_report(report, engines):
+    """
+    Prints the tallies of the simulation.
+
+    :param report: type: dict
+    The report returned by simulate()
+
+    :param engines: type: tuple
+    Engine names of the first & second side
+    """
+    names = dict(zip(MARKS, engines))
+    outcomes = MARKS + (DRAW,)
+
+    print("{} games in {:.2f}s, {:.0f} games per second\n".format(report['games'], report['elapsed'],
+                                                                   report['games_per_second']))
+
+    print("By starting player")
+    for mark in MARKS:
+        tally = ", ".join("{} {}".format(outcome if outcome == DRAW else "{} ({}) wins".format(outcome, names[outcome]),
+                                         report['by_starting_player'][mark, outcome]) for outcome in outcomes)
+        print("{} ({}) starts: {}".format(mark, names[mark], tally))
+
+    print("\nBy opening")
+    openings = sorted({(mark, opening) for mark, opening, _ in report['by_opening']})
+    for mark, opening in openings:
+        tally = ", ".join("{} {}".format(outcome, report['by_opening'][mark, opening, outcome]) for outcome in outcomes)
+        print("{} opens {}: {}".format(mark, opening, tally))
+
+
+def main():
+    """
+    The main function of the simulator, parses the command line arguments and prints the report.
+    """
+    parser = argparse.ArgumentParser(description="Plays many games between two bots without any input or printing")
+    parser.add_argument("--games", type=int, default=10000, help="Number of games to play")
+    parser.add_argument("--engines", nargs=2, default=[DEFAULT_PLAYER_ENGINE, "random"],
+                        help="Engines of the first (X) & second (O) side")
+    parser.add_argument("--workers", type=int, help="Number of worker processes, defaults to the number of processors")
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE, help="Number of games per chunk")
+    parser.add_argument("--seed", type=int, help="Seed of the random choices of the players")
+    args = parser.parse_args()
+
+    engines = tuple(args.engines)
+    report = simulate(args.games, engines, args.workers, args.chunk_size, args.seed)
+    print_report(report, engines)
+
+
+if __name__ == '__main__':
+    main()
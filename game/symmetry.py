@@ -0,0 +1,278 @@
+"""
+    Contain functions related to the symmetries of the tic-tac-toe board.
+
+    Rotating or reflecting a board does not change the outcome of the game. A square board has 8 such transforms
+    (The D4 group), which means up to 8 different boards share the same minimax score and the same best moves, only
+    in a different orientation.
+
+    Out of every group of symmetric boards, the board with the smallest base 3 rank is chosen as the canonical board.
+    Keying caches on the canonical board instead of the board itself shrinks the number of positions about 8 times.
+
+    All transforms are precomputed as permutation tables of the box indexes, so transforming a board is only a matter
+    of reordering its boxes.
+"""
+
+import numpy as np
+from functools import lru_cache
+from game.board import BOT_STATE, HUMAN_STATE
+
+# Names of the transforms, the index of the name is the transform number
+# Only the first 4 transforms keep the shape of a non square board
+TRANSFORM_NAMES = (
+    "identity",
+    "rotate_180",
+    "flip_left_right",
+    "flip_up_down",
+    "rotate_90",
+    "rotate_270",
+    "transpose",
+    "anti_transpose"
+)
+
+# Number of boxes covered by a single bitboard lookup table
+CHUNK_SIZE = 8
+
+
+@lru_cache(maxsize=None)
+def get_permutations(rows, columns):
+    """
+    Precomputes the permutation table of every transform that keeps the shape of the board.
+    For a permutation, box index i of the transformed board holds box index permutation[i] of the original board.
+
+    :param rows: type: int
+    Number of rows of the board
+
+    :param columns: type: int
+    Number of columns of the board
+
+    :return: type: tuple
+    Tuple of permutations, each permutation is a tuple of box indexes
+    """
+    indexes = np.arange(rows * columns).reshape(rows, columns)
+
+    transforms = [
+        indexes,
+        np.rot90(indexes, 2),
+        np.fliplr(indexes),
+        np.flipud(indexes)
+    ]
+
+    # Quarter turns & diagonal reflections only keep the shape of square boards
+    if rows == columns:
+        transforms.extend([
+            np.rot90(indexes, -1),
+            np.rot90(indexes, 1),
+            indexes.T,
+            np.rot90(indexes, 2).T
+        ])
+
+    return tuple(tuple(transform.ravel().tolist()) for transform in transforms)
+
+
+@lru_cache(maxsize=None)
+def get_inverse_permutations(rows, columns):
+    """
+    Precomputes the inverse of every permutation from get_permutations()
+    For an inverse permutation, box index i of the original board is moved to box index inverse[i] of the transformed
+    board.
+
+    :param rows: type: int
+    Number of rows of the board
+
+    :param columns: type: int
+    Number of columns of the board
+
+    :return: type: tuple
+    Tuple of inverse permutations, each inverse permutation is a tuple of box indexes
+    """
+    inverse_permutations = []
+
+    for permutation in get_permutations(rows, columns):
+        inverse = [0] * len(permutation)
+        for index, original_index in enumerate(permutation):
+            inverse[original_index] = index
+        inverse_permutations.append(tuple(inverse))
+
+    return tuple(inverse_permutations)
+
+
+@lru_cache(maxsize=None)
+def get_bitboard_tables(rows, columns):
+    """
+    Precomputes the lookup tables used to transform and rank bitboards.
+
+    A bitboard is split into chunks of CHUNK_SIZE boxes. For every chunk, the tables hold the result for all of the
+    possible values of that chunk, so a bitboard can be transformed or ranked with one lookup per chunk.
+
+    :param rows: type: int
+    Number of rows of the board
+
+    :param columns: type: int
+    Number of columns of the board
+
+    :return: type: tuple
+    Contains the transform tables, indexed by [transform][chunk][chunk_value], and the base 3 rank tables, indexed by
+    [chunk][chunk_value]
+    """
+    size = rows * columns
+    chunks = range(0, size, CHUNK_SIZE)
+
+    transform_tables = []
+    for inverse in get_inverse_permutations(rows, columns):
+        transform_table = []
+        for start in chunks:
+            table = []
+            for value in range(1 << min(CHUNK_SIZE, size - start)):
+                table.append(sum(1 << inverse[start + bit] for bit in range(CHUNK_SIZE) if value >> bit & 1))
+            transform_table.append(tuple(table))
+        transform_tables.append(tuple(transform_table))
+
+    rank_tables = []
+    for start in chunks:
+        rank_tables.append(tuple(sum(3 ** (start + bit) for bit in range(CHUNK_SIZE) if value >> bit & 1)
+                                 for value in range(1 << min(CHUNK_SIZE, size - start))))
+
+    return tuple(transform_tables), tuple(rank_tables)
+
+
+def transform_board(board, transform):
+    """
+    Rotates or reflects the board.
+
+    :param board: type: numpy.ndarray
+    The current state of the Tic Tac Toe board game
+
+    :param transform: type: int
+    The transform number, see TRANSFORM_NAMES
+
+    :return: type: numpy.ndarray
+    A new board with the transform applied
+    """
+    permutation = get_permutations(*board.shape)[transform]
+
+    return board.ravel()[list(permutation)].reshape(board.shape)
+
+
+def transform_move(move, transform, shape):
+    """
+    Maps a move on the original board to the same move on the transformed board.
+
+    :param move: type: tuple
+    Move index in numpy array format (<row_index>, <column_index>)
+
+    :param transform: type: int
+    The transform number, see TRANSFORM_NAMES
+
+    :param shape: type: tuple
+    The number of rows & columns of the board
+
+    :return: type: tuple
+    Move index on the transformed board in numpy array format (<row_index>, <column_index>)
+    """
+    inverse = get_inverse_permutations(*shape)[transform]
+
+    return divmod(inverse[move[0] * shape[1] + move[1]], shape[1])
+
+
+def inverse_transform_move(move, transform, shape):
+    """
+    Maps a move on the transformed board back to the same move on the original board.
+    Used to map the best moves of a canonical board back to the orientation of the original board
+
+    :param move: type: tuple
+    Move index on the transformed board in numpy array format (<row_index>, <column_index>)
+
+    :param transform: type: int
+    The transform number, see TRANSFORM_NAMES
+
+    :param shape: type: tuple
+    The number of rows & columns of the board
+
+    :return: type: tuple
+    Move index on the original board in numpy array format (<row_index>, <column_index>)
+    """
+    permutation = get_permutations(*shape)[transform]
+
+    return divmod(permutation[move[0] * shape[1] + move[1]], shape[1])
+
+
+def get_canonical_rank(board):
+    """
+    Finds the smallest base 3 rank out of all the symmetric boards, without creating any of the symmetric boards.
+    The canonical rank is the same for every board in a group of symmetric boards, making it a key for caches
+
+    :param board: type: numpy.ndarray
+    The current state of the Tic Tac Toe board game
+
+    :return: type: tuple
+    Contains the canonical rank and the transform number that turns the board into the canonical board
+    """
+    boxes = board.ravel().tolist()
+    best_rank, best_transform = None, None
+
+    for transform, permutation in enumerate(get_permutations(*board.shape)):
+        rank = 0
+        for index in reversed(permutation):
+            rank = rank * 3 + boxes[index]
+
+        if best_rank is None or rank < best_rank:
+            best_rank, best_transform = rank, transform
+
+    return best_rank, best_transform
+
+
+def canonicalize(board):
+    """
+    Maps the board to the canonical board of its group of symmetric boards.
+
+    :param board: type: numpy.ndarray
+    The current state of the Tic Tac Toe board game
+
+    :return: type: tuple
+    Contains the canonical board and the transform number that turns the board into the canonical board
+    Use inverse_transform_move() with the transform number to map moves back to the original board
+    """
+    _, transform = get_canonical_rank(board)
+
+    return transform_board(board, transform), transform
+
+
+def canonicalize_bits(bot_bits, human_bits, shape=(3, 3)):
+    """
+    Bitboard version of canonicalize()
+    The canonical bitboards are the same boards as canonicalize() would return, in bitboard form.
+
+    :param bot_bits: type: int
+    The bitboard of the bot
+
+    :param human_bits: type: int
+    The bitboard of the human
+
+    :param shape: type: tuple
+    The number of rows & columns of the board
+
+    :return: type: tuple
+    Contains the canonical bitboard of the bot, the canonical bitboard of the human, the canonical rank and the
+    transform number that turns the bitboards into the canonical bitboards
+    """
+    transform_tables, rank_tables = get_bitboard_tables(*shape)
+    mask = (1 << CHUNK_SIZE) - 1
+    best = None
+
+    for transform, transform_table in enumerate(transform_tables):
+        # Transform both bitboards chunk by chunk
+        new_bot_bits, new_human_bits = 0, 0
+        for chunk, table in enumerate(transform_table):
+            new_bot_bits |= table[bot_bits >> (chunk * CHUNK_SIZE) & mask]
+            new_human_bits |= table[human_bits >> (chunk * CHUNK_SIZE) & mask]
+
+        # Rank the transformed bitboards
+        rank = 0
+        for chunk, table in enumerate(rank_tables):
+            rank += HUMAN_STATE * table[new_human_bits >> (chunk * CHUNK_SIZE) & mask] + \
+                BOT_STATE * table[new_bot_bits >> (chunk * CHUNK_SIZE) & mask]
+
+        if best is None or rank < best[2]:
+            best = (new_bot_bits, new_human_bits, rank, transform)
+
+    return best
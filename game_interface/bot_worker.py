@@ -0,0 +1,110 @@
+"""
+    Background worker of the tic-tac-toe pygame app
+
+    Searching for the bot's move inside the frame loop freezes the window for as long as the search takes: nothing is
+    drawn and no event is handled, not even closing the window. The worker runs the search on a background thread and
+    hands back a concurrent.futures.Future, which the frame loop polls once per frame while it keeps drawing frames and
+    handling events.
+
+    A thread is used rather than a process, so the bot keeps its state between moves (such as the tree of the Monte
+    Carlo tree search, see bot/mcts.py) and nothing has to be pickled. The search holds the GIL while it runs, but the
+    interpreter hands the GIL over to the frame loop every few milliseconds, far more often than the frame rate. The
+    thread is a daemon thread, so closing the window never waits for a search to finish.
+
+    Searches update the board in place while they search, so the worker is always given a copy of the board.
+"""
+
+from concurrent.futures import Future
+import threading
+import time
+
+# Number of seconds a search runs before the interface shows that the bot is thinking
+# Move table lookups finish well within this delay, so the indicator does not flicker on every move
+THINKING_INDICATOR_DELAY = 0.2
+
+
+def run_task(future, function, args):
+    """
+    Runs the function and stores its result or its exception in the future
+
+    :param future: type: concurrent.futures.Future
+    The future of the task
+
+    :param function: type: function
+    The function to be run
+
+    :param args: type: tuple
+    Arguments of the function
+    """
+    if not future.set_running_or_notify_cancel():
+        return
+
+    try:
+        future.set_result(function(*args))
+    except BaseException as exception:
+        future.set_exception(exception)
+
+
+class BotWorker:
+    """
+    Bot worker class
+
+    Runs one task at a time on a background thread, such as the search for the bot's move.
+    A running task cannot be abandoned, the next task is only started once its result has been polled, so the state of
+    the bot is never used by two threads at once.
+    """
+    def __init__(self):
+        """
+        Constructor for BotWorker class.
+        """
+        self._future = None
+        self._start_time = None
+
+    # Getter & setter methods
+    @property
+    def is_busy(self):
+        return self._future is not None
+
+    @property
+    def elapsed(self):
+        return time.perf_counter() - self._start_time if self._future is not None else 0
+
+    @property
+    def is_thinking(self):
+        return self.is_busy and self.elapsed >= THINKING_INDICATOR_DELAY
+
+    def submit(self, function, *args):
+        """
+        Starts the function on a new background thread
+
+        :param function: type: function
+        The function to be run, such as the make_move method of the bot
+
+        :param args: type: tuple
+        Arguments of the function, which must not be changed while the function runs
+
+        :return: type: concurrent.futures.Future
+        The future of the task
+        """
+        if self._future is not None:
+            raise ValueError("Worker is already running a task")
+
+        self._future = Future()
+        self._start_time = time.perf_counter()
+        threading.Thread(target=run_task, args=(self._future, function, args), daemon=True).start()
+
+        return self._future
+
+    def poll(self):
+        """
+        Checks if the task is finished, without waiting for the task
+
+        :return: type: any
+        The result of the task if finished, None if the task is still running or there is no task
+        Raises the exception of the task if the task failed
+        """
+        if self._future is None or not self._future.done():
+            return None
+
+        future, self._future = self._future, None
+        return future.result()
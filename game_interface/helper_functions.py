@@ -4,11 +4,8 @@
 
 
 from game.board import BLANK_STATE
-from bot.minimax import minimax_soft_alpha_beta, get_depth
-from math import inf
 from game.board import update_board, BOT_STATE, HUMAN_STATE
 from game.player import Player
-import random
 
 
 # Helper functions
@@ -48,7 +45,7 @@ def record_draw(records):
     records['turn_num'] = 0
 
 
-def human_input_selection_screen_handler(interface_items, players, mouse_position):
+def human_input_selection_screen_handler(interface_items, players, mouse_position, win_length=None, time_budget=None):
     """
     Captures the user input during the selection screen, initializes the player class instances depending on the user's
     selection on and append them into the players list.
@@ -62,17 +59,23 @@ def human_input_selection_screen_handler(interface_items, players, mouse_positio
 
     :param mouse_position: type: tuple
     Tuple of the X & Y coordinates of the mouse cursor on the pygame window
+
+    :param win_length: type: int
+    Number of marks in a row required to win, defaults to the length of the shorter side of the board
+
+    :param time_budget: type: float
+    Maximum number of seconds the bot can take for a move, None for no limit
     """
     if interface_items['x_sign'].is_mouse_hover(mouse_position) or interface_items['x_label'].is_mouse_hover(mouse_position):
         # Create players
-        bot = Player(bot=True, state=BOT_STATE, mark="O")
+        bot = Player(bot=True, state=BOT_STATE, mark="O", win_length=win_length, time_budget=time_budget)
         human = Player(bot=False, state=HUMAN_STATE, mark="X")
         players.append(bot)
         players.append(human)
 
     elif interface_items['o_sign'].is_mouse_hover(mouse_position) or interface_items['o_label'].is_mouse_hover(mouse_position):
         # Create players
-        bot = Player(bot=True, state=BOT_STATE, mark="X")
+        bot = Player(bot=True, state=BOT_STATE, mark="X", win_length=win_length, time_budget=time_budget)
         human = Player(bot=False, state=HUMAN_STATE, mark="O")
         players.append(bot)
         players.append(human)
@@ -97,31 +100,33 @@ def human_move_input_handler(board, interface_items, mouse_position, human):
     Player class instance of the human player
     """
     # Check intersect, human move
-    for row in range(0, 3):
-        for box in range(0, 3):
+    for row in range(board.shape[0]):
+        for box in range(board.shape[1]):
             if interface_items['game_board_rects'][row][box].is_mouse_hover(mouse_position):
                 if board[row][box] == BLANK_STATE:
                     update_board(board, (row, box), human)
 
 
-def bot_move_input_handler(board, bot):
+def bot_move_input_handler(board, bot, worker):
     """
-    Calls the minimax algorithm and calculates the best possible move for the board state and updates the best possible
-    move on the board
+    Starts the search for the best possible move for the board state in the background worker, and updates the best
+    possible move on the board once the search is finished. Called once per frame until the move is made, so the frame
+    loop never waits for the search.
 
     :param board: type: numpy.array
     The current state of the Tic Tac Toe board game
 
     :param bot: type: class 'game.player.Player'
     Player class instance of the bot player
-    """
-    # Minimax algorithm
-    if all(box == BLANK_STATE for row in board for box in row):
-        # To reduce load, random the first turn for bot
-        row, box = (random.randint(-1, 2), random.randint(-1, 2))
-    else:
-        # Subsequent turn will not take long to calculate
-        _, moves = minimax_soft_alpha_beta(board, get_depth(board), True, -inf, +inf)
-        row, box = random.choice(moves)
 
-    update_board(board, (row, box), bot)
+    :param worker: type: class 'game_interface.bot_worker.BotWorker'
+    Background worker that runs the search of the bot
+    """
+    if not worker.is_busy:
+        # Move table lookup, or search if the position is not in the table
+        # Searches update the board while they search, so the worker gets a copy
+        worker.submit(bot.make_move, board.copy())
+
+    move = worker.poll()
+    if move is not None:
+        update_board(board, move, bot)
@@ -0,0 +1,136 @@
+"""
+    Layout of the scenes of the tic-tac-toe pygame app
+
+    Everything that only depends on the size of the window (and on the size of the board) is worked out once per window
+    size: the positions of the texts, the board lines, the boxes of the board and the objects that never change during a
+    scene, such as the scoreboard frame and headers. The templates (See templates.py) look the layout up on every frame
+    and only create the objects that depend on the board, the records or the mouse position.
+
+    Layouts are cached by window size, so a layout is only worked out again after the window is resized.
+    The objects of a layout are shared by every frame, they must not be changed.
+"""
+
+from functools import lru_cache
+from collections import namedtuple
+from game_interface.pygame_class.textbox import Textbox
+from game_interface.pygame_class.shapes.line import Line
+from game_interface.pygame_class.shapes.rect import Rect
+from game_interface.pygame_class.rectobj import RectObj
+
+# Number of layouts kept for the window sizes seen most recently
+LAYOUT_CACHE_SIZE = 16
+
+ScreenLayout = namedtuple("ScreenLayout", [
+    "width", "height",
+    # Selection screen
+    "title", "x_sign_center", "x_label_center", "o_sign_center", "o_label_center",
+    # Board information
+    "information_board_frame", "information_board_header", "human_win_header", "bot_win_header", "draw_header",
+    "human_win_count_center", "bot_win_count_center", "draw_count_center", "thinking"
+])
+
+BoardLayout = namedtuple("BoardLayout", ["width", "height", "rows", "columns", "game_board_lines", "game_board_rects",
+                                         "box_centers", "mark_size"])
+
+
+@lru_cache(maxsize=LAYOUT_CACHE_SIZE)
+def get_screen_layout(width, height):
+    """
+    Works out the layout of the selection screen & the board information for the window size
+
+    :param width: type: int
+    Width of the window
+
+    :param height: type: int
+    Height of the window
+
+    :return: type: ScreenLayout
+    Contains the static objects of the selection screen & the board information, and the centers of the texts that
+    change with the mouse position or the records
+    """
+    # Selection screen
+    title = Textbox("Select your mark!", "black", "arial", 64, (width * 1 / 2), (height * 1 / 10))
+
+    # Frame/layout & header of information board
+    information_board_frame = Rect("light_grey", (0, 0), (width, (height * 1.5 / 10)), 0)
+    information_board_header = Textbox("Scoreboard", "black", "arial", 25, (width * 1 / 2), (height * 1 / 40))
+
+    # Headers of number of draws, human wins & bot wins
+    draw_header = Textbox("Draws", "green", "arial", 20, (width * 1 / 2), (height * 0.75 / 10))
+    human_win_header = Textbox("Human", "green", "arial", 20, (width * 1 / 3), (height * 0.75 / 10))
+    bot_win_header = Textbox("Bot", "green", "arial", 20, (width * 2 / 3), (height * 0.75 / 10))
+
+    # Between the information board and the game board
+    thinking = Textbox("Bot is thinking...", "dim_gray", "arial", 18, (width * 1 / 2), (height * 1.75 / 10))
+
+    return ScreenLayout(
+        width, height,
+        title, ((width * 1 / 3), (height * 1 / 2)), ((width * 1 / 3), (height * 2 / 3)),
+        ((width * 2 / 3), (height * 1 / 2)), ((width * 2 / 3), (height * 2 / 3)),
+        information_board_frame, information_board_header, human_win_header, bot_win_header, draw_header,
+        ((width * 1 / 3), (height * 1.25 / 10)), ((width * 2 / 3), (height * 1.25 / 10)),
+        ((width * 1 / 2), (height * 1.25 / 10)), thinking
+    )
+
+
+@lru_cache(maxsize=LAYOUT_CACHE_SIZE)
+def get_board_layout(width, height, rows, columns):
+    """
+    Works out the layout of the game board for the window size & the board size
+
+    :param width: type: int
+    Width of the window
+
+    :param height: type: int
+    Height of the window
+
+    :param rows: type: int
+    Number of rows of the board
+
+    :param columns: type: int
+    Number of columns of the board
+
+    :return: type: BoardLayout
+    Contains the board lines, the rect & the center of every box of the board and the font size of the marks
+    """
+    # Calculate boarder
+    left_boarder = width * (0.5 / 10)
+    right_boarder = width * (0.5 / 10)
+    top_boarder = height * (2 / 10)
+    bottom_boarder = height * (0.5 / 10)
+
+    # Define board lines
+    game_board_lines = []
+    # Horizontal lines
+    for row in range(1, rows):
+        y_pos = top_boarder + (height - (top_boarder + bottom_boarder)) * (row / rows)
+        game_board_lines.append(Line("black", (left_boarder, y_pos), (width - right_boarder, y_pos), 3))
+    # Vertical lines
+    for box in range(1, columns):
+        x_pos = left_boarder + (width - (left_boarder + right_boarder)) * (box / columns)
+        game_board_lines.append(Line("black", (x_pos, top_boarder), (x_pos, height - bottom_boarder), 3))
+
+    # Find coordinates of each box in the board
+    # The lines span the whole grid area
+    min_width, max_width = left_boarder, width - right_boarder
+    min_height, max_height = top_boarder, height - bottom_boarder
+
+    # Calculate grid area
+    game_board_width = max_width - min_width
+    game_board_height = max_height - min_height
+
+    # Divide area and define rect
+    game_board_rects = tuple(
+        tuple(RectObj((min_width + (game_board_width * (box / columns)),
+                       min_height + (game_board_height * (row / rows))),
+                      (game_board_width * (1 / columns), game_board_height * (1 / rows)))
+              for box in range(columns))
+        for row in range(rows))
+
+    box_centers = tuple(tuple(box_rect.get_middle_point_coordinates() for box_rect in row_rects)
+                        for row_rects in game_board_rects)
+
+    # Scale marks to the size of the boxes, 124 on a 3 by 3 board
+    mark_size = int(124 * 3 / max(rows, columns))
+
+    return BoardLayout(width, height, rows, columns, tuple(game_board_lines), game_board_rects, box_centers, mark_size)
@@ -0,0 +1,90 @@
+"""
+    Frame profiler of the tic-tac-toe pygame app
+
+    An optional collector of the time spent on every frame and in every step of a frame (the templates, the renderer,
+    the input handlers). The game records into the collector only when one is given (See Game in run_game.py), so the
+    game runs untouched without a collector.
+
+    Durations are kept per step name, and summarized as percentiles, so a few slow frames (such as the first frame of a
+    scene, which draws the whole window) stand out from the typical frame.
+"""
+
+from collections import defaultdict
+import numpy as np
+
+# Percentiles of the measurements in the summary
+PERCENTILES = (50, 90, 95, 99)
+
+
+def summarize_values(values, scale=1):
+    """
+    Summarizes a list of measurements, such as durations or numbers of bytes
+
+    :param values: type: list
+    List of measurements
+
+    :param scale: type: float
+    Factor applied to the measurements in the summary, such as 1000 to summarize seconds in milliseconds
+
+    :return: type: dict
+    Dictionary containing the count, total, mean, maximum and percentiles of the measurements
+    """
+    if not values:
+        return {'count': 0}
+
+    scaled = np.array(values, dtype=float) * scale
+    summary = {
+        'count': len(values),
+        'total': float(scaled.sum()),
+        'mean': float(scaled.mean()),
+        'max': float(scaled.max())
+    }
+    for percentile, value in zip(PERCENTILES, np.percentile(scaled, PERCENTILES)):
+        summary['p{}'.format(percentile)] = float(value)
+
+    return summary
+
+
+class FrameProfiler:
+    """
+    Frame profiler class
+
+    Collects the durations of the frames and of the named steps of every frame.
+    """
+    def __init__(self):
+        """
+        Constructor for FrameProfiler class.
+        """
+        self._durations = defaultdict(list)
+
+    # Getter & setter methods
+    @property
+    def durations(self):
+        return self._durations
+
+    def record(self, name, seconds):
+        """
+        Records the duration of a step
+
+        :param name: type: str
+        Name of the step, such as the name of the template
+
+        :param seconds: type: float
+        Duration of the step in seconds
+        """
+        self._durations[name].append(seconds)
+
+    def clear(self):
+        """
+        Removes all the recorded durations.
+        """
+        self._durations.clear()
+
+    def summary(self):
+        """
+        Summarizes the durations of every step
+
+        :return: type: dict
+        Dictionary of the summary of every step in milliseconds (See summarize_values()), keyed by the name of the step
+        """
+        return {name: summarize_values(durations, 1000) for name, durations in sorted(self._durations.items())}
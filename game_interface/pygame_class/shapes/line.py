@@ -50,6 +50,29 @@ class Line:
     def end_pos(self):
         return self._end_pos
 
+    def get_render_key(self):
+        """
+        Collates everything that changes the pixels drawn by the line
+
+        :return: type: tuple
+        Tuple containing the color, start & end positions and thickness of the line
+        """
+        return "line", self._color, self._start_pos, self._end_pos, self._line_width
+
+    def get_bounding_rect(self):
+        """
+        Calculates the area of the window the line is drawn on, without drawing the line
+        The area is padded by the thickness of the line on every side, so it covers the ends of thick lines
+
+        :return: type: pygame.Rect
+        The area covered by the line
+        """
+        left, right = sorted((self._start_pos[0], self._end_pos[0]))
+        top, bottom = sorted((self._start_pos[1], self._end_pos[1]))
+
+        return pygame.Rect(left, top, right - left + 1, bottom - top + 1).inflate(self._line_width * 2,
+                                                                                  self._line_width * 2)
+
     def draw_to_screen(self, screen):
         """
         Renders the line object to pygame window/screen and saves the created rect object
@@ -38,6 +38,24 @@ class Rect(RectObj):
         self._color = color_to_rgb(color)
         self._width = width
 
+    def get_render_key(self):
+        """
+        Collates everything that changes the pixels drawn by the rectangle
+
+        :return: type: tuple
+        Tuple containing the color, position, size and line thickness of the rectangle
+        """
+        return "rect", self._color, self._left_top, self._width_height, self._width
+
+    def get_bounding_rect(self):
+        """
+        Calculates the area of the window the rectangle is drawn on, without drawing the rectangle
+
+        :return: type: pygame.Rect
+        The area covered by the rectangle
+        """
+        return self._rect.copy()
+
     def draw_to_screen(self, screen):
         """
         Renders the rect object to pygame window/screen and saves the created rect object
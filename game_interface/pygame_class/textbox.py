@@ -8,6 +8,7 @@
 
 import pygame
 from game_interface.color import color_to_rgb
+from game_interface.resource_cache import RESOURCE_CACHE
 
 
 class Textbox:
@@ -42,7 +43,6 @@ class Textbox:
         self._font_size = font_size
         self._center_x = center_x
         self._center_y = center_y
-        self._font = self.load_font()
         self._rect = None
 
     # Getter & setter methods
@@ -56,34 +56,42 @@ class Textbox:
 
     def load_font(self):
         """
-        Detects if the font is supported in pygame.font library. If supported, directly load the font from the library
-        else, load the font from a external directory
+        Looks up the font in the resource cache, which loads the font from the pygame.font library if supported, else,
+        from a external directory (See game_interface/resource_cache.py)
 
         :return: type: pygame.font.Font
         The loaded font object
         """
-        # Font handler
-        # Check if custom font or system font
-        if self._font_name not in pygame.font.get_fonts():
-            # Load custom font from file
-            font = pygame.font.Font("game_interface/fonts/{}.ttf".format(self._font_name), self._font_size)
-        else:
-            # Load system font
-            font = pygame.font.SysFont(self._font_name, self._font_size)
-
-        return font
+        return RESOURCE_CACHE.get_font(self._font_name, self._font_size)
 
     def create_textbox(self):
         """
-        Render the textbox with all provided configurations onto a new surface
+        Looks up the textbox with all provided configurations in the resource cache, which renders the textbox onto a
+        new surface on the first request only. The surface is shared, it must not be drawn onto.
 
         :return: type: pygame.surface
         pygame.surface that contains the rendered textbox
         """
-        # Render text on new surface
-        text = self.load_font().render(self._text, True, self._text_color)
+        return RESOURCE_CACHE.get_text_surface(self._text, self._text_color, self._font_name, self._font_size)
+
+    def get_render_key(self):
+        """
+        Collates everything that changes the pixels drawn by the textbox
+
+        :return: type: tuple
+        Tuple containing the text, color, font & position of the textbox
+        """
+        return "textbox", self._text, self._text_color, self._font_name, self._font_size, self._center_x, self._center_y
 
-        return text
+    def get_bounding_rect(self):
+        """
+        Calculates the area of the window the textbox is drawn on, without drawing the textbox
+
+        :return: type: pygame.Rect
+        The area covered by the textbox
+        """
+        width, height = self.create_textbox().get_size()
+        return pygame.Rect(self._center_x - (width // 2), self._center_y - (height // 2), width, height)
 
     def is_mouse_hover(self, mouse_position):
         """
@@ -0,0 +1,206 @@
+"""
+    Dirty rectangle renderer of the tic-tac-toe pygame app
+
+    Redrawing the whole window and pushing the whole window to the display on every frame costs the same whether
+    anything changed or not, and between two moves nothing changes at all. The renderer only redraws & updates the
+    areas of the window that changed since the previous frame, the dirty rectangles.
+
+    The items that never change during a scene (the board lines, the scoreboard frame and headers, etc.) are drawn once
+    onto a static layer, a background surface the size of the window. The static layer is only drawn again when its
+    items change, which happens when the scene changes. Every other item is compared with the previous frame through
+    its render key (See get_render_key() in the pygame classes). The area of an item that appeared, disappeared or
+    changed is dirty: the static layer is copied back over the area, and the items overlapping the area are drawn again,
+    clipped to the area. Only the dirty areas are passed to pygame.display.update, and a frame without changes does not
+    touch the window at all.
+"""
+
+import pygame
+from game_interface.color import color_to_rgb
+
+# Keys of the interface items that are not drawn, such as the clickable areas of the boxes in the board
+EXCLUDED_ITEMS = (
+    'game_board_rects',
+)
+
+# Keys of the interface items that never change during a scene, drawn on the static layer
+STATIC_ITEMS = (
+    'title',
+    'information_board_frame',
+    'information_board_header',
+    'human_win_header',
+    'bot_win_header',
+    'draw_header',
+    'game_board_lines'
+)
+
+
+def split_interface_items(interface_items, static_items=STATIC_ITEMS):
+    """
+    Lists the items to be drawn in the interface items dictionary, in drawing order, with a unique key for every item,
+    and splits them into the static items & the dynamic items
+
+    :param interface_items: type: dict
+    Dictionary containing all of the user interface (UI) items to be displayed
+
+    :param static_items: type: tuple
+    Keys of the interface items drawn on the static layer
+
+    :return: type: tuple
+    Contains the lists of the static items & the dynamic items, as tuples containing the key & the item
+    The key of an item in a list is the key of the list & its index, blank items (None) in a list are left out
+    """
+    static, dynamic = [], []
+    for key, value in interface_items.items():
+        if key in EXCLUDED_ITEMS:
+            continue
+
+        items = static if key in static_items else dynamic
+        if isinstance(value, (list, tuple)):
+            # Lists of items, tuples for the shared lists of the layout
+            items.extend(((key, index), item) for index, item in enumerate(value) if item)
+        else:
+            items.append((key, value))
+
+    return static, dynamic
+
+
+class Renderer:
+    """
+    Renderer class
+
+    Draws the interface items of every frame onto the window, only redrawing & updating the areas that changed since
+    the previous frame.
+    """
+    def __init__(self, screen, background_color="white", static_items=STATIC_ITEMS):
+        """
+        Constructor for Renderer class.
+
+        :param screen: type: pygame.surface
+        The surface/screen of the game for displaying purposes
+
+        :param background_color: type: str
+        Color name of the background of the window
+        Defaults to white
+
+        :param static_items: type: tuple
+        Keys of the interface items drawn on the static layer
+        """
+        self._screen = screen
+        self._background_color = color_to_rgb(background_color)
+        self._static_items = frozenset(static_items)
+        self._static_layer = None
+        self._static_keys = None
+        # Render key & bounding rect of every dynamic item in the previous frame
+        self._previous_items = {}
+        self._frames = 0
+        self._updated_area = 0
+
+    # Getter & setter methods
+    @property
+    def screen(self):
+        return self._screen
+
+    @property
+    def frames(self):
+        return self._frames
+
+    @property
+    def updated_area(self):
+        return self._updated_area
+
+    def invalidate(self, screen=None):
+        """
+        Forces the next frame to redraw the static layer and the whole window, after the window has been resized or
+        drawn onto by something else.
+
+        :param screen: type: pygame.surface
+        The new surface/screen of the game, if the window has been recreated
+        """
+        if screen is not None:
+            self._screen = screen
+
+        self._static_layer = None
+        self._static_keys = None
+        self._previous_items = {}
+
+    def draw_static_layer(self, static_items, static_keys):
+        """
+        Draws the static items onto a new background surface the size of the window
+
+        :param static_items: type: list
+        List of tuples containing the key & the item of the static items
+
+        :param static_keys: type: tuple
+        Render keys of the static items, to detect changes of the static items in the following frames
+        """
+        self._static_layer = pygame.Surface(self._screen.get_size())
+        self._static_layer.fill(self._background_color)
+        for _, item in static_items:
+            item.draw_to_screen(self._static_layer)
+
+        self._static_keys = static_keys
+
+    def render(self, interface_items):
+        """
+        Draws the interface items onto the window and updates the display with the areas that changed since the
+        previous frame
+
+        :param interface_items: type: dict
+        Dictionary containing all of the user interface (UI) items to be displayed
+
+        :return: type: list
+        List of the dirty areas (pygame.Rect) updated on the display, empty if nothing changed
+        """
+        static_items, dynamic_items = split_interface_items(interface_items, self._static_items)
+
+        self._frames += 1
+
+        static_keys = tuple((key, item.get_render_key()) for key, item in static_items)
+        is_scene_changed = static_keys != self._static_keys
+        if is_scene_changed:
+            self.draw_static_layer(static_items, static_keys)
+            self._previous_items = {}
+
+        # Find dynamic items that appeared or changed
+        dirty_rects = []
+        current_items = {}
+        for key, item in dynamic_items:
+            render_key = item.get_render_key()
+            previous = self._previous_items.pop(key, None)
+
+            if previous is not None and previous[0] == render_key:
+                current_items[key] = previous
+                continue
+
+            bounding_rect = item.get_bounding_rect()
+            current_items[key] = (render_key, bounding_rect)
+            dirty_rects.append(bounding_rect)
+            if previous is not None:
+                dirty_rects.append(previous[1])
+
+        # Items left over disappeared
+        dirty_rects.extend(bounding_rect for _, bounding_rect in self._previous_items.values())
+        self._previous_items = current_items
+
+        screen_rect = self._screen.get_rect()
+        if is_scene_changed:
+            # Scene changed, redraw everything
+            dirty_rects = [screen_rect]
+        elif not dirty_rects:
+            return dirty_rects
+        else:
+            dirty_rects = [rect.clip(screen_rect) for rect in dirty_rects]
+
+        # Redraw the dirty areas, static layer first & then every dynamic item overlapping the area
+        for dirty_rect in dirty_rects:
+            self._screen.set_clip(dirty_rect)
+            self._screen.blit(self._static_layer, dirty_rect, dirty_rect)
+            for key, item in dynamic_items:
+                if current_items[key][1].colliderect(dirty_rect):
+                    item.draw_to_screen(self._screen)
+        self._screen.set_clip(None)
+
+        pygame.display.update(dirty_rects)
+        self._updated_area += sum(rect.width * rect.height for rect in dirty_rects)
+
+        return dirty_rects
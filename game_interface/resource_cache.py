@@ -0,0 +1,206 @@
+"""
+    Process wide cache of the fonts and rendered texts used in the tic-tac-toe pygame app
+
+    Loading a font reads the font file (or looks the font up among the system fonts), and rendering a text rasterizes
+    every glyph onto a new surface. The templates recreate their textboxes on every frame, so without a cache every
+    scoreboard label and every mark on the board is loaded and rendered again 30 times a second, even though the texts
+    barely ever change.
+
+    Fonts are keyed by their name & size, and rendered texts are keyed by their text, color, font name & font size.
+    Both are kept in least recently used order, so once the cache is full, the least recently used entry is evicted to
+    make space for the new entry.
+
+    The cached fonts belong to the pygame font module, call clear() after pygame.quit() before using the cache again.
+"""
+
+from collections import OrderedDict
+import pygame
+
+# Directory of the custom fonts that are not installed on the system
+FONT_DIRECTORY = "game_interface/fonts"
+
+# Default maximum number of fonts & rendered texts kept in a cache
+DEFAULT_MAX_FONTS = 32
+DEFAULT_MAX_SURFACES = 256
+
+
+class ResourceCache:
+    """
+    Resource cache class
+
+    Stores loaded fonts keyed by (font name, font size) and rendered text surfaces keyed by
+    (text, color, font name, font size).
+    """
+    def __init__(self, max_fonts=DEFAULT_MAX_FONTS, max_surfaces=DEFAULT_MAX_SURFACES):
+        """
+        Constructor for ResourceCache class.
+
+        :param max_fonts: type: int
+        Maximum number of fonts kept in the cache before fonts are evicted
+
+        :param max_surfaces: type: int
+        Maximum number of rendered texts kept in the cache before rendered texts are evicted
+        """
+        if max_fonts < 1 or max_surfaces < 1:
+            raise ValueError("Maximum number of fonts & rendered texts must be at least 1")
+
+        self._max_fonts = max_fonts
+        self._max_surfaces = max_surfaces
+        self._system_fonts = None
+        self._fonts = OrderedDict()
+        self._surfaces = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    # Getter & setter methods
+    @property
+    def max_fonts(self):
+        return self._max_fonts
+
+    @property
+    def max_surfaces(self):
+        return self._max_surfaces
+
+    @property
+    def hits(self):
+        return self._hits
+
+    @property
+    def misses(self):
+        return self._misses
+
+    @property
+    def evictions(self):
+        return self._evictions
+
+    def _get_entry(self, entries, key, max_entries, create):
+        """
+        Looks up the key in the entries, creating & storing the entry if not found and evicting the least recently
+        used entry if the entries are full.
+
+        :param entries: type: collections.OrderedDict
+        The fonts or the rendered texts of the cache
+
+        :param key: type: tuple
+        Key of the entry
+
+        :param max_entries: type: int
+        Maximum number of entries kept
+
+        :param create: type: function
+        Function without parameters that creates the entry
+
+        :return: type: pygame.font.Font or pygame.surface
+        The cached entry
+        """
+        entry = entries.get(key)
+
+        if entry is not None:
+            # Mark entry as recently used
+            entries.move_to_end(key)
+            self._hits += 1
+            return entry
+
+        self._misses += 1
+        entry = create()
+
+        if len(entries) >= max_entries:
+            # Evict least recently used entry
+            entries.popitem(last=False)
+            self._evictions += 1
+
+        entries[key] = entry
+        return entry
+
+    def is_system_font(self, font_name):
+        """
+        Checks if the font is supported in pygame.font library. The list of system fonts is only scanned once.
+
+        :param font_name: type: str
+        Name of the font
+
+        :return: type: bool
+        True if the font is a system font, False if the font must be loaded from the fonts directory
+        """
+        if self._system_fonts is None:
+            self._system_fonts = frozenset(pygame.font.get_fonts())
+
+        return font_name in self._system_fonts
+
+    def get_font(self, font_name, font_size):
+        """
+        Returns the font of the name & size, loading the font on the first request. If the font is a system font, the
+        font is loaded from the library, else, the font is loaded from the fonts directory.
+
+        :param font_name: type: str
+        Name of the font
+
+        :param font_size: type: int
+        Size of the font
+
+        :return: type: pygame.font.Font
+        The loaded font object
+        """
+        def load_font():
+            if not self.is_system_font(font_name):
+                # Load custom font from file
+                return pygame.font.Font("{}/{}.ttf".format(FONT_DIRECTORY, font_name), font_size)
+
+            # Load system font
+            return pygame.font.SysFont(font_name, font_size)
+
+        return self._get_entry(self._fonts, (font_name, font_size), self._max_fonts, load_font)
+
+    def get_text_surface(self, text, color, font_name, font_size):
+        """
+        Returns the surface of the text rendered with the color & font, rendering the text on the first request.
+        The surface is shared by every request, it must not be drawn onto.
+
+        :param text: type: str
+        Text to be rendered
+
+        :param color: type: tuple
+        Tuple containing the RGB value of the text
+
+        :param font_name: type: str
+        Name of the font
+
+        :param font_size: type: int
+        Size of the font
+
+        :return: type: pygame.surface
+        pygame.surface that contains the rendered text
+        """
+        return self._get_entry(self._surfaces, (text, color, font_name, font_size), self._max_surfaces,
+                               lambda: self.get_font(font_name, font_size).render(text, True, color))
+
+    def clear(self):
+        """
+        Removes all fonts & rendered texts and resets the counters of the cache.
+        """
+        self._system_fonts = None
+        self._fonts.clear()
+        self._surfaces.clear()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def get_stats(self):
+        """
+        Collates the counters of the cache.
+
+        :return: type: dict
+        Dictionary containing the number of fonts, rendered texts, hits, misses and evictions of the cache
+        """
+        return {
+            'fonts': len(self._fonts),
+            'surfaces': len(self._surfaces),
+            'hits': self._hits,
+            'misses': self._misses,
+            'evictions': self._evictions
+        }
+
+
+# Cache shared by all the textboxes of the application
+RESOURCE_CACHE = ResourceCache()
@@ -5,17 +5,29 @@
 # UI imports
 import pygame
 import sys
-from game_interface.color import color_to_rgb
-from game_interface.templates import game_board, selection_screen, board_information, highlight_win
+from game_interface.renderer import Renderer
+from game_interface.bot_worker import BotWorker
+from game_interface.templates import game_board, selection_screen, board_information, highlight_win, \
+    thinking_indicator
 
 # Game logic imports
 import random
+from time import perf_counter
 from game.board import create_board, win_check, is_board_full, get_turn_number
 from game_interface.helper_functions import bot_move_input_handler, human_move_input_handler, record_draw, record_win, human_input_selection_screen_handler
 
 # Define screen size
 width, height = 600, 600
 
+# Define board size & number of marks in a row required to win
+rows, columns, win_length = 3, 3, 3
+
+# Define maximum number of seconds the bot can take for a move
+bot_time_budget = 1
+
+# Define number of milliseconds a finished game is shown before the next game
+post_game_delay = 2000
+
 
 def setup_game():
     """
@@ -30,9 +42,9 @@ def setup_game():
     # Initialize module
     pygame.init()
 
-    # Define screen dimensions
+    # Define screen dimensions, the layout of the scenes follows the window size (See game_interface/layout.py)
     screen_size = (width, height)
-    screen = pygame.display.set_mode(screen_size)
+    screen = pygame.display.set_mode(screen_size, pygame.RESIZABLE)
 
     # Define game window caption
     pygame.display.set_caption("Tic Tac Toe")
@@ -43,186 +55,310 @@ def setup_game():
     return screen, clock
 
 
-def render_items_to_screen(screen, interface_items):
+def is_post_game_delay_over(game_over_time, delay=post_game_delay):
     """
-    Renders all the items in interface_items dictionary to the screen
+    Checks if the finished game has been shown for long enough, without waiting.
 
-    :param screen: type: pygame.surface
-    The surface/screen of the game for displaying purposes
+    Used for adding a delay between multiple tic-tac-toe games. This is to provide time for the player to react to what
+    is happening in the game. The frame loop keeps running during the delay, so the window keeps handling events.
 
-    :param interface_items: type: dict
-    Dictionary containing all of the user interface (UI) items to be displayed
-    """
-    # List to exclude rendering
-    exclude_list = [
-        'game_board_rects'
-    ]
-
-    for key, value in interface_items.items():
-        if key not in exclude_list:
-            if isinstance(value, list):
-                for move in value:
-                    if move:
-                        move.draw_to_screen(screen)
-            else:
-                value.draw_to_screen(screen)
+    :param game_over_time: type: int
+    Number of milliseconds since pygame.init() when the game finished (See pygame.time.get_ticks())
 
+    :param delay: type: int
+    Number of milliseconds a finished game is shown before the next game
 
-def post_game_delay():
+    :return: type: bool
+    True if the delay is over, False otherwise
     """
-    Forces the screen to update while adding a delay and clearing any events that were added during the delay.
-
-    Used for adding a delay between multiple tic-tac-toe games. This is to provide time for the player to react to what
-    is happening in the game.
-    """
-    # Refresh screen & add delay
-    pygame.display.update()
-    # Caution, when wait is active, event gets stored in a queue waiting to be executed.
-    # This causes some visual input lag. Must clear the event queue after done with pygame.time.wait
-    pygame.time.wait(2000)
-    pygame.event.clear()
+    return pygame.time.get_ticks() - game_over_time >= delay
 
 
-def main():
+class Game:
     """
-    The main function of the game.
-    Responsible for the setup of game window properties, creating players, scheduling scenes in the game, recording
-    player statistics and looping the game.
-    """
-    # Setup game
-    screen, clock = setup_game()
-
-    # Create list of players
-    players = []
-    # Define whose turn
-    player = None
-
-    # Define stats recording
-    records = {
-        # Record turn number
-        'turn_num': 0,
-        # Record bot wins
-        'bot_win': 0,
-        # Record human wins
-        'human_win': 0,
-        # Record draws
-        'draw': 0
-    }
-
-    # Define screen states
-    intro = True
-    game = True
-
-    # Create a blank Tic Tac Toe board
-    board = create_board()
-
-    # Game loop
-    while True:
-        # tick rate
-        clock.tick(30)
+    Game class
 
-        mouse_position = pygame.mouse.get_pos()
+    Holds the state of the game window between frames, and runs one frame of the game at a time: handles the events,
+    draws the current scene and moves the game forward.
+    """
+    def __init__(self, screen, board_rows=rows, board_columns=columns, board_win_length=win_length,
+                 time_budget=bot_time_budget, delay=post_game_delay, profiler=None):
+        """
+        Constructor for Game class.
+
+        :param screen: type: pygame.surface
+        The surface/screen of the game for displaying purposes
+
+        :param board_rows: type: int
+        Number of rows of the board
+
+        :param board_columns: type: int
+        Number of columns of the board
+
+        :param board_win_length: type: int
+        Number of marks in a row required to win
+
+        :param time_budget: type: float
+        Maximum number of seconds the bot can take for a move
+
+        :param delay: type: int
+        Number of milliseconds a finished game is shown before the next game
+
+        :param profiler: type: game_interface.profiler.FrameProfiler
+        Optional collector of the durations of the steps of every frame, None to not collect any
+        """
+        self._screen = screen
+        self._rows = board_rows
+        self._columns = board_columns
+        self._win_length = board_win_length
+        self._time_budget = time_budget
+        self._delay = delay
+        self._profiler = profiler
+
+        # Only redraws the areas of the screen that changed
+        self._renderer = Renderer(screen)
+        # Runs the bot's searches in the background
+        self._worker = BotWorker()
+
+        # Create list of players
+        self._players = []
+        # Define whose turn
+        self._player = None
+
+        # Define stats recording
+        self._records = {
+            # Record turn number
+            'turn_num': 0,
+            # Record bot wins
+            'bot_win': 0,
+            # Record human wins
+            'human_win': 0,
+            # Record draws
+            'draw': 0
+        }
+
+        # Define screen states
+        self._intro = True
+
+        # Create a blank Tic Tac Toe board
+        self._board = create_board(self._rows, self._columns)
+        # Time when the current game finished, None while the game is being played
+        self._game_over_time = None
+
+        # Last known position of the mouse, updated by the mouse events
+        self._mouse_position = pygame.mouse.get_pos()
+
+    # Getter & setter methods
+    @property
+    def screen(self):
+        return self._screen
+
+    @property
+    def renderer(self):
+        return self._renderer
+
+    @property
+    def worker(self):
+        return self._worker
+
+    @property
+    def players(self):
+        return self._players
+
+    @property
+    def player(self):
+        return self._player
+
+    @property
+    def records(self):
+        return self._records
+
+    @property
+    def intro(self):
+        return self._intro
+
+    @property
+    def board(self):
+        return self._board
+
+    @property
+    def game_over_time(self):
+        return self._game_over_time
+
+    def timed(self, name, function, *args):
+        """
+        Calls the function, recording its duration in the profiler if there is one
+
+        :param name: type: str
+        Name of the step in the profiler
+
+        :param function: type: function
+        The function to be called
+
+        :param args: type: tuple
+        Arguments of the function
+
+        :return: type: any
+        The result of the function
+        """
+        if self._profiler is None:
+            return function(*args)
+
+        start_time = perf_counter()
+        result = function(*args)
+        self._profiler.record(name, perf_counter() - start_time)
+
+        return result
+
+    def run_frame(self, events):
+        """
+        Runs a single frame of the game
+
+        :param events: type: list
+        List of the pygame events since the previous frame
+
+        :return: type: bool
+        False if the window was closed or the ESC key was pressed, True otherwise
+        """
         mouse_clicked = False
 
-        for event in pygame.event.get():
+        for event in events:
             # Break loop if window is closed
             if event.type == pygame.QUIT:
-                pygame.quit()
-                sys.exit()
+                return False
 
             # Break loop if ESC key is pressed
             elif event.type == pygame.KEYDOWN:
                 if event.key == pygame.K_ESCAPE:
-                    pygame.quit()
-                    sys.exit()
+                    return False
+
+            elif event.type == pygame.MOUSEMOTION:
+                self._mouse_position = event.pos
 
             elif event.type == pygame.MOUSEBUTTONDOWN:
+                self._mouse_position = event.pos
                 mouse_clicked = True
 
-        # White background/clear previous objects
-        screen.fill(color_to_rgb("white"))
-
-        if intro:
-            # Draw selection screen
-            interface_items = selection_screen(screen, mouse_position)
-            render_items_to_screen(screen, interface_items)
-
-            # Handle user input
-            if mouse_clicked:
-                human_input_selection_screen_handler(interface_items, players, mouse_position)
-
-            # Proceed to next screen if user selected a choice & assign players
-            if players:
-                # Unpack players
-                bot, human = players[0], players[1]
-
-                # Random starting player
-                player = random.choice(players)
-
-                # Move on to game screen
-                intro = False
-        elif game:
-            # Game scene
-            # Draw board information
-            interface_items = board_information(screen, records)
-            render_items_to_screen(screen, interface_items)
-
-            # Draw tic tac toe board
-            interface_items = game_board(screen, board, players)
-            render_items_to_screen(screen, interface_items)
-
-            # Check if game is finished
-            if win_check(board):
-                # Game is finished
-                # Highlight the winning row
-                interface_items = highlight_win(interface_items, board)
-                render_items_to_screen(screen, interface_items)
-
-                # Add delay
-                post_game_delay()
-
+            # Redraw everything if the window is resized, the templates look up the layout of the new size
+            elif event.type == pygame.VIDEORESIZE:
+                self._screen = pygame.display.get_surface()
+                self._renderer.invalidate(self._screen)
+
+        if self._intro:
+            self.run_selection_scene(mouse_clicked)
+        else:
+            self.run_game_scene(mouse_clicked)
+
+        return True
+
+    def run_selection_scene(self, mouse_clicked):
+        """
+        Draws the selection screen and assigns the players once the user selected a mark
+
+        :param mouse_clicked: type: bool
+        True if the mouse was clicked since the previous frame
+        """
+        screen, mouse_position = self._screen, self._mouse_position
+
+        # Draw selection screen
+        interface_items = self.timed("selection_screen", selection_screen, screen, mouse_position)
+        self.timed("renderer", self._renderer.render, interface_items)
+
+        # Handle user input
+        if mouse_clicked:
+            human_input_selection_screen_handler(interface_items, self._players, mouse_position, self._win_length,
+                                                 self._time_budget)
+
+        # Proceed to next screen if user selected a choice & assign players
+        if self._players:
+            # Random starting player
+            self._player = random.choice(self._players)
+
+            # Move on to game screen
+            self._intro = False
+
+    def run_game_scene(self, mouse_clicked):
+        """
+        Draws the board information & the board, and plays the current game
+
+        :param mouse_clicked: type: bool
+        True if the mouse was clicked since the previous frame
+        """
+        screen, board, records = self._screen, self._board, self._records
+        # Unpack players
+        bot, human = self._players[0], self._players[1]
+
+        # Draw board information & tic tac toe board
+        interface_items = self.timed("board_information", board_information, screen, records)
+        interface_items.update(self.timed("game_board", game_board, screen, board, self._players))
+        if self._worker.is_thinking:
+            interface_items.update(self.timed("thinking_indicator", thinking_indicator, screen))
+
+        is_won = win_check(board, self._win_length)
+        if is_won:
+            # Highlight the winning row
+            interface_items.update(self.timed("highlight_win", highlight_win, interface_items, board,
+                                              self._win_length))
+
+        self.timed("renderer", self._renderer.render, interface_items)
+
+        # Check if game is finished
+        if is_won or is_board_full(board):
+            # Game is finished
+            # Show the finished game for a while, without blocking the frame loop
+            if self._game_over_time is None:
+                self._game_over_time = pygame.time.get_ticks()
+            elif is_post_game_delay_over(self._game_over_time, self._delay):
                 # Record stats
-                record_win(player, records)
+                if is_won:
+                    record_win(self._player, records)
+                else:
+                    record_draw(records)
 
                 # Reset board
-                board = create_board()
+                self._board = create_board(self._rows, self._columns)
+                self._game_over_time = None
 
                 # Next game, random starting turn again
-                player = random.choice(players)
-            elif is_board_full(board):
-                # Game is finished
+                self._player = random.choice(self._players)
+        else:
+            # Game not finished
+            # Make a move (bot/human)
+            if self._player.bot:
+                # Bot turn, the search runs in the background over the next frames
+                self.timed("bot_move_input_handler", bot_move_input_handler, board, bot, self._worker)
+            else:
+                if mouse_clicked:
+                    # Human turn
+                    self.timed("human_move_input_handler", human_move_input_handler, board, interface_items,
+                               self._mouse_position, human)
 
-                # Add delay
-                post_game_delay()
+            # Cycle turns
+            if get_turn_number(board) != records["turn_num"]:
+                if not win_check(board, self._win_length) and not is_board_full(board):
+                    # Subsequent turns
+                    self._player = human if self._player.bot else bot
+                    records["turn_num"] = get_turn_number(board)
 
-                # Record stats
-                record_draw(records)
 
-                # Reset board
-                board = create_board()
+def main():
+    """
+    The main function of the game.
+    Responsible for the setup of game window properties and looping the game at its tick rate, see the Game class for
+    creating players, scheduling scenes in the game and recording player statistics.
+    """
+    # Setup game
+    screen, clock = setup_game()
+    game = Game(screen)
 
-                # Next game, random starting turn again
-                player = random.choice(players)
-            else:
-                # Game not finished
-                # Make a move (bot/human)
-                if player.bot:
-                    # Bot turn
-                    bot_move_input_handler(board, bot)
-                else:
-                    if mouse_clicked:
-                        # Human turn
-                        human_move_input_handler(board, interface_items, mouse_position, human)
-
-                # Cycle turns
-                if get_turn_number(board) != records["turn_num"]:
-                    if not win_check(board) and not is_board_full(board):
-                        # Subsequent turns
-                        player = human if player.bot else bot
-                        records["turn_num"] = get_turn_number(board)
-
-        # Update screen
-        pygame.display.update()
+    # Game loop
+    while True:
+        # tick rate
+        clock.tick(30)
+
+        if not game.run_frame(pygame.event.get()):
+            pygame.quit()
+            sys.exit()
 
 
 if __name__ == '__main__':
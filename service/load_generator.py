@@ -0,0 +1,203 @@
+"""
+    Load generator for the bot move server.
+
+    Opens a number of connections to the server, each sending requests one after the other, and reports the number of
+    requests answered per second and the latency percentiles of the requests.
+
+    The boards sent are random positions reached by random play where it is the bot's turn, on the 3 by 3 board unless
+    told otherwise.
+"""
+
+import json
+import random
+import asyncio
+import argparse
+from time import perf_counter
+from game.board import create_board, get_possible_moves, win_check, HUMAN_STATE, BOT_STATE
+from service.server import DEFAULT_HOST, DEFAULT_PORT
+
+
+def generate_boards(count, rows=3, columns=3, win_length=None, seed=None):
+    """
+    Generates random unfinished boards where it is the bot's turn.
+
+    :param count: type: int
+    Number of boards to generate
+
+    :param rows: type: int
+    Number of rows of the boards
+
+    :param columns: type: int
+    Number of columns of the boards
+
+    :param win_length: type: int
+    Number of marks in a row required to win, defaults to the length of the shorter side of the board
+
+    :param seed: type: int
+    Seed of the random generator, None for a different set of boards every time
+
+    :return: type: list
+    List of boards as nested lists of states
+    """
+    generator = random.Random(seed)
+    boards = []
+
+    while len(boards) < count:
+        board = create_board(rows, columns)
+        starting_state = generator.choice((HUMAN_STATE, BOT_STATE))
+        state = starting_state
+
+        # Random number of random moves, ending on the bot's turn
+        for _ in range(generator.randrange(board.size - 1)):
+            board[generator.choice(get_possible_moves(board))] = state
+            state = HUMAN_STATE if state == BOT_STATE else BOT_STATE
+
+            if win_check(board, win_length):
+                break
+
+        if state == BOT_STATE and not win_check(board, win_length) and get_possible_moves(board):
+            boards.append(board.tolist())
+
+    return boards
+
+
+def get_percentile(sorted_values, percentile):
+    """
+    Finds the percentile of a sorted list with the nearest rank method.
+
+    :param sorted_values: type: list
+    The values sorted in ascending order
+
+    :param percentile: type: float
+    Percentile between 0 and 100
+
+    :return: type: float
+    The value at the percentile, None for an empty list
+    """
+    if not sorted_values:
+        return None
+
+    rank = max(1, -(-len(sorted_values) * percentile // 100))
+    return sorted_values[int(rank) - 1]
+
+
+async def run_connection(host, port, path, boards, requests, win_length, latencies, counters, generator):
+    """
+    Sends requests one after the other on a single connection, recording the latency of every request.
+    The boards are picked by the random generator of the connection, so a seeded generator sends the same boards.
+    """
+    if path is not None:
+        reader, writer = await asyncio.open_unix_connection(path)
+    else:
+        reader, writer = await asyncio.open_connection(host, port)
+
+    try:
+        for request_id in range(requests):
+            request = {"id": request_id, "board": generator.choice(boards)}
+            if win_length is not None:
+                request["win_length"] = win_length
+
+            start_time = perf_counter()
+            writer.write(json.dumps(request).encode() + b"\n")
+            await writer.drain()
+
+            line = await reader.readline()
+            if not line:
+                counters["errors"] += requests - request_id
+                break
+
+            latencies.append(perf_counter() - start_time)
+            response = json.loads(line)
+            counters["errors" if "error" in response or response.get("id") != request_id else "answered"] += 1
+    finally:
+        writer.close()
+        await writer.wait_closed()
+
+
+async def run_load(host=DEFAULT_HOST, port=DEFAULT_PORT, path=None, connections=10, requests=100, boards=None,
+                   win_length=None, seed=0):
+    """
+    Runs the load against the server.
+
+    :param host: type: str
+    Host of the server
+
+    :param port: type: int
+    Port of the server
+
+    :param path: type: str
+    Path of the Unix socket of the server, None to use TCP
+
+    :param connections: type: int
+    Number of connections sending requests at the same time
+
+    :param requests: type: int
+    Number of requests sent on every connection
+
+    :param boards: type: list
+    Boards to send as nested lists of states, defaults to 1000 random 3 by 3 boards
+
+    :param win_length: type: int
+    Number of marks in a row required to win, sent with every request if given
+
+    :param seed: type: int
+    Seed of the random generator generating the default boards & picking the boards sent on every connection
+    None for different boards every time
+
+    :return: type: dict
+    Dictionary containing the number of requests answered & failed, the seconds taken, the requests answered per
+    second and the 50th & 99th percentiles of the latency in milliseconds
+    """
+    if boards is None:
+        boards = generate_boards(1000, seed=seed)
+
+    # One generator per connection, the requests of the connections interleave differently on every run
+    generator = random.Random(seed)
+    connection_generators = [random.Random(generator.getrandbits(64)) for _ in range(connections)]
+
+    latencies = []
+    counters = {"answered": 0, "errors": 0}
+
+    start_time = perf_counter()
+    await asyncio.gather(*(run_connection(host, port, path, boards, requests, win_length, latencies, counters,
+                                          connection_generator)
+                           for connection_generator in connection_generators))
+    elapsed = perf_counter() - start_time
+
+    latencies.sort()
+
+    return {
+        'answered': counters["answered"],
+        'errors': counters["errors"],
+        'elapsed': elapsed,
+        'requests_per_second': counters["answered"] / elapsed if elapsed else 0,
+        'p50_ms': get_percentile(latencies, 50) * 1000 if latencies else None,
+        'p99_ms': get_percentile(latencies, 99) * 1000 if latencies else None
+    }
+
+
+def main():
+    """
+    The main function of the load generator, parses the command line arguments and prints the report.
+    """
+    parser = argparse.ArgumentParser(description="Load generator for the bot move server")
+    parser.add_argument("--host", default=DEFAULT_HOST, help="Host of the server")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT, help="Port of the server")
+    parser.add_argument("--unix", dest="path", help="Path of the Unix socket of the server instead of TCP")
+    parser.add_argument("--connections", type=int, default=10, help="Number of connections at the same time")
+    parser.add_argument("--requests", type=int, default=100, help="Number of requests per connection")
+    parser.add_argument("--seed", type=int, default=0, help="Seed of the boards sent")
+    args = parser.parse_args()
+
+    report = asyncio.run(run_load(args.host, args.port, args.path, args.connections, args.requests,
+                                  seed=args.seed))
+
+    print("Answered: {}, Errors: {}, Time taken: {:.2f}s".format(report['answered'], report['errors'],
+                                                                 report['elapsed']))
+    print("Requests per second: {:.1f}".format(report['requests_per_second']))
+    if report['p50_ms'] is not None:
+        print("Latency p50: {:.2f}ms, p99: {:.2f}ms".format(report['p50_ms'], report['p99_ms']))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,326 @@
+"""
+    Bot move server, lets many games ask the bot for its move at the same time.
+
+    The server speaks newline delimited JSON over TCP or a Unix socket. Every request is a single line holding a JSON
+    object, and every request gets back a single line with the same id:
+
+    Request:  {"id": 1, "board": [[0, 1, 0], [0, 2, 0], [0, 0, 0]], "win_length": 3}
+    Response: {"id": 1, "move": [0, 0]}
+    Error:    {"id": 1, "error": "Board is already finished"}
+
+    Invalid requests are answered with the error of the request, and a search that fails in the worker processes (such
+    as after a worker died) is answered with an "Internal error".
+
+    The board holds the states of board.py (0 blank, 1 human, 2 bot), "win_length" is optional. The server always plays
+    the bot, so the board must be on the bot's turn. Requests on the same connection are answered as soon as their move
+    is found, so responses may arrive in a different order than the requests.
+
+    The searches run in a process pool, so the event loop is never blocked by a search. Once max_pending requests are
+    being searched, the server stops reading new requests until one is done, which pushes back on the clients through
+    the socket instead of queueing an unbounded amount of work.
+"""
+
+import os
+import json
+import asyncio
+import argparse
+import numpy as np
+from functools import partial
+from concurrent.futures import ProcessPoolExecutor
+from game.board import BLANK_STATE, HUMAN_STATE, BOT_STATE, win_check, is_board_full
+from game.player import Player
+from bot.move_table import get_move_table
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+
+# Maximum number of requests searched at the same time, per server
+DEFAULT_MAX_PENDING = 64
+
+# Longest request line accepted, in bytes
+MAX_LINE_LENGTH = 64 * 1024
+
+
+def init_worker():
+    """
+    Initializer of the worker processes, loads the move table once so the first requests are not slowed down.
+    """
+    get_move_table()
+
+
+def find_move(boxes, win_length=None, time_budget=None):
+    """
+    Finds the bot's move, runs inside the worker processes.
+
+    :param boxes: type: list
+    The board as nested lists of states
+
+    :param win_length: type: int
+    Number of marks in a row required to win, defaults to the length of the shorter side of the board
+
+    :param time_budget: type: float
+    Maximum number of seconds the bot searches for a single move, None for no limit
+
+    :return: type: list
+    Selected move index in numpy array format [<row_index>, <column_index>]
+    """
+    board = np.array(boxes, dtype=int)
+    bot = Player(bot=True, state=BOT_STATE, mark="O", win_length=win_length, time_budget=time_budget)
+
+    return list(bot.make_move(board))
+
+
+def parse_request(line):
+    """
+    Parses and validates a request line.
+
+    :param line: type: bytes
+    The request line
+
+    :return: type: tuple
+    Contains the id of the request, the board as nested lists of states and the win length
+    Raises ValueError for an invalid request, with the id of the request as second argument if known
+    """
+    try:
+        request = json.loads(line)
+    except ValueError:
+        raise ValueError("Request is not valid JSON", None) from None
+
+    if not isinstance(request, dict):
+        raise ValueError("Request must be a JSON object", None)
+
+    request_id = request.get("id")
+    boxes = request.get("board")
+    win_length = request.get("win_length")
+
+    if not isinstance(boxes, list) or not boxes or not all(isinstance(row, list) and row for row in boxes) or \
+            len({len(row) for row in boxes}) != 1:
+        raise ValueError("Board must be a non empty list of rows of the same length", request_id)
+    if not all(box in (BLANK_STATE, HUMAN_STATE, BOT_STATE) and type(box) is int for row in boxes for box in row):
+        raise ValueError("Boxes must be {}, {} or {}".format(BLANK_STATE, HUMAN_STATE, BOT_STATE), request_id)
+    if win_length is not None and (type(win_length) is not int or
+                                   not 1 <= win_length <= max(len(boxes), len(boxes[0]))):
+        raise ValueError("Win length must be between 1 and the length of the longer side of the board", request_id)
+
+    board = np.array(boxes, dtype=int)
+    # Either player may have started, so the bot has as many marks as the human or one less on its turn
+    if not 0 <= (board == HUMAN_STATE).sum() - (board == BOT_STATE).sum() <= 1:
+        raise ValueError("Board is not on the bot's turn, the bot must have as many marks as the human or one less",
+                         request_id)
+    if win_check(board, win_length) or is_board_full(board):
+        raise ValueError("Board is already finished", request_id)
+
+    return request_id, boxes, win_length
+
+
+class BotMoveServer:
+    """
+    Bot move server class
+
+    Serves the bot's moves over newline delimited JSON, see the module docstring for the protocol.
+    """
+    def __init__(self, workers=None, max_pending=DEFAULT_MAX_PENDING, time_budget=1):
+        """
+        Constructor for BotMoveServer class.
+
+        :param workers: type: int
+        Number of worker processes searching for moves, defaults to the number of processors
+
+        :param max_pending: type: int
+        Maximum number of requests searched at the same time, further requests wait to be read
+
+        :param time_budget: type: float
+        Maximum number of seconds the bot searches for a single move, None for no limit
+        Defaults to 1 second
+        """
+        if max_pending < 1:
+            raise ValueError("Maximum number of pending requests must be at least 1")
+
+        self._workers = workers or os.cpu_count() or 1
+        self._max_pending = max_pending
+        self._time_budget = time_budget
+        self._executor = None
+        self._server = None
+        self._pending = None
+        self._requests = 0
+        self._errors = 0
+
+    # Getter & setter methods
+    @property
+    def requests(self):
+        return self._requests
+
+    @property
+    def errors(self):
+        return self._errors
+
+    @property
+    def sockets(self):
+        return self._server.sockets if self._server is not None else ()
+
+    async def start(self, host=DEFAULT_HOST, port=DEFAULT_PORT, path=None):
+        """
+        Starts the worker processes and listens for connections.
+
+        :param host: type: str
+        Host to listen on for TCP connections
+
+        :param port: type: int
+        Port to listen on for TCP connections, 0 to pick a free port
+
+        :param path: type: str
+        Path of the Unix socket to listen on instead of TCP, None to use TCP
+        """
+        self._executor = ProcessPoolExecutor(max_workers=self._workers, initializer=init_worker)
+        self._pending = asyncio.Semaphore(self._max_pending)
+
+        if path is not None:
+            self._server = await asyncio.start_unix_server(self.handle_connection, path, limit=MAX_LINE_LENGTH)
+        else:
+            self._server = await asyncio.start_server(self.handle_connection, host, port, limit=MAX_LINE_LENGTH)
+
+    async def serve_forever(self):
+        """
+        Serves until cancelled.
+        """
+        await self._server.serve_forever()
+
+    async def close(self):
+        """
+        Stops listening and shuts the worker processes down.
+        """
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+
+        if self._executor is not None:
+            # Waits for the searches in progress on a separate thread, so the event loop is not blocked
+            executor, self._executor = self._executor, None
+            await asyncio.get_running_loop().run_in_executor(None, partial(executor.shutdown, wait=True,
+                                                                           cancel_futures=True))
+
+    async def handle_connection(self, reader, writer):
+        """
+        Reads the requests of a connection and answers each of them once its move is found.
+
+        :param reader: type: asyncio.StreamReader
+        Stream of the requests
+
+        :param writer: type: asyncio.StreamWriter
+        Stream of the responses
+        """
+        tasks = set()
+        write_lock = asyncio.Lock()
+
+        try:
+            while True:
+                # Backpressure, stop reading until a search slot is free
+                await self._pending.acquire()
+
+                try:
+                    line = await reader.readline()
+                except (ValueError, ConnectionError):
+                    # Line too long or connection lost
+                    self._pending.release()
+                    break
+
+                if not line:
+                    self._pending.release()
+                    break
+                elif not line.strip():
+                    self._pending.release()
+                    continue
+
+                task = asyncio.create_task(self.handle_request(line, writer, write_lock))
+                tasks.add(task)
+                task.add_done_callback(tasks.discard)
+
+            # Answer the requests already read before closing
+            if tasks:
+                await asyncio.gather(*tasks, return_exceptions=True)
+        finally:
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except ConnectionError:
+                pass
+
+    async def handle_request(self, line, writer, write_lock):
+        """
+        Finds the move of a single request in the worker processes and writes the response.
+
+        :param line: type: bytes
+        The request line
+
+        :param writer: type: asyncio.StreamWriter
+        Stream of the responses
+
+        :param write_lock: type: asyncio.Lock
+        Keeps the response lines of a connection from interleaving
+        """
+        self._requests += 1
+
+        try:
+            try:
+                request_id, boxes, win_length = parse_request(line)
+            except ValueError as error:
+                self._errors += 1
+                response = {"id": error.args[1] if len(error.args) > 1 else None, "error": error.args[0]}
+            else:
+                try:
+                    move = await asyncio.get_running_loop().run_in_executor(self._executor, find_move, boxes,
+                                                                            win_length, self._time_budget)
+                    response = {"id": request_id, "move": move}
+                except Exception:
+                    # Search failed, such as a broken process pool after a worker died, the client still gets a reply
+                    self._errors += 1
+                    response = {"id": request_id, "error": "Internal error"}
+        finally:
+            self._pending.release()
+
+        async with write_lock:
+            writer.write(json.dumps(response).encode() + b"\n")
+            try:
+                await writer.drain()
+            except ConnectionError:
+                pass
+
+
+async def run_server(host=DEFAULT_HOST, port=DEFAULT_PORT, path=None, workers=None, max_pending=DEFAULT_MAX_PENDING,
+                     time_budget=1):
+    """
+    Runs the bot move server until cancelled. See BotMoveServer for the parameters.
+    """
+    server = BotMoveServer(workers, max_pending, time_budget)
+
+    try:
+        await server.start(host, port, path)
+        print("Serving bot moves on {}".format(path if path is not None else "{}:{}".format(host, port)))
+        await server.serve_forever()
+    finally:
+        await server.close()
+
+
+def main():
+    """
+    The main function of the server, parses the command line arguments and runs the server.
+    """
+    parser = argparse.ArgumentParser(description="Serves the bot's moves over newline delimited JSON")
+    parser.add_argument("--host", default=DEFAULT_HOST, help="Host to listen on for TCP connections")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT, help="Port to listen on for TCP connections")
+    parser.add_argument("--unix", dest="path", help="Path of a Unix socket to listen on instead of TCP")
+    parser.add_argument("--workers", type=int, help="Number of worker processes, defaults to the number of processors")
+    parser.add_argument("--max-pending", type=int, default=DEFAULT_MAX_PENDING,
+                        help="Maximum number of requests searched at the same time")
+    parser.add_argument("--time-budget", type=float, default=1, help="Maximum number of seconds to search per move")
+    args = parser.parse_args()
+
+    try:
+        asyncio.run(run_server(args.host, args.port, args.path, args.workers, args.max_pending, args.time_budget))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == '__main__':
+    main()
@@ -22,10 +22,47 @@
 
     This approach is the compromise of pure minimax and alpha-beta pruning. This approach only calculates all of the
     best route and skips the rest of the routes that does not pass the threshold.
+
+    Bitboard minimax:
+    This approach runs alpha-beta pruning on two 9 bit integers instead of the numpy array. Wins are detected by
+    testing precomputed bit masks and moves are made by setting bits, so no board copies are created.
+
+    This approach returns all of the best moves, the same as pure minimax, but in a fraction of the time.
+
+    Principal variation search (NegaScout):
+    This approach is a negamax version of alpha-beta pruning, where every position is scored from the point of view of
+    the player to move. Only the first branch is searched with the full alpha beta window, the other branches are
+    searched with a zero width window which only proves that they are not better, and are searched again if they are.
+
+    This approach prunes the most when the first branch is the best one, so it works best with move ordering.
+
+    Parallel search:
+    This approach splits the moves at the top of the decision tree across worker processes, each searching its moves
+    with the bitboard search. The best score found so far is shared between the workers so that moves searched later
+    are still pruned. The speedup over the serial bitboard minimax is compared on a 4 by 4 board, where the startup
+    of the worker processes is small compared to the search.
+
+    Alpha-beta pruning with move ordering:
+    Alpha-beta pruning prunes the most branches when the best move is searched first. Move ordering searches the moves
+    on the most winning combinations first (center, then corners, then edges), followed by killer moves and the history
+    table which remember the moves that caused cutoffs. The number of nodes visited is compared with and without move
+    ordering.
+
+    Monte Carlo tree search:
+    This approach plays random games from the position and grows a tree towards the moves that win the most, instead
+    of searching the whole decision tree. Its cost per move is set by the number of playouts, so the number of
+    playouts per second is reported on a 7 by 7 board, far too large to be solved.
 """
 
+import os
 import timeit
 import statistics
+import bot.minimax
+from math import inf
+from bot.move_ordering import MoveOrderer
+from bot.stats import SearchStats
+from bot.mcts import MonteCarloTreeSearch
+from game.board import create_board
 
 
 def print_stats(title, time):
@@ -33,8 +70,21 @@ def print_stats(title, time):
     print("Minimum time: {:.2f}, Average time: {:.2f}\n".format(min(time), statistics.mean(time)))
 
 
+def count_nodes(function_name, *args):
+    """
+    Counts the number of nodes visited by a recursive search function of bot/minimax.py, using the search statistics
+    collector.
+    """
+    stats = SearchStats()
+    getattr(bot.minimax, function_name)(*args, stats=stats)
+
+    return stats.nodes
+
+
 import_setup = """
-from bot.minimax import minimax, minimax_alpha_beta, minimax_soft_alpha_beta, get_depth
+from bot.minimax import minimax, minimax_alpha_beta, minimax_soft_alpha_beta, principal_variation_search, get_depth
+from bot.move_ordering import MoveOrderer
+from bot.bitboard import bitboard_minimax
 from game.board import create_board
 from math import inf
 
@@ -47,6 +97,30 @@ test_minimax_alpha_beta = "minimax_alpha_beta(board, get_depth(board), True, -in
 
 test_minimax_soft_alpha_beta = "minimax_soft_alpha_beta(board, get_depth(board), True, -inf, +inf)"
 
+test_bitboard_minimax = "bitboard_minimax(board, get_depth(board), True)"
+
+test_principal_variation_search = "principal_variation_search(board, get_depth(board), True, -inf, +inf)"
+
+parallel_setup = """
+from bot.bitboard import bitboard_minimax
+from bot.parallel import parallel_search
+from bot.minimax import get_depth
+from game.board import create_board, HUMAN_STATE, BOT_STATE
+
+board = create_board(4, 4)
+board[0][0] = HUMAN_STATE
+board[1][1] = BOT_STATE
+"""
+
+test_serial_search = "bitboard_minimax(board, get_depth(board), False, 3)"
+
+test_parallel_search = "parallel_search(board, get_depth(board), False, 3)"
+
+test_minimax_alpha_beta_ordering = "minimax_alpha_beta(board, get_depth(board), True, -inf, +inf, ordering=MoveOrderer())"
+
+test_principal_variation_search_ordering = "principal_variation_search(board, get_depth(board), True, -inf, +inf, " \
+                                           "ordering=MoveOrderer())"
+
 
 def main():
     # Just minimax
@@ -61,6 +135,50 @@ def main():
     time = timeit.Timer(test_minimax_soft_alpha_beta, setup=import_setup).repeat(10, 1)
     print_stats("Soft alpha-beta pruning", time)
 
+    # Principal variation search
+    time = timeit.Timer(test_principal_variation_search, setup=import_setup).repeat(10, 1)
+    print_stats("Principal variation search", time)
+
+    # Bitboard minimax
+    time = timeit.Timer(test_bitboard_minimax, setup=import_setup).repeat(10, 1)
+    print_stats("Bitboard minimax", time)
+
+    # Minimax with alpha beta pruning & move ordering
+    time = timeit.Timer(test_minimax_alpha_beta_ordering, setup=import_setup).repeat(10, 1)
+    print_stats("Alpha-beta pruning with move ordering", time)
+
+    # Principal variation search with move ordering
+    time = timeit.Timer(test_principal_variation_search_ordering, setup=import_setup).repeat(10, 1)
+    print_stats("Principal variation search with move ordering", time)
+
+    # Serial & parallel search on a 4 by 4 board
+    serial_time = timeit.Timer(test_serial_search, setup=parallel_setup).repeat(3, 1)
+    print_stats("Bitboard minimax (4 by 4 board)", serial_time)
+
+    parallel_time = timeit.Timer(test_parallel_search, setup=parallel_setup).repeat(3, 1)
+    print_stats("Parallel search (4 by 4 board, {} workers)".format(os.cpu_count()), parallel_time)
+    print("Speedup: {:.2f}x\n".format(min(serial_time) / min(parallel_time)))
+
+    # Monte Carlo tree search on a 7 by 7 board
+    search = MonteCarloTreeSearch(time_budget=1)
+    search(create_board(7, 7), True, 5)
+    print("Monte Carlo tree search (7 by 7 board, 5 in a row)")
+    print("Playouts: {}, Playouts per second: {:.0f}\n".format(search.last_playouts, search.playouts_per_second))
+
+    # Nodes visited with & without move ordering
+    board = create_board()
+    print("Nodes visited")
+    print("Pure minimax: {}".format(count_nodes("minimax", board, 0, True)))
+    print("Alpha-beta pruning: {}".format(count_nodes("minimax_alpha_beta", board, 0, True, -inf, +inf)))
+    print("Alpha-beta pruning with move ordering: {}".format(
+        count_nodes("minimax_alpha_beta", board, 0, True, -inf, +inf, None, None, MoveOrderer())))
+    print("Soft alpha-beta pruning: {}".format(count_nodes("minimax_soft_alpha_beta", board, 0, True, -inf, +inf)))
+    print("Soft alpha-beta pruning with move ordering: {}".format(
+        count_nodes("minimax_soft_alpha_beta", board, 0, True, -inf, +inf, None, None, MoveOrderer())))
+    print("Principal variation search: {}".format(count_nodes("negamax", board, 0, +1, -inf, +inf)))
+    print("Principal variation search with move ordering: {}".format(
+        count_nodes("negamax", board, 0, +1, -inf, +inf, None, None, MoveOrderer())))
+
 
 if __name__ == '__main__':
     main()
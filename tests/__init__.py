@@ -2,17 +2,17 @@
     Contains functions related to obtaining or generating test cases
 """
 
-from game.board import create_board, get_possible_moves
-from copy import deepcopy
-from itertools import combinations
-from math import floor, ceil
-from game.board import win_check
+import random
+from bot.move_table import get_move_table, lookup_move_table
+from game.board import HUMAN_STATE, BOT_STATE
+from game.positions import iter_positions
 
 
-def get_all_possible_board_states(turn_num, primary_state, secondary_state):
+def get_all_possible_board_states(turn_num, primary_state, secondary_state, unique=False):
     """
-    Loops through all possible states of the board starting from the turn_num provided and ending on the last turn.
-     Finally, collates them in a list
+    Collates all the possible states of the board after the turn number provided in a list.
+    Boards with a winning combination are left out, full boards without a winner are kept.
+    Use iter_positions() in game/positions.py to stream the boards instead.
 
     :param turn_num: type: int
     The number of moves on the board
@@ -21,7 +21,11 @@ def get_all_possible_board_states(turn_num, primary_state, secondary_state):
     The state of the player that had the first move, HUMAN_STATE or BOT_STATE
 
     :param secondary_state: type: int
-    The state of the player that had the second move, HUMAN_STATE or BOT_STATE
+    The state of the player that had the second move, the other one of HUMAN_STATE or BOT_STATE
+
+    :param unique: type: bool
+    True to only keep one board out of every group of symmetric boards (rotations & reflections)
+    Defaults to False
 
     :return: type: list
     Containing all the possible board states given a turn number
@@ -29,31 +33,44 @@ def get_all_possible_board_states(turn_num, primary_state, secondary_state):
     # Check for valid turn number
     if turn_num < 0 or turn_num > 9:
         raise ValueError("Turn number must be between 0 and 9")
+    if {primary_state, secondary_state} != {HUMAN_STATE, BOT_STATE}:
+        raise ValueError("Primary & secondary state must be {} and {}".format(HUMAN_STATE, BOT_STATE))
+
+    return [board.copy() for board in iter_positions(turn_num, primary_state, unique=unique, include_draws=True)]
 
-    # Return blank board for turn 0
-    if not turn_num:
-        return create_board()
 
-    boards = []
-    temp_boards = []
+def get_oracle_positions(sample=None, seed=0):
+    """
+    Collates every unfinished position of the 3 by 3 board, with either player starting first, along with its exact
+    result from the oracle.
+
+    The oracle is the move table (See bot/move_table.py), which holds the exact minimax score and all of the optimal
+    moves of every reachable position. It is solved once by its own bitboard minimax and cached on disk, so checking an
+    engine against it costs a single lookup per position.
 
-    board = create_board()
+    :param sample: type: int
+    Number of positions picked at random out of all the positions, None to keep all the positions
+
+    :param seed: type: int
+    Seed of the random sample, the same seed always picks the same positions
+
+    :return: type: tuple
+    Contains the list of boards, the list of turns (True if it is the bot's turn) and the list of oracle results,
+    each result contains the minimax score and a list of all the optimal moves
+    """
+    positions = []
 
-    # Player for that turn number
-    for move in combinations(get_possible_moves(board), ceil(turn_num / 2)):
-        temp_boards.append(deepcopy(board))
-        for row, box in move:
-            temp_boards[-1][row][box] = secondary_state if turn_num % 2 == 0 else primary_state
+    for first_state in (HUMAN_STATE, BOT_STATE):
+        for turn_num in range(9):
+            is_maximizing_player = (turn_num % 2 == 0) == (first_state == BOT_STATE)
+            positions.extend((board.copy(), is_maximizing_player) for board in iter_positions(turn_num, first_state))
 
-    # Other player
-    for board in temp_boards:
-        for move in combinations(get_possible_moves(board), floor(turn_num / 2)):
-            boards.append(deepcopy(board))
-            for row, box in move:
-                boards[-1][row][box] = primary_state if turn_num % 2 == 0 else secondary_state
+    if sample is not None and sample < len(positions):
+        positions = random.Random(seed).sample(positions, sample)
 
-            # Remove all won/terminal board states
-            if win_check(boards[-1]):
-                del boards[-1]
+    table = get_move_table()
+    boards = [board for board, _ in positions]
+    turns = [is_maximizing_player for _, is_maximizing_player in positions]
+    results = [lookup_move_table(board, is_maximizing_player, table) for board, is_maximizing_player in positions]
 
-    return boards
+    return boards, turns, results
@@ -0,0 +1,92 @@
+"""
+    Contains all the pytest test cases regarding the vectorized evaluation of stacks of boards
+"""
+
+
+import numpy as np
+import random
+from bot.minimax import heuristic_evaluation, batch_heuristic_evaluation, get_depth
+from game.batch import batch_get_winner, batch_win_check, batch_is_board_full, batch_evaluate
+from game.board import HUMAN_STATE, BOT_STATE, BLANK_STATE, COMPACT_DTYPE, create_board, get_winner, win_check, \
+    is_board_full
+from tests import get_all_possible_board_states
+
+
+def get_board_stack():
+    """
+    Stacks every possible board, including the finished boards, into a compact array
+    """
+    boards = [create_board()]
+    random.seed(0)
+
+    for turn_num in range(1, 10):
+        for primary_state, secondary_state in ((HUMAN_STATE, BOT_STATE), (BOT_STATE, HUMAN_STATE)):
+            boards.extend(get_all_possible_board_states(turn_num, primary_state, secondary_state))
+
+    # Finished boards
+    for _ in range(500):
+        board = create_board()
+        for turn_num, index in enumerate(random.sample(range(9), random.randint(5, 9))):
+            board.flat[index] = HUMAN_STATE if turn_num % 2 == 0 else BOT_STATE
+        boards.append(board)
+
+    return boards, np.stack(boards).astype(COMPACT_DTYPE)
+
+
+def test_create_compact_board():
+    """
+    Testing the compact data type of the board
+    """
+    board = create_board(compact=True)
+
+    assert board.dtype == COMPACT_DTYPE
+    assert board.nbytes == 9
+    assert (board == create_board()).all()
+
+
+def test_batch_evaluation():
+    """
+    Testing for result consistency between the vectorized & the single board functions
+    """
+    boards, stack = get_board_stack()
+
+    winners, is_terminal = batch_evaluate(stack)
+    scores = batch_heuristic_evaluation(stack)
+
+    for index, board in enumerate(boards):
+        winner = get_winner(board)
+
+        assert winners[index] == (winner if winner is not None else BLANK_STATE)
+        assert is_terminal[index] == (win_check(board) or is_board_full(board))
+        assert scores[index] == heuristic_evaluation(board, get_depth(board))
+
+    # Flattened stack
+    assert (batch_win_check(stack.reshape(len(stack), 9)) == (winners != BLANK_STATE)).all()
+    assert (batch_is_board_full(stack.reshape(len(stack), 9)) == batch_is_board_full(stack)).all()
+    assert (batch_heuristic_evaluation(stack.reshape(len(stack), 9), 3) ==
+            [heuristic_evaluation(board, 3) for board in boards]).all()
+
+
+def test_batch_other_sizes():
+    """
+    Testing the vectorized functions on boards of other sizes and win lengths
+    """
+    random.seed(0)
+    boards = []
+
+    for _ in range(200):
+        board = create_board(4, 5, compact=True)
+        for turn_num, index in enumerate(random.sample(range(board.size), random.randint(0, board.size))):
+            board.flat[index] = HUMAN_STATE if turn_num % 2 == 0 else BOT_STATE
+        boards.append(board)
+
+    winners = batch_get_winner(np.stack(boards), 3)
+
+    for board, winner in zip(boards, winners):
+        expected_winner = get_winner(board, 3)
+        assert winner == (expected_winner if expected_winner is not None else BLANK_STATE)
+
+    scores = batch_heuristic_evaluation(np.stack(boards), win_length=3)
+
+    for board, score in zip(boards, scores):
+        assert score == heuristic_evaluation(board, get_depth(board), 3)
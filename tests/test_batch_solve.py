@@ -0,0 +1,60 @@
+"""
+    Contains all the pytest test cases regarding the batch solver
+"""
+
+
+import pytest
+from bot.batch_solve import solve_many, iter_solve_many
+from bot.engines import ENGINES, ALL_MOVES_ENGINES, get_engine
+from bot.minimax import minimax_soft_alpha_beta, get_depth
+from tests import get_all_possible_board_states
+from math import inf
+from game.board import HUMAN_STATE, BOT_STATE, create_board
+
+
+def test_solve_many():
+    """
+    Testing that the results of the process pool are in the same order as the boards and match the serial search
+    """
+    boards = get_all_possible_board_states(4, BOT_STATE, HUMAN_STATE) + [create_board()]
+
+    expected_results = [minimax_soft_alpha_beta(board, get_depth(board), True, -inf, +inf) for board in boards]
+
+    assert solve_many(boards, True, engine="soft_alpha_beta", workers=2, chunk_size=50) == expected_results
+    assert solve_many(boards, True, workers=1) == expected_results
+
+
+def test_iter_solve_many():
+    """
+    Testing that streaming yields every board exactly once, with a different turn for every board
+    """
+    boards = get_all_possible_board_states(3, HUMAN_STATE, BOT_STATE)
+    turns = [index % 2 == 0 for index in range(len(boards))]
+
+    results = dict(iter_solve_many(boards, turns, engine="move_table", workers=2))
+
+    assert sorted(results) == list(range(len(boards)))
+    for index, board in enumerate(boards):
+        assert results[index] == minimax_soft_alpha_beta(board, get_depth(board), turns[index], -inf, +inf)
+
+
+def test_engines():
+    """
+    Testing that every engine finds the same score, and a best move, on a few positions
+    """
+    boards = get_all_possible_board_states(6, HUMAN_STATE, BOT_STATE)[::20]
+
+    for board in boards:
+        expected_result = minimax_soft_alpha_beta(board, get_depth(board), False, -inf, +inf)
+
+        for name in ENGINES:
+            score, moves = get_engine(name)(board, False)
+
+            assert score == expected_result[0]
+            if name in ALL_MOVES_ENGINES:
+                assert moves == expected_result[1]
+            else:
+                assert moves[0] in expected_result[1]
+
+    with pytest.raises(ValueError):
+        solve_many(boards, False, engine="unknown")
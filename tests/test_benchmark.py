@@ -0,0 +1,48 @@
+"""
+    Contains all the pytest test cases regarding the benchmark suite
+"""
+
+
+import json
+from benchmark import run_benchmarks, compare_results, get_positions
+from game.board import BOT_STATE, HUMAN_STATE
+
+
+def test_positions():
+    """
+    Testing that the positions of a turn number are always the same
+    """
+    for turn_num in range(9):
+        for first_state in (BOT_STATE, HUMAN_STATE):
+            positions = get_positions(turn_num, first_state, 4)
+
+            assert 1 <= len(positions) <= 4
+            assert all((board != 0).sum() == turn_num for board in positions)
+            assert [board.tolist() for board in positions] == \
+                [board.tolist() for board in get_positions(turn_num, first_state, 4)]
+
+
+def test_run_and_compare(tmp_path):
+    """
+    Testing the results of a small benchmark and flagging a regression between two results
+    """
+    results = run_benchmarks(("soft_alpha_beta", "move_table"), range(6, 9), positions=2, repeat=1)
+
+    # Results must survive a round trip through JSON
+    with open(tmp_path / "old.json", "w") as file:
+        json.dump(results, file)
+    with open(tmp_path / "old.json") as file:
+        old = json.load(file)
+
+    assert len(old['results']) == 2 * 2 * 3
+    assert all(result['nodes'] > 0 for result in old['results'] if result['engine'] == "soft_alpha_beta")
+    assert all(result['peak_memory'] > 0 for result in old['results'])
+
+    assert not any(comparison['regression'] for comparison in compare_results(old, old))
+
+    new = json.loads(json.dumps(old))
+    new['results'][0]['nodes'] = int(new['results'][0]['nodes'] * 1.5)
+    regressions = [comparison for comparison in compare_results(old, new, 0.2) if comparison['regression']]
+
+    assert len(regressions) == 1
+    assert regressions[0]['metric'] == "nodes" and regressions[0]['change'] > 0.2
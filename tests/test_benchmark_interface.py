@@ -0,0 +1,41 @@
+"""
+    Contains all the pytest test cases regarding the headless rendering benchmark
+"""
+
+
+import json
+from benchmark_interface import run_interface_benchmark, play_scripted_games
+
+
+def test_scripted_games():
+    """
+    Testing that the scripted player plays the number of games and that a seed always plays the same games
+    """
+    run = play_scripted_games(games=3, fps=0, delay=0, move_frames=1)
+    records = run['game'].records
+
+    assert records['bot_win'] + records['human_win'] + records['draw'] == 3
+    assert records['human_win'] == 0
+    assert run['frames'] == run['profiler'].summary()['frame']['count']
+    assert run['cache_stats']['misses'] > 0
+
+    assert play_scripted_games(games=3, fps=0, delay=0, move_frames=1)['game'].records == records
+
+
+def test_run_interface_benchmark():
+    """
+    Testing the results of a small benchmark, with the memory per frame
+    """
+    lines = []
+    results = json.loads(json.dumps(run_interface_benchmark(games=2, fps=0, delay=0, move_frames=1, memory=True,
+                                                            log=lines.append)))
+
+    assert results['frames']['count'] > 0
+    assert results['frames']['p50'] <= results['frames']['p95'] <= results['frames']['max']
+    for step in ('selection_screen', 'board_information', 'game_board', 'renderer', 'human_move_input_handler'):
+        assert results['steps'][step]['count'] > 0
+
+    # Idle frames only update a fraction of the window
+    assert 0 < results['renderer']['updated_area_per_frame'] < results['renderer']['window_area']
+    assert results['memory']['allocated_bytes']['count'] == results['frames']['count']
+    assert lines
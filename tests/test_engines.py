@@ -0,0 +1,67 @@
+"""
+    Contains all the pytest test cases checking every engine against the oracle on the positions of the 3 by 3 board
+
+    The positions are solved on all the processors (See bot/batch_solve.py). By default every engine is checked on a
+    random sample of the positions, so the tests run in seconds. Set the ENGINE_TEST_SAMPLE environment variable to a
+    number of positions to change the sample, or to "all" to check every position:
+    ENGINE_TEST_SAMPLE=all pytest tests/test_engines.py
+"""
+
+
+import os
+import pytest
+from bot.batch_solve import iter_solve_many
+from bot.engines import ALL_MOVES_ENGINES
+from tests import get_oracle_positions
+
+# Engines checked against the oracle, one line per engine
+# Name or module level function of the engine (See bot/engines.py). Engines in ALL_MOVES_ENGINES must return all of the
+# best moves, any other engine must return one of the best moves
+# The move table is the oracle itself, so it is not checked against the oracle
+ENGINE_MATRIX = [
+    "minimax",
+    "soft_alpha_beta",
+    "alpha_beta",
+    "principal_variation_search",
+    "bitboard"
+]
+
+# Default number of positions checked
+DEFAULT_SAMPLE = 500
+
+# Number of positions checked, None for every position
+SAMPLE = os.environ.get("ENGINE_TEST_SAMPLE") or str(DEFAULT_SAMPLE)
+SAMPLE = None if SAMPLE == "all" else int(SAMPLE)
+
+
+@pytest.fixture(scope="module")
+def oracle_positions():
+    """
+    The positions & oracle results, shared by all the engines
+    """
+    return get_oracle_positions(SAMPLE)
+
+
+@pytest.mark.parametrize("engine", ENGINE_MATRIX,
+                         ids=[engine if isinstance(engine, str) else engine.__name__ for engine in ENGINE_MATRIX])
+def test_engine(engine, oracle_positions):
+    """
+    Testing that the engine finds the exact score and the optimal moves of every position
+    """
+    boards, turns, expected_results = oracle_positions
+    is_all_moves = engine in ALL_MOVES_ENGINES
+    mismatches = []
+
+    for index, (score, moves) in iter_solve_many(boards, turns, engine):
+        expected_score, expected_moves = expected_results[index]
+
+        if is_all_moves:
+            is_correct = (score, moves) == (expected_score, expected_moves)
+        else:
+            is_correct = score == expected_score and moves[0] in expected_moves
+
+        if not is_correct:
+            mismatches.append((boards[index].tolist(), turns[index], (score, moves), expected_results[index]))
+
+    assert not mismatches, "{} of {} positions are wrong, first ones: {}".format(len(mismatches), len(boards),
+                                                                                  mismatches[:3])
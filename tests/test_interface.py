@@ -0,0 +1,208 @@
+"""
+    Contains all the pytest test cases regarding the pygame interface, run on SDL's dummy video driver
+"""
+
+
+import os
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import time
+import pytest
+import pygame
+from game_interface.resource_cache import ResourceCache, RESOURCE_CACHE
+from game_interface.pygame_class.textbox import Textbox
+from game_interface.renderer import Renderer
+from game_interface.layout import get_board_layout
+from game_interface.bot_worker import BotWorker
+from game_interface.helper_functions import bot_move_input_handler
+from game_interface.templates import selection_screen, board_information, game_board, highlight_win
+from game.player import Player
+from game.board import BOT_STATE, HUMAN_STATE, BLANK_STATE, create_board, update_board
+
+
+def get_game_items(screen, board, players, records):
+    """
+    The interface items of the game scene, the same items run_game.py draws
+    """
+    interface_items = board_information(screen, records)
+    interface_items.update(game_board(screen, board, players))
+    return interface_items
+
+
+def get_pixels(surface):
+    """
+    The pixels of the surface, to compare two surfaces
+    """
+    return pygame.image.tobytes(surface, "RGB")
+
+
+@pytest.fixture
+def screen():
+    """
+    The pygame window, with an empty resource cache
+    """
+    pygame.init()
+    RESOURCE_CACHE.clear()
+    yield pygame.display.set_mode((600, 600))
+    RESOURCE_CACHE.clear()
+    pygame.quit()
+
+
+def test_resource_cache(screen):
+    """
+    Testing that fonts & rendered texts are only created once, and evicted in least recently used order
+    """
+    cache = ResourceCache(max_surfaces=2)
+    font = cache.get_font("arial", 20)
+    assert cache.get_font("arial", 20) is font
+    assert cache.get_font("arial", 30) is not font
+
+    surface = cache.get_text_surface("X", (0, 0, 0), "arial", 20)
+    assert cache.get_text_surface("X", (0, 0, 0), "arial", 20) is surface
+    assert cache.get_text_surface("X", (255, 0, 0), "arial", 20) is not surface
+
+    # "X" in black is the least recently used text
+    cache.get_text_surface("X", (0, 0, 0), "arial", 20)
+    cache.get_text_surface("O", (0, 0, 0), "arial", 20)
+    assert cache.get_stats() == {'fonts': 2, 'surfaces': 2, 'hits': 6, 'misses': 5, 'evictions': 1}
+    assert cache.get_text_surface("X", (0, 0, 0), "arial", 20) is surface
+
+    with pytest.raises(ValueError):
+        ResourceCache(max_surfaces=0)
+
+
+def test_textbox_cache(screen):
+    """
+    Testing that drawing a textbox every frame only renders the text once per color
+    """
+    textbox = Textbox("Scoreboard", "black", "arial", 25, 300, 15)
+    for _ in range(30):
+        textbox.draw_to_screen(screen)
+        assert textbox.is_mouse_hover((300, 15))
+        assert not textbox.is_mouse_hover((0, 300))
+
+    textbox.text_color = "red"
+    textbox.draw_to_screen(screen)
+
+    assert RESOURCE_CACHE.get_stats()['misses'] == 3
+    assert RESOURCE_CACHE.get_stats()['surfaces'] == 2
+
+
+def test_renderer(screen):
+    """
+    Testing that frames without changes are not drawn, and that drawing only the changes gives the same pixels as
+    drawing the whole frame
+    """
+    renderer = Renderer(screen)
+    full_screen = pygame.Surface(screen.get_size())
+
+    # Selection screen, hovering over the X choice changes its color
+    assert renderer.render(selection_screen(screen, (0, 0))) == [screen.get_rect()]
+    assert renderer.render(selection_screen(screen, (0, 0))) == []
+    assert renderer.render(selection_screen(screen, (200, 300)))
+    assert renderer.render(selection_screen(screen, (200, 300))) == []
+
+    # Game scene
+    players = [Player(bot=True, state=BOT_STATE, mark="O"), Player(bot=False, state=HUMAN_STATE, mark="X")]
+    records = {'turn_num': 0, 'bot_win': 0, 'human_win': 0, 'draw': 0}
+    board = create_board()
+    assert renderer.render(get_game_items(screen, board, players, records)) == [screen.get_rect()]
+
+    for move, player in [((1, 1), players[1]), ((0, 0), players[0]), ((0, 2), players[1]), ((2, 0), players[0]),
+                         ((1, 0), players[1]), ((1, 2), players[0]), ((2, 1), players[1]), ((2, 2), players[0])]:
+        update_board(board, move, player)
+        records['turn_num'] += 1
+        dirty_rects = renderer.render(get_game_items(screen, board, players, records))
+
+        # Only the new mark is drawn
+        assert len(dirty_rects) == 1
+        assert renderer.render(get_game_items(screen, board, players, records)) == []
+
+        Renderer(full_screen).render(get_game_items(full_screen, board, players, records))
+        assert get_pixels(screen) == get_pixels(full_screen)
+
+    # Winning line & new game with a new score
+    update_board(board, (0, 1), players[1])
+    interface_items = get_game_items(screen, board, players, records)
+    interface_items.update(highlight_win(interface_items, board))
+    assert renderer.render(interface_items)
+
+    records['human_win'] += 1
+    board = create_board()
+    assert renderer.render(get_game_items(screen, board, players, records))
+
+    Renderer(full_screen).render(get_game_items(full_screen, board, players, records))
+    assert get_pixels(screen) == get_pixels(full_screen)
+
+
+def test_layout(screen):
+    """
+    Testing that the layout is only worked out once per window size, and follows the window size
+    """
+    players = [Player(bot=True, state=BOT_STATE, mark="O"), Player(bot=False, state=HUMAN_STATE, mark="X")]
+    records = {'turn_num': 0, 'bot_win': 0, 'human_win': 0, 'draw': 0}
+    board = create_board()
+    board[1][1] = HUMAN_STATE
+
+    interface_items = get_game_items(screen, board, players, records)
+    next_items = get_game_items(screen, board, players, records)
+    for key in ('information_board_frame', 'draw_header', 'game_board_lines', 'game_board_rects'):
+        assert next_items[key] is interface_items[key]
+    assert get_board_layout(600, 600, 3, 3) is get_board_layout(600, 600, 3, 3)
+
+    # The mark is drawn in the middle of its box
+    assert next_items['current_moves'][4].get_bounding_rect().center == (300, 345)
+
+    # Larger window, the board follows the window size
+    large_screen = pygame.Surface((900, 900))
+    large_items = get_game_items(large_screen, board, players, records)
+    assert large_items['game_board_lines'] is not interface_items['game_board_lines']
+    assert large_items['game_board_rects'][2][2].is_mouse_hover((840, 840))
+    assert not interface_items['game_board_rects'][2][2].is_mouse_hover((840, 840))
+
+    renderer = Renderer(screen)
+    renderer.render(interface_items)
+    renderer.invalidate(large_screen)
+    assert renderer.render(large_items) == [large_screen.get_rect()]
+
+
+def test_bot_worker():
+    """
+    Testing that the worker runs tasks without blocking, and hands back their result or their exception
+    """
+    worker = BotWorker()
+    assert worker.poll() is None
+
+    worker.submit(time.sleep, 0.3)
+    assert worker.is_busy and worker.poll() is None
+    with pytest.raises(ValueError):
+        worker.submit(time.sleep, 0)
+
+    while worker.is_busy:
+        worker.poll()
+    assert worker.elapsed == 0 and not worker.is_thinking
+
+    worker.submit(int, "not a number")
+    time.sleep(0.1)
+    with pytest.raises(ValueError):
+        worker.poll()
+
+
+def test_bot_move_input_handler():
+    """
+    Testing that the bot's move is played over several frames, each frame returning without waiting for the search
+    """
+    bot = Player(bot=True, state=BOT_STATE, mark="O", engine="minimax")
+    board = create_board()
+    board[1][1] = HUMAN_STATE
+    worker = BotWorker()
+
+    frames = 0
+    while (board == BLANK_STATE).sum() == 8:
+        start = time.perf_counter()
+        bot_move_input_handler(board, bot, worker)
+        assert time.perf_counter() - start < 0.1
+        frames += 1
+
+    assert frames > 1 and not worker.is_busy
+    assert (board == BOT_STATE).sum() == 1
@@ -0,0 +1,123 @@
+"""
+    Contains all the pytest test cases regarding the Monte Carlo tree search
+"""
+
+
+import pytest
+from bot.mcts import MonteCarloTreeSearch
+from bot.stats import SearchStats
+from game.player import Player
+from game.self_play import play_game
+from game.board import HUMAN_STATE, BOT_STATE, BLANK_STATE, create_board
+
+
+def test_finished_board():
+    """
+    Testing that a finished board has no move
+    """
+    board = create_board()
+    board[0] = BOT_STATE
+
+    assert MonteCarloTreeSearch(playouts=10)(board, False) == (0, None)
+
+
+def test_winning_and_blocking_moves():
+    """
+    Testing that the search takes a winning move and blocks the opponent's winning move
+    """
+    board = create_board()
+    board[0][0] = BOT_STATE
+    board[0][1] = BOT_STATE
+    board[1][0] = HUMAN_STATE
+    board[1][1] = HUMAN_STATE
+
+    for is_maximizing_player, score_sign in ((True, 1), (False, -1)):
+        score, moves = MonteCarloTreeSearch(playouts=2000, seed=0)(board, is_maximizing_player)
+        assert moves == [(0, 2)] if is_maximizing_player else moves == [(1, 2)]
+        assert score * score_sign > 0
+
+    board = create_board()
+    board[0][0] = HUMAN_STATE
+    board[1][1] = BOT_STATE
+    board[2][2] = HUMAN_STATE
+    board[0][2] = BOT_STATE
+
+    assert MonteCarloTreeSearch(playouts=2000, seed=0)(board, False)[1] == [(2, 0)]
+
+
+def test_tree_reuse():
+    """
+    Testing that the tree below the new position is kept between searches, and thrown away for other positions
+    """
+    search = MonteCarloTreeSearch(playouts=1000, seed=0)
+    board = create_board()
+    _, moves = search(board, True)
+    assert search.root_visits == 1000
+
+    # Bot's move & human's reply
+    board[moves[0]] = BOT_STATE
+    board[next((row, box) for row in range(3) for box in range(3) if board[row][box] == BLANK_STATE)] = HUMAN_STATE
+    search(board, True)
+    assert search.root_visits > 1000
+    assert search.last_playouts == 1000
+
+    # Different board size
+    search(create_board(3, 4), True)
+    assert search.root_visits == 1000
+
+    # The nodes above the new position are thrown away, so the tree is kept for the whole game
+    search = MonteCarloTreeSearch(playouts=300, max_nodes=2000, seed=0)
+    board = create_board(4, 4)
+    for turn in range(5):
+        _, moves = search(board, True, 4)
+        assert search.nodes <= 2000
+        assert search.root_visits > 300 or turn == 0
+
+        board[moves[0]] = BOT_STATE
+        board[next((row, box) for row in range(4) for box in range(4) if board[row][box] == BLANK_STATE)] = HUMAN_STATE
+
+
+def test_node_limit():
+    """
+    Testing that the tree never grows past its maximum number of nodes
+    """
+    search = MonteCarloTreeSearch(playouts=500, max_nodes=100, seed=0)
+    search(create_board(), True)
+    assert search.nodes <= 100
+
+    with pytest.raises(ValueError):
+        MonteCarloTreeSearch(playouts=10, max_nodes=5)(create_board(), True)
+    with pytest.raises(ValueError):
+        MonteCarloTreeSearch(playouts=0)
+
+
+def test_budgets_and_stats():
+    """
+    Testing the time budget on a large board and the search statistics
+    """
+    stats = SearchStats()
+    search = MonteCarloTreeSearch(time_budget=0.2, seed=0)
+    board = create_board(7, 7)
+    _, moves = search(board, True, 5, stats)
+
+    assert len(moves) == 1 and board[moves[0]] == BLANK_STATE
+    assert search.last_elapsed < 1
+    assert search.playouts_per_second > 0
+    assert stats.evaluations == search.last_playouts
+    assert stats.nodes_per_depth[0] == 1 and stats.nodes_per_depth[1] == 49
+
+
+def test_player_engine():
+    """
+    Testing that a bot using the search never loses against a random bot on the 3 by 3 board
+    """
+    mcts_player = Player(bot=True, state=BOT_STATE, mark="X", engine=MonteCarloTreeSearch(playouts=2000, seed=0))
+    random_player = Player(bot=True, state=HUMAN_STATE, mark="O", engine="random")
+
+    for game in range(6):
+        players = [mcts_player, random_player] if game % 2 == 0 else [random_player, mcts_player]
+        winner, _ = play_game(players)
+        assert winner != "O"
+
+    assert Player(bot=True, state=BOT_STATE, mark="X", engine="mcts", time_budget=0.05).make_move(create_board()) in \
+        [(row, box) for row in range(3) for box in range(3)]
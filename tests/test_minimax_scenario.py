@@ -1,17 +1,20 @@
 """
     Contains all the pytest test cases regarding the minimax algorithm
+    Every possible state of the board is checked against the oracle in test_engines.py
 """
 
 
-from bot.minimax import minimax, minimax_soft_alpha_beta, minimax_alpha_beta, get_depth
-from tests import get_all_possible_board_states
+from bot.minimax import minimax, minimax_soft_alpha_beta, minimax_alpha_beta, principal_variation_search, get_depth, \
+    generate_branches
+from bot.move_ordering import MoveOrderer
+from bot.bitboard import bitboard_minimax
 from math import inf
 from game.board import HUMAN_STATE, BOT_STATE, create_board
 
 
 def test_blank_board():
     """
-    Testing for result consistency between the 3 approaches to minimax algorithm
+    Testing for result consistency between the 5 approaches to minimax algorithm
     Testing algorithm result from evaluating a blank board
     """
     board = create_board()
@@ -19,54 +22,41 @@ def test_blank_board():
     minimax_result = minimax(board, get_depth(board), True)
     minimax_soft_alpha_beta_result = minimax_soft_alpha_beta(board, get_depth(board), True, -inf, +inf)
     minimax_alpha_beta_result = minimax_alpha_beta(board, get_depth(board), True, -inf, +inf)
+    bitboard_minimax_result = bitboard_minimax(board, get_depth(board), True)
+    pvs_result = principal_variation_search(board, get_depth(board), True, -inf, +inf)
+    pvs_ordering_result = principal_variation_search(board, get_depth(board), True, -inf, +inf,
+                                                     ordering=MoveOrderer())
 
     assert minimax_result == minimax_soft_alpha_beta_result
+    assert minimax_result == bitboard_minimax_result
 
     assert minimax_alpha_beta_result[0] == minimax_result[0]
     assert minimax_alpha_beta_result[1][0] in minimax_result[1]
 
+    assert pvs_result[0] == minimax_result[0] and pvs_ordering_result[0] == minimax_result[0]
+    assert pvs_result[1][0] in minimax_result[1] and pvs_ordering_result[1][0] in minimax_result[1]
 
-def test_board_human_1st_turn():
-    """
-    Testing for result consistency between the 3 approaches to minimax algorithm
-    Testing algorithm result from evaluating all possible states of the board where the human starts first
-    """
-
-    for turn_num in range(1, 9):
-        boards = get_all_possible_board_states(turn_num, HUMAN_STATE, BOT_STATE)
-
-        is_maximizing_player = False if turn_num % 2 == 0 else True
-
-        for board in boards:
-            minimax_result = minimax(board, get_depth(board), is_maximizing_player)
-            minimax_soft_alpha_beta_result = minimax_soft_alpha_beta(board, get_depth(board), is_maximizing_player, -inf, +inf)
-            minimax_alpha_beta_result = minimax_alpha_beta(board, get_depth(board), is_maximizing_player, -inf, +inf)
-
-            assert minimax_result == minimax_soft_alpha_beta_result
 
-            assert minimax_alpha_beta_result[0] == minimax_result[0]
-            assert minimax_alpha_beta_result[1][0] in minimax_result[1]
-
-
-def test_board_bot_1st_turn():
+def test_board_restored():
     """
-    Testing for result consistency between the 3 approaches to minimax algorithm
-    Testing algorithm result from evaluating all possible states of the board where the bot starts first
+    Testing that the searches leave the board unchanged, as moves are made & undone on the board itself
     """
-    for turn_num in range(1, 9):
-        boards = get_all_possible_board_states(turn_num, BOT_STATE, HUMAN_STATE)
-
-        is_maximizing_player = True if turn_num % 2 == 0 else False
-
-        for board in boards:
-            minimax_result = minimax(board, get_depth(board), is_maximizing_player)
-            minimax_soft_alpha_beta_result = minimax_soft_alpha_beta(board, get_depth(board), is_maximizing_player, -inf, +inf)
-            minimax_alpha_beta_result = minimax_alpha_beta(board, get_depth(board), is_maximizing_player, -inf, +inf)
-
-            assert minimax_result == minimax_soft_alpha_beta_result
+    board = create_board()
+    board[1][1] = HUMAN_STATE
+    board[0][2] = BOT_STATE
+    expected_board = board.copy()
 
-            assert minimax_alpha_beta_result[0] == minimax_result[0]
-            assert minimax_alpha_beta_result[1][0] in minimax_result[1]
+    minimax(board, get_depth(board), False)
+    minimax_soft_alpha_beta(board, get_depth(board), False, -inf, +inf)
+    minimax_alpha_beta(board, get_depth(board), False, -inf, +inf, ordering=MoveOrderer())
+    principal_variation_search(board, get_depth(board), False, -inf, +inf)
 
+    assert (board == expected_board).all()
 
+    # Closing the generator early undoes the last move
+    branches = generate_branches(board, True)
+    branch, move = next(branches)
+    assert branch[move] == BOT_STATE
 
+    branches.close()
+    assert (board == expected_board).all()
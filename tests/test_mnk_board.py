@@ -0,0 +1,109 @@
+"""
+    Contains all the pytest test cases regarding boards of other sizes and win lengths
+"""
+
+
+from bot.minimax import minimax_soft_alpha_beta, iterative_deepening, get_depth
+from bot.bitboard import bitboard_minimax
+from game.board import HUMAN_STATE, BOT_STATE, create_board, win_check, get_winning_combination_index, get_winner, \
+    get_move_winner, get_possible_moves
+from tests import get_all_possible_board_states
+from math import inf
+import random
+
+
+def test_win_check():
+    """
+    Testing win detection on boards of other sizes and win lengths
+    """
+    board = create_board(7, 7)
+    for offset in range(4):
+        board[1 + offset][5 - offset] = HUMAN_STATE
+
+    assert not win_check(board, 5)
+
+    board[5][1] = HUMAN_STATE
+    assert win_check(board, 5)
+    assert get_winning_combination_index(board, 5) == [(1, 5), (2, 4), (3, 3), (4, 2), (5, 1)]
+
+    # Default win length is the length of the shorter side of the board
+    board = create_board(4, 4)
+    board[2] = BOT_STATE
+    assert win_check(board)
+    assert get_winning_combination_index(board) == [(2, 0), (2, 1), (2, 2), (2, 3)]
+
+
+def test_move_winner():
+    """
+    Testing that checking only the winning combinations through the last move finds the same winner as checking the
+    whole board
+    """
+    random.seed(0)
+
+    for rows, columns, win_length in ((3, 3, 3), (4, 4, 3), (5, 6, 4)):
+        for _ in range(50):
+            board = create_board(rows, columns)
+            winner = None
+
+            # Play random moves until the board is won or full
+            for turn_num, move in enumerate(random.sample(get_possible_moves(board), board.size)):
+                board[move] = HUMAN_STATE if turn_num % 2 == 0 else BOT_STATE
+                winner = get_move_winner(board, move, win_length)
+
+                assert winner == get_winner(board, win_length)
+                if winner is not None:
+                    break
+
+            # A won board stays won
+            assert get_move_winner(board, (0, 0), win_length, winner) == winner
+
+
+def test_bitboard_minimax_4x4():
+    """
+    Testing for result consistency between soft alpha beta pruning and bitboard minimax on a 4 by 4 board
+    """
+    random.seed(0)
+
+    for _ in range(10):
+        board = create_board(4, 4)
+        for turn_num, index in enumerate(random.sample(range(board.size), 9)):
+            board.flat[index] = HUMAN_STATE if turn_num % 2 == 0 else BOT_STATE
+
+        if win_check(board, 3):
+            continue
+
+        assert bitboard_minimax(board, get_depth(board), False, 3) == \
+            minimax_soft_alpha_beta(board, get_depth(board), False, -inf, +inf, None, 3)
+
+
+def test_depth_limited_search():
+    """
+    Testing that the depth limit & node budget keep a search on a large board short, while still finding a forced win
+    """
+    board = create_board(7, 7)
+    for index in range(4):
+        board[3][index] = BOT_STATE
+        board[6][index] = HUMAN_STATE
+
+    score, moves = bitboard_minimax(board, get_depth(board), True, 5, max_depth=2)
+    assert score > 0 and moves == [(3, 4)]
+
+    score, moves = bitboard_minimax(create_board(7, 7), 0, True, 5, max_depth=4, node_budget=1000)
+    assert -1 < score < 1 and moves
+
+
+def test_iterative_deepening():
+    """
+    Testing that iterative deepening solves small boards exactly and stops in time on large boards
+    """
+    for board in get_all_possible_board_states(3, HUMAN_STATE, BOT_STATE):
+        score, moves, info = iterative_deepening(board, get_depth(board), False)
+
+        assert (score, moves) == minimax_soft_alpha_beta(board, get_depth(board), False, -inf, +inf)
+        assert info['completed']
+
+    score, moves, info = iterative_deepening(create_board(7, 7), 0, True, 5, time_limit=0.5)
+
+    assert moves and not info['completed']
+    assert info['depth'] >= 1
+    assert info['elapsed'] < 1.5
@@ -0,0 +1,98 @@
+"""
+    Contains all the pytest test cases regarding the move ordering of the alpha beta searches
+"""
+
+
+from bot.minimax import minimax_soft_alpha_beta, minimax_alpha_beta, principal_variation_search, get_depth
+from bot.move_ordering import MoveOrderer, get_static_priors
+from bot.transposition import TranspositionTable
+from bot.stats import SearchStats
+from tests import get_all_possible_board_states
+from math import inf
+from game.board import HUMAN_STATE, BOT_STATE, create_board
+
+
+def test_static_priors():
+    """
+    Testing that the center is searched first, followed by the corners and then the edges
+    """
+    priors = get_static_priors(3, 3, 3)
+
+    assert priors[(1, 1)] == 4
+    assert all(priors[corner] == 3 for corner in ((0, 0), (0, 2), (2, 0), (2, 2)))
+    assert all(priors[edge] == 2 for edge in ((0, 1), (1, 0), (1, 2), (2, 1)))
+
+    ordering = MoveOrderer(use_killers=False, use_history=False)
+    moves = ordering.order(sorted(priors), 0)
+
+    assert moves[0] == (1, 1)
+    assert moves[-1] == (2, 1)
+    assert ordering.order(moves, 0, first_move=(0, 1))[0] == (0, 1)
+
+
+def test_killers_and_history():
+    """
+    Testing that moves causing cutoffs are remembered as killer moves and in the history table
+    """
+    ordering = MoveOrderer(killer_slots=2)
+
+    for move in ((0, 1), (1, 0), (2, 1)):
+        ordering.record_cutoff(move, 3)
+
+    assert ordering.killers[3] == [(2, 1), (1, 0)]
+    assert ordering.history[(0, 1)] == (9 - 3) ** 2
+    assert ordering.order([(1, 1), (1, 0), (2, 1)], 3)[:2] == [(2, 1), (1, 0)]
+
+    ordering.clear()
+    assert not ordering.killers and not ordering.history
+
+
+def test_ordering_node_count():
+    """
+    Testing that move ordering visits fewer nodes on the empty board, for every alpha beta search
+    """
+    def count_nodes(search, ordering):
+        stats = SearchStats()
+        search(create_board(), 0, True, -inf, +inf, None, None, ordering, stats)
+        return stats.nodes
+
+    for search in (minimax_soft_alpha_beta, minimax_alpha_beta, principal_variation_search):
+        assert count_nodes(search, MoveOrderer()) < count_nodes(search, None)
+
+
+def test_ordering_consistency():
+    """
+    Testing for result consistency of the alpha beta searches with and without move ordering
+    The same orderers are reused for all the board states, so the history table carries over between searches
+    """
+    soft_ordering = MoveOrderer()
+    ordering = MoveOrderer()
+    table = TranspositionTable(max_entries=2000)
+    pvs_ordering = MoveOrderer()
+    pvs_table = TranspositionTable(max_entries=2000)
+
+    for primary_state, secondary_state in ((HUMAN_STATE, BOT_STATE), (BOT_STATE, HUMAN_STATE)):
+        for turn_num in range(2, 9):
+            boards = get_all_possible_board_states(turn_num, primary_state, secondary_state)
+
+            is_maximizing_player = (turn_num % 2 == 0) == (primary_state == BOT_STATE)
+
+            for board in boards:
+                expected_result = minimax_soft_alpha_beta(board, get_depth(board), is_maximizing_player, -inf, +inf)
+                minimax_soft_alpha_beta_result = minimax_soft_alpha_beta(board, get_depth(board), is_maximizing_player,
+                                                                         -inf, +inf, ordering=soft_ordering)
+                minimax_alpha_beta_result = minimax_alpha_beta(board, get_depth(board), is_maximizing_player,
+                                                               -inf, +inf, table, ordering=ordering)
+                pvs_result = principal_variation_search(board, get_depth(board), is_maximizing_player, -inf, +inf,
+                                                        pvs_table, ordering=pvs_ordering)
+
+                assert minimax_soft_alpha_beta_result == expected_result
+
+                assert minimax_alpha_beta_result[0] == expected_result[0]
+                assert minimax_alpha_beta_result[1][0] in expected_result[1]
+
+                assert pvs_result[0] == expected_result[0]
+                assert pvs_result[1][0] in expected_result[1]
+
+    assert ordering.history and soft_ordering.history and pvs_ordering.history
+    assert pvs_table.hits > 0
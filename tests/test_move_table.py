@@ -0,0 +1,36 @@
+"""
+    Contains all the pytest test cases regarding the precomputed move table
+"""
+
+
+import numpy as np
+from bot.minimax import minimax, get_depth
+from bot.bitboard import bitboard_minimax
+from bot.move_table import generate_move_table, load_move_table, lookup_move_table, get_move_table
+from tests import get_all_possible_board_states
+from game.board import HUMAN_STATE, BOT_STATE, create_board
+
+
+def test_move_table(tmp_path):
+    """
+    Testing that a freshly generated move table is the same as the cached move table used as the oracle of the engine
+    tests, and that it agrees with the minimax algorithm
+    Every possible state of the board is checked against the cached move table in test_engines.py
+    """
+    path = str(tmp_path / "move_table.bin")
+    generate_move_table(path)
+    table = load_move_table(path)
+
+    assert np.array_equal(table, get_move_table())
+
+    # Blank board, evaluating with bitboard minimax as pure minimax takes too long from the first turn
+    board = create_board()
+    assert lookup_move_table(board, True, table) == bitboard_minimax(board, get_depth(board), True)
+    assert lookup_move_table(board, False, table) == bitboard_minimax(board, get_depth(board), False)
+
+    for primary_state, secondary_state in ((HUMAN_STATE, BOT_STATE), (BOT_STATE, HUMAN_STATE)):
+        is_maximizing_player = primary_state == BOT_STATE
+
+        for board in get_all_possible_board_states(6, primary_state, secondary_state):
+            assert lookup_move_table(board, is_maximizing_player, table) == \
+                minimax(board, get_depth(board), is_maximizing_player)
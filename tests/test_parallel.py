@@ -0,0 +1,45 @@
+"""
+    Contains all the pytest test cases regarding the parallel search
+"""
+
+
+import pytest
+from bot.parallel import parallel_search
+from bot.bitboard import bitboard_minimax
+from bot.minimax import get_depth
+from tests import get_all_possible_board_states
+from game.board import HUMAN_STATE, BOT_STATE, create_board
+
+
+def test_parallel_search():
+    """
+    Testing for result consistency between the parallel search and the bitboard minimax
+    """
+    board = create_board()
+    assert parallel_search(board, get_depth(board), True, workers=2) == bitboard_minimax(board, get_depth(board), True)
+
+    for turn_num in range(1, 9):
+        for board in get_all_possible_board_states(turn_num, BOT_STATE, HUMAN_STATE)[::25]:
+            is_maximizing_player = turn_num % 2 == 0
+            expected_result = bitboard_minimax(board, get_depth(board), is_maximizing_player)
+
+            for split_depth in (1, 2):
+                assert parallel_search(board, get_depth(board), is_maximizing_player, workers=1,
+                                       split_depth=split_depth) == expected_result
+
+
+def test_parallel_search_mnk():
+    """
+    Testing the parallel search on a 4 by 4 board with & without a depth limit
+    """
+    board = create_board(4, 4)
+    board[0][0] = HUMAN_STATE
+    board[1][1] = BOT_STATE
+
+    assert parallel_search(board, get_depth(board), False, 3, workers=2, split_depth=2) == \
+        bitboard_minimax(board, get_depth(board), False, 3)
+    assert parallel_search(board, get_depth(board), False, 3, workers=2, max_depth=3) == \
+        bitboard_minimax(board, get_depth(board), False, 3, max_depth=3)
+
+    with pytest.raises(ValueError):
+        parallel_search(board, get_depth(board), False, 3, split_depth=0)
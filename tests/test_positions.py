@@ -0,0 +1,78 @@
+"""
+    Contains all the pytest test cases regarding the streaming enumeration of positions
+"""
+
+
+import pytest
+from bot.bitboard import encode_board
+from game.positions import iter_position_bits, iter_positions, iter_position_ranks
+from game.board import HUMAN_STATE, BOT_STATE, COMPACT_DTYPE, get_board_rank, get_turn_number, win_check, \
+    is_board_full
+from game.symmetry import get_canonical_rank
+from tests import get_all_possible_board_states
+
+
+def test_position_counts():
+    """
+    Testing the known number of unfinished positions of the 3 by 3 board, with & without symmetric duplicates
+    """
+    for first_state in (HUMAN_STATE, BOT_STATE):
+        assert sum(1 for turn_num in range(10) for _ in iter_position_bits(turn_num, first_state)) == 4520
+        assert sum(1 for turn_num in range(10) for _ in iter_position_bits(turn_num, first_state, unique=True)) == 627
+
+    assert sum(1 for _ in iter_position_bits(9, HUMAN_STATE)) == 0
+    assert sum(1 for _ in iter_position_bits(9, HUMAN_STATE, include_draws=True)) == 16
+
+
+def test_positions_are_unfinished():
+    """
+    Testing that every position has the right number of marks of each player and no winner
+    """
+    for turn_num in range(9):
+        for board in iter_positions(turn_num, BOT_STATE, rows=3, columns=4, win_length=3):
+            assert get_turn_number(board) == turn_num
+            assert (board == BOT_STATE).sum() == (turn_num + 1) // 2
+            assert not win_check(board, 3) and not is_board_full(board)
+
+
+def test_position_encodings():
+    """
+    Testing that the boards, bitboards and ranks describe the same positions, and that the board is reused
+    """
+    for turn_num in range(10):
+        boards = list(iter_positions(turn_num, HUMAN_STATE, include_draws=True, compact=True))
+        bits = list(iter_position_bits(turn_num, HUMAN_STATE, include_draws=True))
+        ranks = list(iter_position_ranks(turn_num, HUMAN_STATE, include_draws=True))
+
+        # The same board is yielded every time
+        assert all(board is boards[0] for board in boards)
+        assert boards[0].dtype == COMPACT_DTYPE
+
+        expected_boards = get_all_possible_board_states(turn_num, HUMAN_STATE, BOT_STATE)
+        assert [encode_board(board) for board in expected_boards] == bits
+        assert [get_board_rank(board) for board in expected_boards] == ranks
+
+
+def test_unique_positions():
+    """
+    Testing that no two unique positions are symmetric
+    """
+    for turn_num in range(9):
+        boards = [board.copy() for board in iter_positions(turn_num, BOT_STATE, unique=True)]
+        ranks = {get_canonical_rank(board)[0] for board in boards}
+
+        assert len(ranks) == len(boards)
+        assert ranks == {get_canonical_rank(board)[0] for board in iter_positions(turn_num, BOT_STATE)}
+
+
+def test_invalid_positions():
+    """
+    Testing the validation of the turn number and the first state
+    """
+    with pytest.raises(ValueError):
+        next(iter_position_bits(10, HUMAN_STATE))
+    with pytest.raises(ValueError):
+        next(iter_position_bits(1, 0))
+
+    assert [board.tolist() for board in get_all_possible_board_states(0, HUMAN_STATE, BOT_STATE)] == \
+        [[[0, 0, 0], [0, 0, 0], [0, 0, 0]]]
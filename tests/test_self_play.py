@@ -0,0 +1,50 @@
+"""
+    Contains all the pytest test cases regarding the self play simulator
+"""
+
+
+import pytest
+from game.self_play import simulate, DRAW
+from game.player import Player
+from game.board import HUMAN_STATE, BOT_STATE, create_board
+
+
+def test_bot_playing_human_state():
+    """
+    Testing that a bot playing the human's state blocks the bot's winning move
+    """
+    board = create_board()
+    board[0][0] = BOT_STATE
+    board[0][1] = BOT_STATE
+    board[1][1] = HUMAN_STATE
+
+    for engine in (None, "bitboard", "principal_variation_search"):
+        assert Player(bot=True, state=HUMAN_STATE, mark="O", engine=engine).make_move(board) == (0, 2)
+
+
+def test_simulate():
+    """
+    Testing that perfect play never loses against random play and always draws against itself
+    """
+    report = simulate(400, ("default", "random"), workers=1, chunk_size=150, seed=0)
+
+    assert report['games'] == 400
+    assert sum(report['by_starting_player'].values()) == 400
+    assert sum(report['by_opening'].values()) == 400
+    assert report['by_starting_player']["X", "X"] + report['by_starting_player']["X", DRAW] == 200
+    assert not report['by_starting_player']["O", "O"] and not report['by_starting_player']["X", "O"]
+
+    report = simulate(20, ("move_table", "default"), workers=2, chunk_size=5, seed=0)
+    assert report['by_starting_player']["X", DRAW] == report['by_starting_player']["O", DRAW] == 10
+
+    with pytest.raises(ValueError):
+        simulate(10, ("default", "unknown"))
+
+    # Engines searching the whole tree cannot stay within a time budget
+    with pytest.raises(ValueError):
+        simulate(10, ("alpha_beta", "random"), time_budget=0.1)
+    with pytest.raises(ValueError):
+        Player(bot=True, state=BOT_STATE, mark="O", max_depth=2, engine="mcts", time_budget=0.1)
+
+    report = simulate(2, ("default", "mcts"), workers=1, win_length=3, time_budget=0.05, seed=0)
+    assert report['games'] == 2
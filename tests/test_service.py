@@ -0,0 +1,137 @@
+"""
+    Contains all the pytest test cases regarding the bot move server
+"""
+
+
+import json
+import asyncio
+import numpy as np
+from service.server import BotMoveServer
+from service.load_generator import run_load, generate_boards
+from bot.move_table import lookup_move_table
+from game.board import win_check
+
+
+def test_generate_boards():
+    """
+    Testing that the generated boards are unfinished and on the bot's turn
+    """
+    for boxes in generate_boards(200, seed=0):
+        board = np.array(boxes)
+        assert not win_check(board)
+        assert lookup_move_table(board, True) is not None
+
+
+def test_server(tmp_path):
+    """
+    Testing the responses of the server and running a small load against it
+    """
+    async def run():
+        server = BotMoveServer(workers=1, max_pending=4)
+        await server.start(path=str(tmp_path / "bot.sock"))
+
+        try:
+            reader, writer = await asyncio.open_unix_connection(str(tmp_path / "bot.sock"))
+
+            requests = [
+                {"id": 1, "board": [[1, 0, 0], [0, 0, 0], [0, 0, 0]]},
+                {"id": 2, "board": [[1, 1, 1], [2, 2, 0], [0, 0, 0]]},
+                {"id": 3, "board": [[1, 3], [0, 0]]},
+                {"id": 4, "board": [[2, 2, 0], [0, 0, 0], [0, 0, 0]]},
+                {"id": 5, "board": [[1, 1, 0], [0, 0, 0], [0, 0, 0]]},
+                "not a board"
+            ]
+            for request in requests:
+                writer.write(json.dumps(request).encode() + b"\n")
+            writer.write(b"{invalid json\n")
+            await writer.drain()
+
+            responses = [json.loads(await reader.readline()) for _ in range(7)]
+            writer.close()
+            await writer.wait_closed()
+
+            report = await run_load(path=str(tmp_path / "bot.sock"), connections=4, requests=10,
+                                    boards=generate_boards(20, seed=0))
+        finally:
+            await server.close()
+
+        return responses, report, server
+
+    responses, report, server = asyncio.run(run())
+    responses_by_id = {response["id"]: response for response in responses}
+
+    # Human took the corner, the only move that does not lose is the center
+    assert responses_by_id[1] == {"id": 1, "move": [1, 1]}
+    assert responses_by_id[2]["error"] == "Board is already finished"
+    assert "error" in responses_by_id[3]
+    # Not the bot's turn
+    assert responses_by_id[4]["error"].startswith("Board is not on the bot's turn")
+    assert responses_by_id[5]["error"].startswith("Board is not on the bot's turn")
+    assert sum("error" in response for response in responses) == 6
+
+    assert report['answered'] == 40 and report['errors'] == 0
+    assert report['requests_per_second'] > 0
+    assert report['p50_ms'] <= report['p99_ms']
+    assert server.requests == 47 and server.errors == 6
+
+
+def test_internal_error(tmp_path):
+    """
+    Testing that a request still gets a reply when its search fails, such as when the process pool is broken
+    """
+    async def run():
+        server = BotMoveServer(workers=1, max_pending=4)
+        await server.start(path=str(tmp_path / "bot.sock"))
+
+        try:
+            # The pool no longer takes searches
+            server._executor.shutdown()
+
+            reader, writer = await asyncio.open_unix_connection(str(tmp_path / "bot.sock"))
+            for request_id in (1, 2):
+                writer.write(json.dumps({"id": request_id, "board": [[1, 0, 0], [0, 0, 0], [0, 0, 0]]}).encode() +
+                             b"\n")
+            await writer.drain()
+
+            responses = [json.loads(await asyncio.wait_for(reader.readline(), 10)) for _ in range(2)]
+            writer.close()
+            await writer.wait_closed()
+        finally:
+            await server.close()
+
+        return responses, server
+
+    responses, server = asyncio.run(run())
+
+    assert sorted(responses, key=lambda response: response["id"]) == [{"id": 1, "error": "Internal error"},
+                                                                      {"id": 2, "error": "Internal error"}]
+    assert server.errors == 2
+
+
+def test_load_is_repeatable(tmp_path):
+    """
+    Testing that a seeded load sends the same boards on every run
+    """
+    async def run(seed):
+        sent_boards = []
+
+        async def handle_connection(reader, writer):
+            # Answers every request without searching, recording the boards
+            while line := await reader.readline():
+                request = json.loads(line)
+                sent_boards.append(json.dumps(request["board"]))
+                writer.write(json.dumps({"id": request["id"], "move": [0, 0]}).encode() + b"\n")
+                await writer.drain()
+            writer.close()
+
+        server = await asyncio.start_unix_server(handle_connection, str(tmp_path / "load.sock"))
+        try:
+            await run_load(path=str(tmp_path / "load.sock"), connections=3, requests=20, seed=seed)
+        finally:
+            server.close()
+            await server.wait_closed()
+
+        return sorted(sent_boards)
+
+    assert asyncio.run(run(1)) == asyncio.run(run(1))
+    assert asyncio.run(run(1)) != asyncio.run(run(2))
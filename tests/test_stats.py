@@ -0,0 +1,90 @@
+"""
+    Contains all the pytest test cases regarding the search statistics collector
+"""
+
+
+from math import inf
+from bot.minimax import minimax, minimax_alpha_beta, iterative_deepening, get_depth
+from bot.engines import ENGINES
+from bot.stats import SearchStats
+from bot.transposition import TranspositionTable
+from game.player import Player
+from game.board import HUMAN_STATE, BOT_STATE, create_board
+
+
+def test_minimax_stats():
+    """
+    Testing that pure minimax visits the whole game tree of the empty board without any cutoffs
+    """
+    stats = SearchStats()
+    minimax(create_board(), 0, True, stats=stats)
+
+    assert stats.nodes == 549946
+    assert stats.evaluations == 255168
+    assert [stats.nodes_per_depth[depth] for depth in range(3)] == [1, 9, 72]
+    assert not stats.cutoffs and not stats.table_probes
+
+
+def test_engine_stats():
+    """
+    Testing that collecting statistics does not change the result of any engine
+    """
+    board = create_board()
+    board[1][1] = HUMAN_STATE
+    board[0][0] = BOT_STATE
+
+    for name, engine in ENGINES.items():
+        stats = SearchStats()
+        assert engine(board, False, stats=stats) == engine(board, False)
+
+        if name != "move_table":
+            assert stats.nodes_per_depth[get_depth(board)] == 1
+            assert stats.evaluations > 0
+
+        if name not in ("minimax", "move_table"):
+            assert stats.cutoffs == sum(stats.cutoff_move_indexes.values()) > 0
+
+
+def test_table_stats():
+    """
+    Testing that the table lookups are counted when a transposition table is used
+    """
+    stats = SearchStats()
+    table = TranspositionTable()
+    minimax_alpha_beta(create_board(), 0, True, -inf, +inf, table, stats=stats)
+
+    assert stats.table_probes == table.hits + table.misses
+    assert stats.table_hits == table.hits > 0
+
+
+def test_merge_and_round_trip():
+    """
+    Testing that collectors can be merged and rebuilt from their dictionary
+    """
+    board = create_board()
+    stats = SearchStats()
+    iterative_deepening(board, 0, True, stats=stats)
+
+    merged = SearchStats()
+    merged.merge(stats)
+    merged.merge(stats)
+
+    assert merged.nodes == 2 * stats.nodes
+    assert merged.cutoff_move_indexes[0] == 2 * stats.cutoff_move_indexes[0]
+    assert SearchStats.from_dict(stats.to_dict()).to_dict() == stats.to_dict()
+    assert SearchStats().to_dict()['nodes_per_depth'] == []
+
+
+def test_player_stats(capsys):
+    """
+    Testing that a bot player fills the given collector and prints the statistics when asked to
+    """
+    board = create_board()
+    board[0][0] = HUMAN_STATE
+
+    stats = SearchStats()
+    Player(bot=True, state=BOT_STATE, mark="O", engine="alpha_beta").make_move(board, stats)
+    assert stats.nodes > 0
+
+    Player(bot=True, state=BOT_STATE, mark="O", engine="bitboard", print_stats=True).make_move(board)
+    assert "Nodes per depth" in capsys.readouterr().out
@@ -0,0 +1,65 @@
+"""
+    Contains all the pytest test cases regarding the symmetries of the board
+"""
+
+
+from game.symmetry import get_permutations, transform_board, transform_move, inverse_transform_move, \
+    get_canonical_rank, canonicalize, canonicalize_bits
+from game.board import HUMAN_STATE, BOT_STATE, get_board_rank
+from bot.bitboard import encode_board
+from bot.minimax import minimax_soft_alpha_beta, get_depth
+from tests import get_all_possible_board_states
+from math import inf
+
+
+def test_symmetric_boards():
+    """
+    Testing that all symmetric boards share the same canonical board and that moves map back to the original board
+    """
+    for board in get_all_possible_board_states(4, HUMAN_STATE, BOT_STATE):
+        canonical_board, transform = canonicalize(board)
+
+        assert get_board_rank(canonical_board) == get_canonical_rank(board)[0]
+        assert canonicalize_bits(*encode_board(board))[:3] == (*encode_board(canonical_board),
+                                                               get_board_rank(canonical_board))
+
+        for symmetry in range(len(get_permutations(*board.shape))):
+            symmetric_board = transform_board(board, symmetry)
+
+            assert get_canonical_rank(symmetric_board)[0] == get_canonical_rank(board)[0]
+
+            for move in ((0, 0), (0, 1), (1, 1), (2, 1)):
+                assert symmetric_board[transform_move(move, symmetry, board.shape)] == board[move]
+                assert inverse_transform_move(transform_move(move, symmetry, board.shape), symmetry,
+                                              board.shape) == move
+
+
+def test_canonical_best_moves():
+    """
+    Testing that the best moves of the canonical board map back to the best moves of the original board
+    """
+    for board in get_all_possible_board_states(3, HUMAN_STATE, BOT_STATE):
+        canonical_board, transform = canonicalize(board)
+
+        score, moves = minimax_soft_alpha_beta(board, get_depth(board), False, -inf, +inf)
+        canonical_score, canonical_moves = minimax_soft_alpha_beta(canonical_board, get_depth(board), False,
+                                                                   -inf, +inf)
+
+        assert canonical_score == score
+        assert sorted(inverse_transform_move(move, transform, board.shape) for move in canonical_moves) == moves
+
+
+def test_unique_board_states():
+    """
+    Testing that symmetric duplicates are removed from the board states
+    """
+    # Known number of boards after 1 & 2 moves, without symmetric duplicates
+    assert len(get_all_possible_board_states(1, HUMAN_STATE, BOT_STATE, unique=True)) == 3
+    assert len(get_all_possible_board_states(2, HUMAN_STATE, BOT_STATE, unique=True)) == 12
+
+    for turn_num in range(1, 9):
+        boards = get_all_possible_board_states(turn_num, HUMAN_STATE, BOT_STATE)
+        unique_boards = get_all_possible_board_states(turn_num, HUMAN_STATE, BOT_STATE, unique=True)
+
+        assert len(unique_boards) <= len(boards)
+        assert len({get_canonical_rank(board)[0] for board in boards}) == len(unique_boards)
@@ -0,0 +1,74 @@
+"""
+    Contains all the pytest test cases regarding the transposition table
+"""
+
+
+from bot.minimax import minimax_soft_alpha_beta, minimax_alpha_beta, get_depth
+from bot.transposition import TranspositionTable, EXACT
+from tests import get_all_possible_board_states
+from math import inf
+from game.board import HUMAN_STATE, BOT_STATE, create_board
+
+
+def test_table_eviction():
+    """
+    Testing that the table never grows past its maximum number of entries and counts the evictions
+    """
+    table = TranspositionTable(max_entries=50)
+    board = create_board()
+
+    minimax_soft_alpha_beta(board, get_depth(board), True, -inf, +inf, table)
+
+    assert len(table) == 50
+    assert table.evictions > 0
+    assert table.misses > 0
+
+
+def test_table_board_shapes():
+    """
+    Testing that boards of different shapes with the same number of boxes do not share entries
+    """
+    for symmetry in (False, True):
+        table = TranspositionTable(symmetry=symmetry)
+        board = create_board(3, 4)
+        board[0][0] = BOT_STATE
+        table.store(board, 1, False, 0, EXACT, [(2, 3)])
+
+        assert table.probe(board, 1, False) is not None
+        assert table.probe(board.reshape(4, 3), 1, False) is None
+        assert table.probe(board.reshape(2, 6), 1, False) is None
+
+
+def test_table_consistency():
+    """
+    Testing for result consistency of the alpha beta searches with and without a transposition table
+    The same tables are reused for all the board states, like a bot playing several games in a row
+    """
+    soft_table = TranspositionTable(max_entries=2000)
+    symmetry_table = TranspositionTable(max_entries=2000, symmetry=True)
+    table = TranspositionTable(max_entries=2000)
+
+    for primary_state, secondary_state in ((HUMAN_STATE, BOT_STATE), (BOT_STATE, HUMAN_STATE)):
+        for turn_num in range(2, 9):
+            boards = get_all_possible_board_states(turn_num, primary_state, secondary_state)
+
+            is_maximizing_player = (turn_num % 2 == 0) == (primary_state == BOT_STATE)
+
+            for board in boards:
+                expected_result = minimax_soft_alpha_beta(board, get_depth(board), is_maximizing_player, -inf, +inf)
+                minimax_soft_alpha_beta_result = minimax_soft_alpha_beta(board, get_depth(board), is_maximizing_player,
+                                                                         -inf, +inf, soft_table)
+                minimax_symmetry_result = minimax_soft_alpha_beta(board, get_depth(board), is_maximizing_player,
+                                                                  -inf, +inf, symmetry_table)
+                minimax_alpha_beta_result = minimax_alpha_beta(board, get_depth(board), is_maximizing_player,
+                                                               -inf, +inf, table)
+
+                assert minimax_soft_alpha_beta_result == expected_result
+                assert minimax_symmetry_result == expected_result
+
+                assert minimax_alpha_beta_result[0] == expected_result[0]
+                assert minimax_alpha_beta_result[1][0] in expected_result[1]
+
+    assert soft_table.hits > 0 and table.hits > 0
+    assert symmetry_table.misses < soft_table.misses
+    assert soft_table.evictions > 0 and table.evictions > 0